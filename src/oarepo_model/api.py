@@ -35,6 +35,8 @@ from .errors import ApplyCustomizationError
 from .model import InvenioModel
 from .register import register_model, unregister_model
 from .sorter import sort_presets
+from .stats import get_model_stats
+from .validation import validate_many
 
 
 class FunctionalPreset:
@@ -310,6 +312,8 @@ def _internal_model(  # noqa: PLR0913 too many arguments
     ret.register = partial(register_model, model=model, namespace=ret)
     ret.unregister = partial(unregister_model, model=model)
     ret.get_resources = partial(get_model_resources, model=model, namespace=ret)
+    ret.validate_many = partial(validate_many, namespace=ret)
+    ret.get_stats = partial(get_model_stats, type_registry=builder.type_registry, model=model, namespace=ret)
 
     FunctionalPreset.call(
         functional_presets,
@@ -0,0 +1,233 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Benchmark of the generated schemas and dumper on real records.
+
+Each record is processed by the same steps as when it is created and shown:
+
+- ``load``: loaded through the generated ``RecordSchema``,
+- ``jsonschema``: the loaded data are validated against the record JSON schema,
+- ``dump``: a ``Record`` is created from the loaded data and dumped by the model's
+  search dumper (including dumper extensions, relations are dereferenced),
+- ``ui``: the loaded data are serialized by the generated ``RecordUISchema``.
+
+The report contains the throughput, per-record latency percentiles, per-step times
+and optionally the marshmallow fields that took the most time. Field times are
+measured by wrapping ``deserialize``/``serialize`` of every field of the schema
+instances used by the benchmark (compiled schemas fall back to marshmallow then),
+the time of a field does not include the time of its nested fields. The wrapping
+adds overhead, so latencies measured with field timings are higher.
+
+Usage:
+
+```python
+report = ModelBenchmark(my_model, top_fields=10).run(records)
+print(report.format())
+```
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+import marshmallow
+from jsonschema.validators import validator_for
+
+from .validation import get_record_json_schema
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from types import SimpleNamespace
+
+BENCH_STEPS = ("load", "jsonschema", "dump", "ui")
+
+MAX_NESTING = 32
+"""Nested schemas deeper than this are not instrumented (recursive schemas)."""
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of values using the nearest-rank method."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class FieldTimer:
+    """Collects the time spent in marshmallow fields, excluding their nested fields."""
+
+    def __init__(self) -> None:
+        """Create an empty timer."""
+        self.times: dict[str, float] = defaultdict(float)
+        self.calls: dict[str, int] = defaultdict(int)
+        # time spent in nested fields of the fields being processed
+        self._stack: list[float] = []
+
+    def instrument(self, schema: marshmallow.Schema, prefix: str = "", depth: int = 0) -> None:
+        """Wrap all fields of a schema instance and its nested schemas."""
+        if depth > MAX_NESTING:
+            return
+        if hasattr(schema, "_compiled"):
+            # compiled schemas would not call the wrapped fields
+            schema._compiled = lambda: None  # type: ignore[method-assign]  # noqa: SLF001
+        for name, field in schema.fields.items():
+            self._instrument_field(field, f"{prefix}{name}", depth)
+
+    def _instrument_field(self, field: marshmallow.fields.Field, path: str, depth: int) -> None:
+        field.deserialize = self._wrap(field.deserialize, path)  # type: ignore[method-assign]
+        field.serialize = self._wrap(field.serialize, path)  # type: ignore[method-assign]
+        if isinstance(field, marshmallow.fields.Nested):
+            self.instrument(field.schema, f"{path}.", depth + 1)
+        elif isinstance(field, marshmallow.fields.List):
+            self._instrument_field(field.inner, path, depth + 1)
+        elif isinstance(field, marshmallow.fields.Dict) and field.value_field is not None:
+            self._instrument_field(field.value_field, f"{path}.*", depth + 1)
+
+    def _wrap(self, func: Callable[..., Any], path: str) -> Callable[..., Any]:
+        stack = self._stack
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                nested = stack.pop()
+                self.times[path] += elapsed - nested
+                self.calls[path] += 1
+                if stack:
+                    stack[-1] += elapsed
+
+        return timed
+
+    def top(self, count: int) -> list[tuple[str, float, int]]:
+        """Return (path, total time, number of calls) of the slowest fields."""
+        return sorted(
+            ((path, seconds, self.calls[path]) for path, seconds in self.times.items()),
+            key=lambda x: x[1],
+            reverse=True,
+        )[:count]
+
+
+@dataclasses.dataclass
+class BenchReport:
+    """Result of a benchmark run."""
+
+    records: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    latencies: list[float] = dataclasses.field(default_factory=list)
+    """Total time of each successfully processed record."""
+    steps: dict[str, float] = dataclasses.field(default_factory=lambda: dict.fromkeys(BENCH_STEPS, 0.0))
+    """Total time spent in each step."""
+    errors: list[tuple[int, str, str]] = dataclasses.field(default_factory=list)
+    """(record number, step, message) of the first errors."""
+    top_fields: list[tuple[str, float, int]] = dataclasses.field(default_factory=list)
+
+    @property
+    def records_per_second(self) -> float:
+        """Return the throughput."""
+        return self.records / self.elapsed if self.elapsed > 0 else 0.0
+
+    def format(self) -> str:
+        """Return a human readable report."""
+        lines = [
+            f"records: {self.records} ({self.failed} failed)",
+            f"throughput: {self.records_per_second:.1f} records/s",
+            f"latency p50: {percentile(self.latencies, 50) * 1000:.3f} ms, "
+            f"p99: {percentile(self.latencies, 99) * 1000:.3f} ms",
+            "steps:",
+        ]
+        lines.extend(f"  {step:12} {seconds * 1000:10.1f} ms" for step, seconds in self.steps.items())
+        if self.top_fields:
+            lines.append("top fields:")
+            lines.extend(
+                f"  {path:40} {seconds * 1000:10.1f} ms {calls:8} calls" for path, seconds, calls in self.top_fields
+            )
+        if self.errors:
+            lines.append("errors:")
+            lines.extend(f"  record {number}, {step}: {message}" for number, step, message in self.errors)
+        return "\n".join(lines)
+
+
+class ModelBenchmark:
+    """Benchmark of loading, validating and dumping records of a model.
+
+    :param namespace: the built model.
+    :param top_fields: number of slowest fields in the report, 0 disables field timings.
+    :param max_errors: number of errors kept in the report.
+    """
+
+    def __init__(self, namespace: SimpleNamespace, *, top_fields: int = 0, max_errors: int = 10):
+        """Create the schemas and the validator used by the benchmark."""
+        self.namespace = namespace
+        self.top_fields = top_fields
+        self.max_errors = max_errors
+        self.record_schema = namespace.RecordSchema()
+        self.ui_schema = namespace.RecordUISchema()
+        json_schema = get_record_json_schema(namespace)
+        self.json_validator = validator_for(json_schema)(json_schema) if json_schema else None
+        self.field_timer: FieldTimer | None = None
+        if top_fields:
+            self.field_timer = FieldTimer()
+            self.field_timer.instrument(self.record_schema)
+            self.field_timer.instrument(self.ui_schema, "ui:")
+
+    def run(self, records: Iterable[dict[str, Any]]) -> BenchReport:
+        """Process all records and return the report."""
+        report = BenchReport()
+        start = time.perf_counter()
+        for number, record in enumerate(records, start=1):
+            self.bench_record(number, record, report)
+        report.elapsed = time.perf_counter() - start
+        if self.field_timer is not None:
+            report.top_fields = self.field_timer.top(self.top_fields)
+        return report
+
+    def bench_record(self, number: int, data: dict[str, Any], report: BenchReport) -> None:
+        """Process a single record and add its timings to the report."""
+        report.records += 1
+        step = "load"
+        times: dict[str, float] = {}
+        try:
+            start = time.perf_counter()
+            loaded = self.record_schema.load(data)
+            times["load"] = time.perf_counter() - start
+
+            step = "jsonschema"
+            start = time.perf_counter()
+            if self.json_validator is not None:
+                error = next(self.json_validator.iter_errors(loaded), None)
+                if error is not None:
+                    raise ValueError(f"{'.'.join(str(x) for x in error.absolute_path)}: {error.message}")
+            times["jsonschema"] = time.perf_counter() - start
+
+            step = "dump"
+            start = time.perf_counter()
+            self.namespace.Record(loaded).dumps()
+            times["dump"] = time.perf_counter() - start
+
+            step = "ui"
+            start = time.perf_counter()
+            self.ui_schema.dump(loaded)
+            times["ui"] = time.perf_counter() - start
+        except Exception as e:  # noqa: BLE001 any failure of a record is reported, not raised
+            report.failed += 1
+            if len(report.errors) < self.max_errors:
+                report.errors.append((number, step, str(e)))
+            return
+
+        for step_name, seconds in times.items():
+            report.steps[step_name] += seconds
+        report.latencies.append(sum(times.values()))
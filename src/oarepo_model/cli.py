@@ -11,7 +11,7 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any, cast, override
+from typing import TYPE_CHECKING, Any, TextIO, override
 
 import click
 from click import Context, Parameter
@@ -21,6 +21,8 @@ from marshmallow import Schema, missing
 from marshmallow.fields import Field, List, Nested
 from oarepo_runtime import current_runtime
 
+from .validation import DEFAULT_CHUNK_SIZE, get_record_json_schema_file
+
 if TYPE_CHECKING:
     from types import SimpleNamespace
 
@@ -74,6 +76,165 @@ def list_models() -> None:
             click.echo(f"{model.name!s:20} - {get_api_url(model)} - {model.description}")
 
 
+@model.command()
+@click.argument("model", type=MODEL_TYPE)
+@click.option("--batch-size", default=500, show_default=True, help="Number of records in one bulk request.")
+@click.option("--concurrency", default=2, show_default=True, help="Number of bulk requests sent in parallel.")
+@click.option(
+    "--workers",
+    default=0,
+    show_default=True,
+    help="Number of processes dumping the records, 0 dumps in-process.",
+)
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False),
+    help="File with the reindex progress, an interrupted reindex continues from it.",
+)
+@click.option("--drafts", is_flag=True, help="Reindex drafts as well.")
+@with_appcontext
+def reindex(
+    model: SimpleNamespace,
+    batch_size: int,
+    concurrency: int,
+    workers: int,
+    checkpoint: str | None,
+    drafts: bool,
+) -> None:
+    """Reindex all records of a model with bulk requests.
+
+    Exits with status 1 if any record failed to be indexed.
+    """
+    from .reindex import Checkpoint, ModelReindexer, ReindexStats
+
+    def progress(stats: ReindexStats) -> None:
+        click.echo(f"indexed {stats.indexed}, failed {stats.failed}, {stats.throughput:.1f} records/s")
+
+    stats = ModelReindexer(
+        model,
+        batch_size=batch_size,
+        concurrency=concurrency,
+        workers=workers,
+        checkpoint=Checkpoint(checkpoint),
+        progress=progress,
+    ).reindex(include_drafts=drafts)
+    click.secho(
+        f"Reindexed {stats.indexed} records ({stats.failed} failed), {stats.throughput:.1f} records/s",
+        fg="red" if stats.failed else "green",
+    )
+    if stats.failed:
+        click.echo(f"Failed records: {', '.join(stats.failed_ids)}", err=True)
+        click.get_current_context().exit(1)
+
+
+@model.command()
+@click.argument("model", type=MODEL_TYPE)
+@click.option(
+    "--input",
+    "input_file",
+    type=click.File("r"),
+    required=True,
+    help="JSON lines file with records in the REST API format.",
+)
+@click.option("--limit", type=int, help="Process at most this number of records.")
+@click.option(
+    "--top-fields",
+    default=10,
+    show_default=True,
+    help="Number of slowest fields to report, 0 disables field timing (which adds overhead).",
+)
+@click.option("--profile", "profile_file", type=click.Path(dir_okay=False), help="Write cProfile stats to this file.")
+@with_appcontext
+def bench(
+    model: SimpleNamespace,
+    input_file: TextIO,
+    limit: int | None,
+    top_fields: int,
+    profile_file: str | None,
+) -> None:
+    """Benchmark loading, validation and dumping of records through the generated schemas."""
+    import cProfile
+    import itertools
+
+    from .bench import ModelBenchmark
+
+    records = (json.loads(line) for line in input_file if line.strip())
+    if limit is not None:
+        records = itertools.islice(records, limit)
+
+    benchmark = ModelBenchmark(model, top_fields=top_fields)
+    if profile_file:
+        with cProfile.Profile() as profiler:
+            report = benchmark.run(records)
+        profiler.dump_stats(profile_file)
+    else:
+        report = benchmark.run(records)
+    click.echo(report.format())
+
+
+@model.command()
+@click.argument("model", type=MODEL_TYPE)
+@click.argument("input_file", type=click.File("r"))
+@click.option("--workers", default=0, show_default=True, help="Number of worker processes, 0 validates in-process.")
+@click.option(
+    "--chunk-size",
+    default=DEFAULT_CHUNK_SIZE,
+    show_default=True,
+    help="Number of records sent to a worker at once.",
+)
+@click.option(
+    "--errors",
+    "errors_file",
+    type=click.File("w"),
+    default="-",
+    show_default=True,
+    help="CSV report of errors (line, path, message).",
+)
+@click.option("--quarantine", "quarantine_file", type=click.File("w"), help="Write invalid lines to this file.")
+@with_appcontext
+def validate(
+    model: SimpleNamespace,
+    input_file: TextIO,
+    workers: int,
+    chunk_size: int,
+    errors_file: TextIO,
+    quarantine_file: TextIO | None,
+) -> None:
+    """Validate records of a JSON lines file against the model schemas.
+
+    Exits with status 1 if any record is invalid.
+    """
+    import csv
+
+    from .validation import validate_lines
+
+    writer = csv.writer(errors_file)
+    writer.writerow(["line", "path", "message"])
+    total = invalid = 0
+    for line_result in validate_lines(input_file, namespace=model, workers=workers, chunk_size=chunk_size):
+        total += 1
+        if line_result.result.valid:
+            continue
+        invalid += 1
+        for path, message in line_result.result.errors:
+            writer.writerow([line_result.line_number, path, message])
+        errors_file.flush()
+        if quarantine_file is not None:
+            quarantine_file.write(line_result.line if line_result.line.endswith("\n") else f"{line_result.line}\n")
+
+    click.echo(f"Validated {total} records, {invalid} invalid.", err=True)
+    if invalid:
+        click.get_current_context().exit(1)
+
+
+@model.command()
+@click.argument("model", type=MODEL_TYPE)
+@with_appcontext
+def stats(model: SimpleNamespace) -> None:
+    """Show complexity statistics of the model: fields, relations, mapping limits and memory."""
+    click.echo(model.get_stats().format())
+
+
 @model.group()
 def dump() -> None:
     """Dump various model representations."""
@@ -127,10 +288,10 @@ def mapping(model: SimpleNamespace) -> None:
 
 def dump_jsonschema(ns: SimpleNamespace) -> str:
     """Dump JSON schema for the model."""
-    files = [x for x in ns.__files__ if x.startswith("jsonschemas/") and x.endswith(".json")]
-    if not files:
+    content = get_record_json_schema_file(ns)
+    if content is None:
         raise ValueError("No JSON schema files found for this model")
-    return cast("str", ns.__files__[files[0]])
+    return content
 
 
 def dump_mapping(ns: SimpleNamespace) -> str:
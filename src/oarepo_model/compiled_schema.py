@@ -0,0 +1,466 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Compiled loaders and dumpers for generated marshmallow schemas.
+
+Schemas generated from the model type tree consist of a small set of field
+classes (nested objects, lists, strings, numbers, booleans, dates and
+polymorphic unions). This module compiles such a schema once into specialized
+load and dump closures that skip the generic per-field marshmallow machinery.
+
+The compiled code only handles the happy path. Whenever it meets a value it
+does not understand, or a value that is invalid, it gives up and the whole
+operation is repeated by marshmallow, so that the result and the error
+structure are always the same as with the plain marshmallow schema. Fields
+that can not be compiled (custom fields, fields depending on schema context,
+schemas with hooks, ...) are delegated to marshmallow one by one.
+
+Usage:
+
+```python
+from oarepo_model.compiled_schema import CompiledSchemaMixin
+
+class MySchema(CompiledSchemaMixin, GeneratedSchema):
+    pass
+```
+
+or set ``compiled_schemas: True`` in the model configuration to add the mixin
+to the generated ``RecordSchema``.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, override
+from weakref import WeakKeyDictionary
+
+import marshmallow
+import marshmallow.fields
+from marshmallow import EXCLUDE, INCLUDE, RAISE, ValidationError
+from marshmallow.utils import missing, set_value
+from marshmallow_utils.fields import EDTFDateString, EDTFDateTimeString, SanitizedHTML, SanitizedUnicode
+
+from .datatypes.date import DateString, DateTimeString, KeepOriginalStringMixin, TimeString
+from .datatypes.polymorphic import PolymorphicField
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    type Loader = Callable[[Any], Any]
+    type Dumper = Callable[[Any], Any]
+
+
+class CompilationFallbackError(Exception):
+    """Raised by compiled code when a value must be processed by marshmallow."""
+
+
+#: Field classes that do not depend on the schema context. Values of these fields
+#: that do not pass the specialized fast paths are processed by the field bound to
+#: a context-less prototype schema. Add your own context-free field classes here.
+context_free_field_classes: set[type[marshmallow.fields.Field]] = {
+    marshmallow.fields.String,
+    marshmallow.fields.Integer,
+    marshmallow.fields.Float,
+    marshmallow.fields.Decimal,
+    marshmallow.fields.Boolean,
+    marshmallow.fields.Raw,
+    marshmallow.fields.Date,
+    marshmallow.fields.DateTime,
+    marshmallow.fields.Time,
+    marshmallow.fields.UUID,
+    marshmallow.fields.Email,
+    marshmallow.fields.URL,
+    DateString,
+    DateTimeString,
+    TimeString,
+    EDTFDateString,
+    EDTFDateTimeString,
+    SanitizedUnicode,
+    SanitizedHTML,
+}
+
+_compiled_schemas: WeakKeyDictionary[type[marshmallow.Schema], CompiledSchema | None] = WeakKeyDictionary()
+
+
+def _fallback() -> Any:
+    raise CompilationFallbackError
+
+
+class _FieldPlan:
+    """Compiled handling of one field of a schema."""
+
+    __slots__ = ("attribute", "data_key", "dump_default", "dumper", "load_default", "loader", "name", "required")
+
+    def __init__(self, name: str, field: marshmallow.fields.Field, loader: Loader | None, dumper: Dumper | None):
+        self.name = name
+        self.data_key = field.data_key if field.data_key is not None else name
+        self.attribute = field.attribute or name
+        self.required = field.required
+        self.load_default = field.load_default
+        self.dump_default = field.dump_default
+        # dotted attributes are left to marshmallow
+        dotted = "." in self.attribute
+        self.loader = None if dotted else loader
+        self.dumper = None if dotted else dumper
+
+
+class CompiledSchema:
+    """Compiled load and dump functions of a marshmallow schema class."""
+
+    def __init__(self, schema_cls: type[marshmallow.Schema]):
+        """Compile the schema class.
+
+        Fields are compiled using a prototype instance of the schema, so that
+        they are bound exactly as in a real schema instance.
+        """
+        self.schema_cls = schema_cls
+        prototype = schema_cls()
+        self.unknown = prototype.unknown
+        self.has_hooks = any(getattr(schema_cls, "_hooks", {}).values())
+        self.load_fields = [
+            _FieldPlan(name, field, compile_loader(field), None) for name, field in prototype.load_fields.items()
+        ]
+        self.dump_fields = [
+            _FieldPlan(name, field, None, compile_dumper(field)) for name, field in prototype.dump_fields.items()
+        ]
+        self.load_data_keys = frozenset(plan.data_key for plan in self.load_fields)
+        self.fully_compiled = all(plan.loader is not None for plan in self.load_fields) and all(
+            plan.dumper is not None for plan in self.dump_fields
+        )
+
+    def load(self, data: Any) -> Any:
+        """Load data, using marshmallow if the compiled code can not handle them."""
+        try:
+            return self.load_dict(data, self.unknown)
+        except CompilationFallbackError, ValidationError:
+            return self.schema_cls().load(data)
+
+    def dump(self, obj: Any) -> Any:
+        """Dump an object, using marshmallow if the compiled code can not handle it."""
+        try:
+            return self.dump_dict(obj)
+        except CompilationFallbackError, ValidationError:
+            return self.schema_cls().dump(obj)
+
+    def load_dict(
+        self,
+        data: Any,
+        unknown: str,
+        schema: marshmallow.Schema | None = None,
+    ) -> dict[str, Any]:
+        """Load a dictionary. Raises CompilationFallbackError if marshmallow is needed.
+
+        :param schema: the real schema instance used for fields that were not compiled.
+        """
+        if type(data) is not dict:
+            raise CompilationFallbackError
+        ret: dict[str, Any] = {}
+        for plan in self.load_fields:
+            key = plan.data_key
+            if key in data:
+                value = data[key]
+                if plan.loader is not None:
+                    ret[plan.attribute] = plan.loader(value)
+                    continue
+                if schema is None:
+                    raise CompilationFallbackError
+                value = schema.load_fields[plan.name].deserialize(value, key, data)
+                if value is not missing:
+                    set_value(ret, plan.attribute, value)
+            elif plan.required:
+                raise CompilationFallbackError
+            elif plan.load_default is not missing:
+                default = plan.load_default
+                set_value(ret, plan.attribute, default() if callable(default) else default)
+
+        if unknown != EXCLUDE and not self.load_data_keys.issuperset(data):
+            if unknown != INCLUDE:
+                raise CompilationFallbackError
+            for key in data.keys() - self.load_data_keys:
+                ret[key] = data[key]
+        return ret
+
+    def dump_dict(self, obj: Any, schema: marshmallow.Schema | None = None) -> dict[str, Any]:
+        """Dump a dictionary. Raises CompilationFallbackError if marshmallow is needed.
+
+        :param schema: the real schema instance used for fields that were not compiled
+                       and for values that are not stored in the dictionary (for example
+                       record system fields).
+        """
+        if not isinstance(obj, dict):
+            raise CompilationFallbackError
+        ret: dict[str, Any] = {}
+        for plan in self.dump_fields:
+            attribute = plan.attribute
+            if plan.dumper is not None and attribute in obj:
+                ret[plan.data_key] = plan.dumper(obj[attribute])
+                continue
+            if schema is None:
+                if attribute in obj or plan.dump_default is not missing or hasattr(obj, attribute):
+                    raise CompilationFallbackError
+                continue
+            value = schema.dump_fields[plan.name].serialize(plan.name, obj, accessor=schema.get_attribute)
+            if value is not missing:
+                ret[plan.data_key] = value
+        return ret
+
+
+def compile_schema(schema: type[marshmallow.Schema] | marshmallow.Schema) -> CompiledSchema | None:
+    """Return the compiled schema for a schema class, or None if it can not be compiled.
+
+    Schemas with pre/post processors or validators can not be compiled as a whole,
+    use CompiledSchemaMixin for them. The result is cached per schema class.
+    """
+    compiled = _compile(schema if isinstance(schema, type) else type(schema))
+    if compiled is None or compiled.has_hooks:
+        return None
+    return compiled
+
+
+def _compile(schema_cls: type[marshmallow.Schema]) -> CompiledSchema | None:
+    """Compile the schema class ignoring its hooks, caching the result."""
+    try:
+        return _compiled_schemas[schema_cls]
+    except KeyError:
+        pass
+    # mark as not compilable first to stop recursive schemas
+    _compiled_schemas[schema_cls] = None
+    compiled = None
+    if (
+        schema_cls.get_attribute is marshmallow.Schema.get_attribute
+        and schema_cls.dict_class is marshmallow.Schema.dict_class
+        and not getattr(schema_cls.opts, "ordered", False)
+    ):
+        compiled = CompiledSchema(schema_cls)
+    _compiled_schemas[schema_cls] = compiled
+    return compiled
+
+
+def _nested_schema(field: marshmallow.fields.Nested) -> CompiledSchema | None:
+    """Return compiled schema of a plain (non-many, no only/exclude) nested field."""
+    if field.many or field.only is not None or field.exclude or field.unknown is not None:
+        return None
+    nested = field.nested
+    if callable(nested) and not isinstance(nested, type):
+        nested = nested()
+    if not isinstance(nested, type) or not issubclass(nested, marshmallow.Schema):
+        return None
+    compiled = compile_schema(nested)
+    if compiled is None or not compiled.fully_compiled:
+        return None
+    return compiled
+
+
+def compile_loader(field: marshmallow.fields.Field) -> Loader | None:
+    """Compile ``field.deserialize`` for a present value, None if not supported."""
+    if (
+        type(field) in context_free_field_classes
+        and type(field).deserialize is not marshmallow.fields.Field.deserialize
+    ):
+        # the field has its own deserialization (for example keeps the original string)
+        return field.deserialize
+    core = _compile_core_loader(field)
+    if core is None:
+        return None
+    allow_none = field.allow_none
+    validators = tuple(field.validators)
+
+    if not validators:
+        if allow_none:
+            return lambda value: None if value is None else core(value)
+        return lambda value: _fallback() if value is None else core(value)
+
+    def load(value: Any) -> Any:
+        if value is None:
+            return None if allow_none else _fallback()
+        output = core(value)
+        for validator in validators:
+            # a validation error is handled by the caller, as well as a validator returning False
+            if validator(output) is False:
+                _fallback()
+        return output
+
+    return load
+
+
+def _compile_core_loader(field: marshmallow.fields.Field) -> Loader | None:  # noqa: C901, PLR0911
+    """Compile ``field._deserialize`` for a non-None value, None if not supported."""
+    field_cls = type(field)
+
+    if field_cls is marshmallow.fields.Nested:
+        nested = _nested_schema(field)  # type: ignore[arg-type]
+        if nested is None:
+            return None
+        nested_unknown = nested.unknown
+        return lambda value: nested.load_dict(value, nested_unknown)
+
+    if field_cls is marshmallow.fields.List:
+        inner = compile_loader(field.inner)  # type: ignore[attr-defined]
+        if inner is None:
+            return None
+        return lambda value: [inner(item) for item in value] if type(value) is list else _fallback()
+
+    if field_cls is PolymorphicField:
+        alternatives: dict[str, Loader] = {}
+        for discriminator_value, alternative in field.alternatives.items():  # type: ignore[attr-defined]
+            alternative_loader = _compile_core_loader(alternative)
+            if alternative_loader is None:
+                return None
+            alternatives[discriminator_value] = alternative_loader
+        discriminator = field.discriminator  # type: ignore[attr-defined]
+
+        def load_polymorphic(value: Any) -> Any:
+            if type(value) is not dict:
+                raise CompilationFallbackError
+            discriminator_value = value.get(discriminator)
+            if type(discriminator_value) is not str:
+                raise CompilationFallbackError
+            loader = alternatives.get(discriminator_value)
+            if loader is None:
+                raise CompilationFallbackError
+            return loader(value)
+
+        return load_polymorphic
+
+    if field_cls not in context_free_field_classes:
+        return None
+
+    slow_path = field._deserialize  # noqa: SLF001 - marshmallow conversion of non-canonical values
+
+    if field_cls is marshmallow.fields.Raw:
+        return lambda value: value
+    if field_cls is marshmallow.fields.String:
+        return lambda value: value if type(value) is str else slow_path(value, None, None)
+    if field_cls is marshmallow.fields.Integer:
+        return lambda value: value if type(value) is int else slow_path(value, None, None)
+    if field_cls is marshmallow.fields.Float:
+        if field.allow_nan:  # type: ignore[attr-defined]
+            return lambda value: value if type(value) is float else slow_path(value, None, None)
+        return lambda value: value if type(value) is float and math.isfinite(value) else slow_path(value, None, None)
+    if field_cls is marshmallow.fields.Boolean:
+        truthy = field.truthy  # type: ignore[attr-defined]
+        falsy = field.falsy  # type: ignore[attr-defined]
+        if truthy == {True} and falsy == {False}:
+            return lambda value: value if type(value) is bool else slow_path(value, None, None)
+        return lambda value: slow_path(value, None, None)
+
+    return lambda value: slow_path(value, None, None)
+
+
+def compile_dumper(field: marshmallow.fields.Field) -> Dumper | None:  # noqa: C901, PLR0911
+    """Compile ``field._serialize`` for a present value, None if not supported."""
+    field_cls = type(field)
+
+    if field_cls is marshmallow.fields.Nested:
+        nested = _nested_schema(field)  # type: ignore[arg-type]
+        if nested is None:
+            return None
+        return lambda value: None if value is None else nested.dump_dict(value)
+
+    if field_cls is marshmallow.fields.List:
+        inner = compile_dumper(field.inner)  # type: ignore[attr-defined]
+        if inner is None:
+            return None
+
+        def dump_list(value: Any) -> Any:
+            if value is None:
+                return None
+            if type(value) is not list:
+                raise CompilationFallbackError
+            return [inner(item) for item in value]
+
+        return dump_list
+
+    if field_cls is PolymorphicField:
+        alternatives: dict[str, Dumper] = {}
+        for discriminator_value, alternative in field.alternatives.items():  # type: ignore[attr-defined]
+            alternative_dumper = compile_dumper(alternative)
+            if alternative_dumper is None:
+                return None
+            alternatives[discriminator_value] = alternative_dumper
+        discriminator = field.discriminator  # type: ignore[attr-defined]
+
+        def dump_polymorphic(value: Any) -> Any:
+            if type(value) is not dict:
+                return value
+            discriminator_value = value.get(discriminator, missing)
+            if type(discriminator_value) is not str:
+                raise CompilationFallbackError
+            dumper = alternatives.get(discriminator_value)
+            return value if dumper is None else dumper(value)
+
+        return dump_polymorphic
+
+    if field_cls not in context_free_field_classes:
+        return None
+
+    slow_path = field._serialize  # noqa: SLF001 - marshmallow formatting of non-canonical values
+
+    if field_cls is marshmallow.fields.Raw:
+        return lambda value: value
+    if field_cls is marshmallow.fields.String:
+        return lambda value: value if type(value) is str or value is None else slow_path(value, None, None)
+    if field_cls is marshmallow.fields.Integer and not field.as_string:  # type: ignore[attr-defined]
+        return lambda value: value if type(value) is int or value is None else slow_path(value, None, None)
+    if field_cls is marshmallow.fields.Float and not field.as_string:  # type: ignore[attr-defined]
+        return lambda value: value if type(value) is float or value is None else slow_path(value, None, None)
+    if issubclass(field_cls, KeepOriginalStringMixin) and getattr(field, "format", None) in (None, "iso"):
+        return lambda value: value
+
+    return lambda value: slow_path(value, None, None)
+
+
+class CompiledSchemaMixin(marshmallow.Schema):
+    """Schema mixin that loads and dumps through the compiled schema when possible.
+
+    Pre/post processors and schema validators of the schema still run through
+    marshmallow, only the per-field (de)serialization is replaced.
+    """
+
+    def _compiled(self) -> CompiledSchema | None:
+        if self.only is not None or self.exclude or self.load_only or self.dump_only:
+            return None
+        return _compile(type(self))
+
+    @override
+    def _deserialize(  # type: ignore[override]
+        self,
+        data: Any,
+        *,
+        error_store: Any,
+        many: bool = False,
+        partial: Any = None,
+        unknown: str = RAISE,
+        index: int | None = None,
+    ) -> Any:
+        if not many and not partial:
+            compiled = self._compiled()
+            if compiled is not None:
+                try:
+                    return compiled.load_dict(data, unknown, schema=self)
+                except CompilationFallbackError, ValidationError:
+                    pass
+        return super()._deserialize(  # type: ignore[misc]
+            data,
+            error_store=error_store,
+            many=many,
+            partial=partial,
+            unknown=unknown,
+            index=index,
+        )
+
+    @override
+    def _serialize(self, obj: Any, *, many: bool = False) -> Any:
+        if not many:
+            compiled = self._compiled()
+            if compiled is not None:
+                try:
+                    return compiled.dump_dict(obj, schema=self)
+                except CompilationFallbackError, ValidationError:
+                    pass
+        return super()._serialize(obj, many=many)  # type: ignore[misc]
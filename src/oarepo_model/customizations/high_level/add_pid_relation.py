@@ -23,9 +23,9 @@ from invenio_records_resources.records.systemfields import (
     PIDNestedListRelation,
     PIDRelation,
 )
-from oarepo_runtime.records.systemfields.relations import PIDArbitraryNestedListRelation
 
 from ..base import Customization
+from .nested_list_relation import PIDNestedListsRelation
 
 if TYPE_CHECKING:
     from invenio_records_resources.records.systemfields.pid import PIDFieldContext
@@ -96,9 +96,8 @@ class AddPIDRelation(Customization):
             case 2:
                 if relation_field:
                     # invenio can not handle 2 arrays with a relation field at the end
-                    # for that we use the arbitrary nested list relation that can do it
-                    # albeit with a bit less efficiency
-                    relations[self.name] = PIDArbitraryNestedListRelation(
+                    # for that we use the nested lists relation with precompiled paths
+                    relations[self.name] = PIDNestedListsRelation(
                         array_paths=array_paths,
                         relation_field=relation_field,
                         keys=self.keys,
@@ -116,7 +115,7 @@ class AddPIDRelation(Customization):
                         **self.kwargs,
                     )
             case _:
-                relations[self.name] = PIDArbitraryNestedListRelation(
+                relations[self.name] = PIDNestedListsRelation(
                     array_paths=array_paths,
                     relation_field=relation_field,
                     keys=self.keys,
@@ -0,0 +1,140 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""PID relation through two or more nested arrays.
+
+``PIDArbitraryNestedListRelation`` from oarepo-runtime resolves every path with
+``dict_lookup`` (parsing the dotted path on each call) and builds nested lists of
+intermediate values and results on every dereference, validation and clean. This
+relation splits the array paths once, when the model is built, and walks the
+record with the precompiled accessors, visiting the referencing objects in place
+without building intermediate lists. Dereferencing changes the objects in place,
+so no values need to be written back, and the references of all objects are
+resolved in one batch by ``BatchedMultiRelationsField`` before dereferencing.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+from invenio_records.systemfields.relations import InvalidRelationValue
+from oarepo_runtime.records.systemfields.relations import (
+    ArbitraryPathResult,
+    PIDArbitraryNestedListRelation,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+def _lookup(data: Any, segments: tuple[str, ...]) -> Any:
+    """Lookup a precompiled path, raise KeyError if it is missing."""
+    for segment in segments:
+        if not isinstance(data, dict):
+            raise KeyError(segment)
+        data = data[segment]
+    return data
+
+
+class NestedListResult(ArbitraryPathResult):
+    """Relation result walking nested arrays with precompiled accessors."""
+
+    field: PIDNestedListsRelation
+
+    def iter_values(self) -> Iterator[Any]:
+        """Return an iterator of the objects at the end of the path (containing the reference)."""
+        return self._iter_values(self.record, 0)
+
+    def _iter_values(self, data: Any, level: int) -> Iterator[Any]:
+        field = self.field
+        if level == len(field.array_segments):
+            if field.relation_segments:
+                try:
+                    yield _lookup(data, field.relation_segments)
+                except KeyError:
+                    pass
+            else:
+                yield data
+            return
+        try:
+            values = _lookup(data, field.array_segments[level])
+        except KeyError:
+            return
+        if not isinstance(values, list):
+            raise InvalidRelationValue(
+                f'Invalid structure, expecting list at "{field.path_elements[level]}", got {values}. '
+                f'Complete paths: "{field.path_elements}"',
+            )
+        for value in values:
+            yield from self._iter_values(value, level + 1)
+
+    @override
+    def _lookup_data(self) -> Any:
+        """Return the nested lists of objects at the end of the path (used to resolve the relation)."""
+
+        def lookup(data: Any, level: int) -> Any:
+            field = self.field
+            if level == len(field.array_segments):
+                if field.relation_segments:
+                    try:
+                        return _lookup(data, field.relation_segments)
+                    except KeyError:
+                        return None
+                return data
+            try:
+                values = _lookup(data, field.array_segments[level])
+            except KeyError:
+                return []
+            if not isinstance(values, list):
+                raise InvalidRelationValue(f'Invalid structure, expecting list at "{field.path_elements[level]}".')
+            return [v for v in (lookup(value, level + 1) for value in values) if v is not None]
+
+        return lookup(self.record, 0)
+
+    @override
+    def validate(self) -> None:
+        """Validate all references."""
+        try:
+            for value in self.iter_values():
+                self._validate_single_value(value)
+        except KeyError:  # reference without an id, the same as ArbitraryPathResult
+            return
+
+    @override
+    def _apply_items(  # type: ignore[override]
+        self,
+        func: Callable,
+        keys: list[str] | None = None,
+        attrs: list[str] | None = None,
+    ) -> list[Any]:
+        """Call func on all referencing objects, return the flat list of the visited objects."""
+        keys = keys or self.keys
+        attrs = attrs or self.attrs
+        suffix = self.field._value_key_suffix  # noqa: SLF001
+        values = []
+        for value in self.iter_values():
+            if isinstance(value, dict) and suffix in value:
+                func(value, keys, attrs)
+            values.append(value)
+        return values
+
+
+class PIDNestedListsRelation(PIDArbitraryNestedListRelation):
+    """PID relation through nested arrays, paths are split when the relation is created.
+
+    :param array_paths: dotted paths of the arrays, each relative to the items of the previous one
+    :param relation_field: dotted path of the reference within the items of the last array
+    """
+
+    result_cls = NestedListResult
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize the relation and precompile its paths."""
+        super().__init__(*args, **kwargs)
+        self.array_segments = tuple(tuple(path.split(".")) for path in self.path_elements)
+        self.relation_segments = tuple(self.relation_field.split(".")) if self.relation_field else ()
@@ -16,10 +16,16 @@ for use in OARepo models.
 
 from __future__ import annotations
 
+import calendar
 import functools
-from datetime import datetime
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, time
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, override
+from typing import TYPE_CHECKING, Any, NamedTuple, cast, override
 
 import edtf
 import marshmallow.fields
@@ -30,7 +36,7 @@ from marshmallow_utils.fields.edtfdatestring import EDTFValidator
 from .base import DataType, FacetMixin
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping
+    from collections.abc import Callable, Generator, Hashable, Iterable, Mapping
 
 from oarepo_runtime.services.schema.ui import (
     LocalizedEDTF,
@@ -39,11 +45,107 @@ from oarepo_runtime.services.schema.ui import (
 )
 
 
+class ValidationCacheInfo(NamedTuple):
+    """Statistics of a validation cache."""
+
+    hits: int
+    misses: int
+    fast_path: int
+    maxsize: int
+    currsize: int
+
+
+class ValidationCache:
+    """Process-wide bounded LRU cache of successfully validated values.
+
+    Only valid values are cached, invalid values are always revalidated
+    to produce the error message.
+    """
+
+    def __init__(self, maxsize: int = 8192):
+        """Initialize the cache with the maximum number of entries."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.fast_path = 0
+        self._entries: OrderedDict[Hashable, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return True if the key is cached, updating the LRU order and counters."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def add(self, key: Hashable) -> None:
+        """Remember a successfully validated key, evicting the least recently used one."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = None
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of entries."""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.fast_path = 0
+
+    def info(self) -> ValidationCacheInfo:
+        """Return cache statistics."""
+        return ValidationCacheInfo(self.hits, self.misses, self.fast_path, self.maxsize, len(self._entries))
+
+
+class EDTFValidationCache(ValidationCache):
+    """Validation cache for EDTF values.
+
+    Entries are keyed by ``(value, allowed types, chronological flag)`` so that
+    all validators with the same configuration share their results, regardless
+    of which field created them.
+    """
+
+
+iso_validation_cache = ValidationCache()
+"""Cache of valid ISO date, datetime and time strings shared by all date fields."""
+
+edtf_validation_cache = EDTFValidationCache()
+"""Cache shared by all EDTF validators in the process."""
+
+
 class KeepOriginalStringMixin(marshmallow.fields.Field):
-    """Mixin schema to keep the original string value."""
+    """Mixin schema to keep the original string value.
+
+    Only the validity of the value matters, so canonical ISO values of fields
+    without extra validators are checked by ``ISO_PATTERN`` and ``ISO_PARSER``
+    and remembered in ``iso_validation_cache`` instead of being fully deserialized
+    by marshmallow. Everything else (including every invalid value) goes through
+    the marshmallow deserialization, so the error messages stay the same.
+    """
 
     SERIALIZATION_FUNCS: dict[str, Callable] = {"iso": lambda val: val}  # noqa RUFF012
 
+    ISO_PATTERN: re.Pattern[str] | None = None
+    """Canonical ISO shape accepted by the fast validation path."""
+
+    ISO_PARSER: Callable[[str], Any] | None = None
+    """Function checking the calendar/clock validity of a value matching ISO_PATTERN."""
+
+    validate_only = True
+    """Set to False to always deserialize the value through marshmallow."""
+
     @override
     def deserialize(
         self,
@@ -53,21 +155,126 @@ class KeepOriginalStringMixin(marshmallow.fields.Field):
         **kwargs: Any,
     ) -> Any:
         """Deserialize the value and keep the original string."""
+        if self._is_valid_iso(value):
+            return value
         super().deserialize(value, attr, data, **kwargs)
         return value  # return the original string if deserialization has not thrown an error
 
+    def _is_valid_iso(self, value: Any) -> bool:
+        """Return True if the value is known to be valid without marshmallow deserialization."""
+        if (
+            not self.validate_only
+            or self.ISO_PATTERN is None
+            or self.ISO_PARSER is None
+            or not isinstance(value, str)
+            or self.validators
+            or getattr(self, "format", None) not in (None, "iso")
+        ):
+            return False
+        key = (type(self), value)
+        if key in iso_validation_cache:
+            return True
+        if self.ISO_PATTERN.fullmatch(value) is None:
+            return False
+        try:
+            self.ISO_PARSER(value)
+        except ValueError:
+            return False
+        iso_validation_cache.fast_path += 1
+        iso_validation_cache.add(key)
+        return True
+
 
 class DateString(KeepOriginalStringMixin, marshmallow.fields.Date):
     """Marshmallow field for date strings that keeps the original string."""
 
+    ISO_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+    ISO_PARSER = staticmethod(date.fromisoformat)
+
 
 class DateTimeString(KeepOriginalStringMixin, marshmallow.fields.DateTime):
     """Marshmallow field for datetime strings that keeps the original string."""
 
+    ISO_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:\d{2})?")
+    ISO_PARSER = staticmethod(datetime.fromisoformat)
+
 
 class TimeString(KeepOriginalStringMixin, marshmallow.fields.Time):
     """Marshmallow field for time strings that keeps the original string."""
 
+    ISO_PATTERN = re.compile(r"\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?")
+    ISO_PARSER = staticmethod(time.fromisoformat)
+
+
+L10N_FORMATS = ("long", "medium", "short", "full")
+"""Babel formats of the localized ``<field>_l10n_<format>`` UI fields."""
+
+_active_l10n_formats: ContextVar[frozenset[str] | None] = ContextVar("l10n_formats", default=None)
+
+
+@contextmanager
+def l10n_formats(formats: Iterable[str] | None) -> Generator[None]:
+    """Serialize only the given localized formats within the block.
+
+    Localized UI fields of other formats are left out of the serialized output
+    and are never formatted. None means all formats.
+    """
+    token = _active_l10n_formats.set(frozenset(formats) if formats is not None else None)
+    try:
+        yield
+    finally:
+        _active_l10n_formats.reset(token)
+
+
+def get_l10n_formats() -> frozenset[str] | None:
+    """Return the localized formats active in the current context, None for all."""
+    return _active_l10n_formats.get()
+
+
+class LazyL10nFieldMixin(marshmallow.fields.Field):
+    """Localized UI field that is formatted only if its format is requested.
+
+    See ``l10n_formats`` for selecting the requested formats.
+    """
+
+    def __init__(self, *args: Any, format: str = "medium", **kwargs: Any):  # noqa: A002 - babel naming
+        """Initialize the field and remember its format."""
+        super().__init__(*args, format=format, **kwargs)  # type: ignore[call-arg]
+        self.l10n_format = format
+
+    @override
+    def serialize(
+        self,
+        attr: str,
+        obj: Any,
+        accessor: Callable[[Any, str, Any], Any] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        formats = _active_l10n_formats.get()
+        if formats is not None and self.l10n_format not in formats:
+            return marshmallow.missing
+        return super().serialize(attr, obj, accessor, **kwargs)
+
+
+@functools.cache
+def lazy_l10n_field_class(field_class: type[marshmallow.fields.Field]) -> type[marshmallow.fields.Field]:
+    """Return a subclass of the localized field class that is formatted only on demand."""
+    if issubclass(field_class, LazyL10nFieldMixin):
+        return field_class
+    return type(f"Lazy{field_class.__name__}", (LazyL10nFieldMixin, field_class), {})
+
+
+def create_l10n_fields(
+    field_name: str,
+    field_class: type[marshmallow.fields.Field],
+) -> dict[str, marshmallow.fields.Field]:
+    """Create ``<field_name>_l10n_<format>`` UI fields for all localized formats."""
+    lazy_class = lazy_l10n_field_class(field_class)
+    return {
+        f"{field_name}_l10n_{fmt}": lazy_class(attribute=field_name, format=fmt)  # type: ignore[call-arg]
+        for fmt in L10N_FORMATS
+    }
+
 
 class DateDataType(FacetMixin, DataType):
     """Data type for basic date values."""
@@ -89,24 +296,7 @@ class DateDataType(FacetMixin, DataType):
         """Create a Marshmallow UI fields for Date value, specifically long, medium, short, full formats."""
         field_class = self._get_ui_marshmallow_field_class(field_name, element) or marshmallow_utils.fields.FormatDate
 
-        return {
-            f"{field_name}_l10n_long": field_class(
-                attribute=field_name,
-                format="long",
-            ),
-            f"{field_name}_l10n_medium": field_class(
-                attribute=field_name,
-                format="medium",
-            ),
-            f"{field_name}_l10n_short": field_class(
-                attribute=field_name,
-                format="short",
-            ),
-            f"{field_name}_l10n_full": field_class(
-                attribute=field_name,
-                format="full",
-            ),
-        }
+        return create_l10n_fields(field_name, field_class)
 
     @override
     def _get_marshmallow_field_args(
@@ -162,24 +352,7 @@ class DateTimeDataType(FacetMixin, DataType):
         field_class = (
             self._get_ui_marshmallow_field_class(field_name, element) or marshmallow_utils.fields.FormatDatetime
         )
-        return {
-            f"{field_name}_l10n_long": field_class(
-                attribute=field_name,
-                format="long",
-            ),
-            f"{field_name}_l10n_medium": field_class(
-                attribute=field_name,
-                format="medium",
-            ),
-            f"{field_name}_l10n_short": field_class(
-                attribute=field_name,
-                format="short",
-            ),
-            f"{field_name}_l10n_full": field_class(
-                attribute=field_name,
-                format="full",
-            ),
-        }
+        return create_l10n_fields(field_name, field_class)
 
     @override
     def _get_marshmallow_field_args(
@@ -227,24 +400,7 @@ class TimeDataType(FacetMixin, DataType):
     ) -> dict[str, marshmallow.fields.Field]:
         """Create a Marshmallow UI fields for Time value, specifically long, medium, short, full formats."""
         field_class = self._get_ui_marshmallow_field_class(field_name, element) or marshmallow_utils.fields.FormatTime
-        return {
-            f"{field_name}_l10n_long": field_class(
-                attribute=field_name,
-                format="long",
-            ),
-            f"{field_name}_l10n_medium": field_class(
-                attribute=field_name,
-                format="medium",
-            ),
-            f"{field_name}_l10n_short": field_class(
-                attribute=field_name,
-                format="short",
-            ),
-            f"{field_name}_l10n_full": field_class(
-                attribute=field_name,
-                format="full",
-            ),
-        }
+        return create_l10n_fields(field_name, field_class)
 
     @override
     def _get_marshmallow_field_args(
@@ -264,28 +420,97 @@ class TimeDataType(FacetMixin, DataType):
         return ret
 
 
+_EDTF_DATE_RE = re.compile(r"(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?")
+
+
+def _parse_simple_date(value: str) -> tuple[date, date] | None:
+    """Return the first and last day of a plain YYYY, YYYY-MM or YYYY-MM-DD value.
+
+    Returns None if the value has any other shape, letting the edtf parser decide.
+    """
+    match = _EDTF_DATE_RE.fullmatch(value)
+    if match is None:
+        return None
+    year_str, month_str, day_str = match.groups()
+    year = int(year_str)
+    try:
+        if month_str is None:
+            return date(year, 1, 1), date(year, 12, 31)
+        month = int(month_str)
+        if day_str is None:
+            return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+        day = date(year, month, int(day_str))
+    except ValueError:
+        # year 0, seasons (months 21-24) and other edtf-only values go to the parser
+        return None
+    return day, day
+
+
 class CachedMultilayerEDTFValidator(EDTFValidator):
-    """A cached EDTF validator."""
+    """An EDTF validator with regex fast paths and a shared validation cache."""
+
+    def __init__(self, *args: Any, cache: EDTFValidationCache | None = None, **kwargs: Any):
+        """Initialize the validator.
+
+        :param cache: cache to use, defaults to the process-wide ``edtf_validation_cache``.
+        """
+        super().__init__(*args, **kwargs)
+        self.cache = cache if cache is not None else edtf_validation_cache
+        types = getattr(self, "types", None) or ()
+        self._allow_date = not types or edtf.Date in types
+        self._allow_interval = not types or edtf.Interval in types
+        self._cache_key_suffix = (
+            tuple(sorted(t.__name__ for t in types)),
+            getattr(self, "chronological_interval", True),
+        )
 
     @override
     def __call__(self, value: str) -> str:
         """Validate the EDTF value and return it."""
+        if not isinstance(value, str):
+            return cast("str", super().__call__(value))
         return self._cached_validation(value)
 
-    @functools.lru_cache(maxsize=1024)  # noqa memory consumption ok
     def _cached_validation(self, value: str) -> str:
         """Validate EDTF string.
 
         If a value is valid, do not revalidate again, take it from cache.
         """
-        # at first try to parse the value as a date because it is much faster
-        # and most of the time it is a date
-        try:
-            datetime.strptime(value, "%Y-%m-%d")  # noqa naive datetime ok here
-        except Exception:  # noqa catching all exceptions is ok here
+        key = (value, *self._cache_key_suffix)
+        if key in self.cache:
+            return value
+        if self._fast_path(value):
+            self.cache.fast_path += 1
+        else:
             value = super().__call__(value)
+        self.cache.add(key)
         return value
 
+    def _fast_path(self, value: str) -> bool:
+        """Return True if the value is valid without calling the edtf parser.
+
+        Only plain dates and intervals between plain dates are handled here,
+        anything else (or anything that fails here) is passed to the parser.
+        """
+        if "/" in value:
+            if not self._allow_interval:
+                return False
+            lower, _, upper = value.partition("/")
+            lower_range = _parse_simple_date(lower)
+            upper_range = _parse_simple_date(upper)
+            # accept only intervals whose bounds do not overlap, the parser
+            # decides about the rest
+            return lower_range is not None and upper_range is not None and lower_range[1] <= upper_range[0]
+
+        parsed = _parse_simple_date(value)
+        if parsed is None:
+            return False
+        if self._allow_date:
+            return True
+        # full dates have always been accepted regardless of the allowed types,
+        # keep it for backward compatibility
+        return len(value) == len("YYYY-MM-DD")
+
 
 class EDTFTimeDataType(FacetMixin, DataType):
     """Data type for EDTF (Extended Date/Time Format) time values."""
@@ -314,24 +539,7 @@ class EDTFTimeDataType(FacetMixin, DataType):
     ) -> dict[str, marshmallow.fields.Field]:
         """Create a Marshmallow UI fields for EDTFTime value, specifically long, medium, short, full formats."""
         field_class = self._get_ui_marshmallow_field_class(field_name, element) or LocalizedEDTFTime
-        return {
-            f"{field_name}_l10n_long": field_class(
-                attribute=field_name,
-                format="long",
-            ),
-            f"{field_name}_l10n_medium": field_class(
-                attribute=field_name,
-                format="medium",
-            ),
-            f"{field_name}_l10n_short": field_class(
-                attribute=field_name,
-                format="short",
-            ),
-            f"{field_name}_l10n_full": field_class(
-                attribute=field_name,
-                format="full",
-            ),
-        }
+        return create_l10n_fields(field_name, field_class)
 
     @override
     def _get_marshmallow_field_args(
@@ -375,24 +583,7 @@ class EDTFDataType(FacetMixin, DataType):
     ) -> dict[str, marshmallow.fields.Field]:
         """Create a Marshmallow UI fields for EDTF value, specifically long, medium, short, full formats."""
         field_class = self._get_ui_marshmallow_field_class(field_name, element) or LocalizedEDTF
-        return {
-            f"{field_name}_l10n_long": field_class(
-                attribute=field_name,
-                format="long",
-            ),
-            f"{field_name}_l10n_medium": field_class(
-                attribute=field_name,
-                format="medium",
-            ),
-            f"{field_name}_l10n_short": field_class(
-                attribute=field_name,
-                format="short",
-            ),
-            f"{field_name}_l10n_full": field_class(
-                attribute=field_name,
-                format="full",
-            ),
-        }
+        return create_l10n_fields(field_name, field_class)
 
     @override
     def _get_marshmallow_field_args(
@@ -431,24 +622,7 @@ class EDTFIntervalType(DataType):
     ) -> dict[str, marshmallow.fields.Field]:
         """Create a Marshmallow UI fields for EDTFInterval value, specifically long, medium, short, full formats."""
         field_class = self._get_ui_marshmallow_field_class(field_name, element) or LocalizedEDTFTimeInterval
-        return {
-            f"{field_name}_l10n_long": field_class(
-                attribute=field_name,
-                format="long",
-            ),
-            f"{field_name}_l10n_medium": field_class(
-                attribute=field_name,
-                format="medium",
-            ),
-            f"{field_name}_l10n_short": field_class(
-                attribute=field_name,
-                format="short",
-            ),
-            f"{field_name}_l10n_full": field_class(
-                attribute=field_name,
-                format="full",
-            ),
-        }
+        return create_l10n_fields(field_name, field_class)
 
     @override
     def _get_marshmallow_field_args(
@@ -515,9 +689,4 @@ class EDTFDateOrIntervalDataType(DataType):
         self, field_name: str, element: dict[str, Any]
     ) -> dict[str, marshmallow.fields.Field]:
         field_class = self._get_ui_marshmallow_field_class(field_name, element) or LocalizedEDTFTimeInterval
-        return {
-            f"{field_name}_l10n_long": field_class(attribute=field_name, format="long"),
-            f"{field_name}_l10n_medium": field_class(attribute=field_name, format="medium"),
-            f"{field_name}_l10n_short": field_class(attribute=field_name, format="short"),
-            f"{field_name}_l10n_full": field_class(attribute=field_name, format="full"),
-        }
+        return create_l10n_fields(field_name, field_class)
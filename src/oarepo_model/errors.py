@@ -43,3 +43,7 @@ class ClassBuildError(ApplyCustomizationError):
 
 class ClassListBuildError(ApplyCustomizationError):
     """Exception raised when building a class list fails."""
+
+
+class IndexFieldsLimitError(ModelBuildError):
+    """Exception raised when a generated index mapping exceeds the index mapping limits."""
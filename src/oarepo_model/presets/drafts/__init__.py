@@ -86,6 +86,7 @@ from .services.files.no_upload_file_service_config import (
     NoUploadFileServiceConfigPreset,
 )
 from .services.records.draft_facets import DraftFacetsPreset
+from .services.records.list_projection import DraftListProjectionPreset
 from .services.records.parent_record_schema import ParentRecordSchemaPreset
 from .services.records.record_schema import DraftRecordSchemaPreset
 from .services.records.relations import RelationsServiceComponentPreset
@@ -118,6 +119,7 @@ drafts_records_preset: list[type[Preset]] = [
     ParentRecordSchemaPreset,
     DraftSearchOptionsPreset,
     DraftFacetsPreset,
+    DraftListProjectionPreset,
     # resource layer
     DraftResourcePreset,
     DraftResourceConfigPreset,
@@ -18,13 +18,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, override
 
-from invenio_records.systemfields.relations import MultiRelationsField
-
 from oarepo_model.customizations import (
     Customization,
     PrependMixin,
 )
 from oarepo_model.presets import Preset
+from oarepo_model.presets.records_resources.records.batched_relations import BatchedMultiRelationsField
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -43,7 +42,7 @@ class DraftWithRelationsPreset(Preset):
 
     modifies = ("Draft",)
 
-    depends_on = ("relations",)
+    depends_on = ("relations", "relation_caches")
 
     @override
     def apply(
@@ -53,7 +52,8 @@ class DraftWithRelationsPreset(Preset):
         dependencies: dict[str, Any],
     ) -> Generator[Customization]:
         class DraftWithRelationsMixin:
-            relations = MultiRelationsField(
+            relations = BatchedMultiRelationsField(
+                dependencies["relation_caches"],
                 **dependencies["relations"],
             )
 
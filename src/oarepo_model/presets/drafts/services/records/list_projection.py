@@ -0,0 +1,57 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Projection of draft search results to the configured list fields."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+from oarepo_model.customizations import Customization, PrependMixin
+from oarepo_model.presets import Preset
+from oarepo_model.presets.records_resources.services.records.list_projection import (
+    ListProjectionParam,
+    ListProjectionSearchOptionsMixin,
+    get_list_projection,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.model import InvenioModel
+
+
+class DraftListProjectionPreset(Preset):
+    """Preset projecting draft search results if ``list_projection`` is configured in the model.
+
+    Hits of draft searches are dumped by the projected schema of ``RecordList``
+    (see ``ListProjectionPreset``), this preset leaves the other fields out of ``_source``.
+    """
+
+    modifies = ("DraftSearchOptions",)
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        paths = model.configuration.get("list_projection")
+        if not paths:
+            return
+        projection = get_list_projection(builder, model, paths)
+
+        class ModelListProjectionParam(ListProjectionParam):
+            list_projection = projection
+
+        class ModelListProjectionSearchOptionsMixin(ListProjectionSearchOptionsMixin):
+            list_projection_param_cls = ModelListProjectionParam
+
+        yield PrependMixin("DraftSearchOptions", ModelListProjectionSearchOptionsMixin)
@@ -10,19 +10,20 @@
 
 from __future__ import annotations
 
-import inspect
 from typing import TYPE_CHECKING, Any, override
 
 from invenio_drafts_resources.services.records.config import SearchDraftsOptions
-from invenio_records_resources.services.records.params.facets import FacetsParam
 from invenio_records_resources.services.records.queryparser import QueryParser
-from oarepo_runtime.services.facets.params import GroupedFacetsParam
 from oarepo_runtime.services.queryparsers.transformer import (
     SearchQueryValidator,
 )
 
 from oarepo_model.customizations import AddClass, AddDictionary, Customization
 from oarepo_model.presets import Preset
+from oarepo_model.presets.records_resources.services.records.search_options import (
+    GroupedFacetsSearchOptionsMixin,
+    get_facet_group_facets,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -51,24 +52,10 @@ class DraftSearchOptionsPreset(Preset):
     ) -> Generator[Customization]:
         yield AddDictionary("DraftFacetGroups", {}, exists_ok=True)
 
-        class DraftSearchOptionsMixin(ModelMixin):
+        class DraftSearchOptionsMixin(GroupedFacetsSearchOptionsMixin, ModelMixin):
             facets = Dependency("RecordFacets")
             facet_groups = Dependency("DraftFacetGroups")
-
-            @property
-            def params_interpreters_cls(self) -> Any:
-                interpreter_classes = super().params_interpreters_cls  # type: ignore[misc]
-                # make a copy of the list
-                interpreter_classes = list(interpreter_classes)
-                # replace FacetsParam with GroupedFacetsParam
-                for idx, clazz in enumerate(interpreter_classes):
-                    if inspect.isclass(clazz) and issubclass(clazz, FacetsParam):
-                        interpreter_classes[idx] = GroupedFacetsParam
-                        break
-                else:
-                    # could not find, insert at the start
-                    interpreter_classes.insert(0, GroupedFacetsParam)
-                return interpreter_classes
+            facet_group_facets = Dependency("RecordFacets", "DraftFacetGroups", transform=get_facet_group_facets)
 
             query_parser_cls = staticmethod(
                 QueryParser.factory(
@@ -36,6 +36,8 @@ from .model_registration import ModelMetadataRegistrationPreset, ModelRegistrati
 from .proxy import ProxyPreset
 from .records.date_range_dumper_ext import DateRangeDumperExtPreset
 from .records.dumper import RecordDumperPreset
+from .records.dumper_profiling import DumperProfilingPreset
+from .records.index_fields_budget import IndexFieldsBudgetPreset
 from .records.jsonschema import JSONSchemaPreset
 from .records.mapping import MappingPreset
 from .records.metadata_json_schema import MetadataJSONSchemaPreset
@@ -46,12 +48,14 @@ from .records.record_json_schema import RecordJSONSchemaPreset
 from .records.record_mapping import RecordMappingPreset
 from .records.record_metadata import RecordMetadataPreset
 from .records.record_with_relations import RecordWithRelationsPreset
-from .records.relations import RelationsPreset
+from .records.relations import RelationCachesPreset, RelationsPreset
 from .records.relations_dumper_ext import RelationsDumperExtPreset
 from .records.synthetic_metadata import SyntheticMetadataPreset
+from .records.vocabulary_index import VocabularyPreloadPreset
 from .resources.files.file_resource import FileResourcePreset
 from .resources.files.file_resource_config import FileResourceConfigPreset
 from .resources.records.error_handlers import ErrorHandlersPreset
+from .resources.records.export_stream import ExportStreamPreset
 from .resources.records.exports import ExportsPreset
 from .resources.records.imports import ImportsPreset
 from .resources.records.json_deserializer import JSONDeserializerPreset
@@ -70,6 +74,7 @@ from .services.files.file_service_config import FileServiceConfigPreset
 from .services.files.record_with_files_schema import (
     RecordWithFilesSchemaPreset,
 )
+from .services.records.list_projection import ListProjectionPreset
 from .services.records.metadata_facets import MetadataFacetsPreset
 from .services.records.metadata_schema import MetadataSchemaPreset
 from .services.records.permission_policy import PermissionPolicyPreset
@@ -85,24 +90,29 @@ from .services.records.service import RecordServicePreset
 from .services.records.service_config import RecordServiceConfigPreset
 from .services.records.ui_metadata_schema import MetadataUISchemaPreset
 from .services.records.ui_record_schema import RecordUISchemaPreset
+from .services.records.ui_serialization_cache import UISerializationCachePreset
 
 if TYPE_CHECKING:
+    from oarepo_model.api import FunctionalPreset
     from oarepo_model.presets import Preset
 
-records_preset: list[type[Preset]] = [
+records_preset: list[type[Preset | FunctionalPreset]] = [
     # record layer
     PIDProviderPreset,
     RecordPreset,
     RecordMetadataPreset,
     RecordDumperPreset,
     DateRangeDumperExtPreset,
+    DumperProfilingPreset,
     JSONSchemaPreset,
     MappingPreset,
     RecordJSONSchemaPreset,
     MetadataJSONSchemaPreset,
     RecordMappingPreset,
     MetadataMappingPreset,
+    IndexFieldsBudgetPreset,
     RelationsPreset,
+    RelationCachesPreset,
     RecordWithRelationsPreset,
     RelationsDumperExtPreset,
     SyntheticMetadataPreset,
@@ -120,6 +130,7 @@ records_preset: list[type[Preset]] = [
     MetadataSchemaPreset,
     RecordUISchemaPreset,
     MetadataUISchemaPreset,
+    UISerializationCachePreset,
     # resource layer
     ExportsPreset,
     SignpostingPreset,
@@ -127,8 +138,10 @@ records_preset: list[type[Preset]] = [
     JSONDeserializerPreset,
     RecordResourcePreset,
     RecordResourceConfigPreset,
+    ExportStreamPreset,
     JSONUISerializerPreset,
     RegisterJSONUISerializerPreset,
+    ListProjectionPreset,
     ErrorHandlersPreset,
     # extension
     ExtPreset,
@@ -139,6 +152,7 @@ records_preset: list[type[Preset]] = [
     ModelRegistrationPreset,
     ModelMetadataRegistrationPreset,
     FinalizationPreset,
+    VocabularyPreloadPreset,
     # feature
     RecordsFeaturePreset,
 ]
@@ -166,4 +180,4 @@ files_preset: list[type[Preset]] = [
     FilesFeaturePreset,
 ]
 
-records_resources_preset: list[type[Preset]] = records_preset + files_preset
+records_resources_preset: list[type[Preset | FunctionalPreset]] = records_preset + files_preset
@@ -0,0 +1,345 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Batched dereferencing of PID relations.
+
+Invenio relations resolve every referenced PID separately: a record with 200
+vocabulary references issues 200 PID lookups and 200 record selects on each
+dereference (service read, indexing). This module collects all ``(pid_type, pid_value)``
+references of all relation fields of one or more records first and resolves them
+with one PID query and one record query per pid type. The resolved records are put
+into the relation caches, so the dereference itself does not hit the database.
+
+References that can not be resolved in bulk (custom PID contexts or resolvers,
+vocabularies without a type context, non-registered or redirected PIDs, ...) are
+left to the standard per-reference resolution.
+
+``BatchedMultiRelationsField`` is a drop-in replacement of ``MultiRelationsField``
+that prefetches references of a record before it is dereferenced and optionally
+keeps dereferenced values in a cross-request cache (see ``relation_cache``) and resolves
+references to small vocabularies from an in-process index (see ``vocabulary_index``). To dereference
+many records at once (for example during bulk indexing), call ``prefetch_relations``
+with all of them before dumping.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_pidstore.resolver import Resolver
+from invenio_records.systemfields.relations import (
+    MultiRelationsField,
+    RelationBase,
+    RelationListResult,
+    RelationResult,
+    RelationsMapping,
+)
+from invenio_records_resources.records.systemfields.pid import PIDFieldContext
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from invenio_records.api import Record
+
+    from .relation_cache import RelationValueCache
+    from .vocabulary_index import VocabularyIndex
+
+BulkResolutionKey = tuple[str, str, type]
+"""(pid_type, object_type, record class) of references resolvable by a single query."""
+
+
+def get_bulk_resolution_key(pid_field: Any) -> BulkResolutionKey | None:
+    """Return the key of bulk resolution of a pid field context, None if it can not be resolved in bulk."""
+    if not isinstance(pid_field, PIDFieldContext):
+        return None
+    field = pid_field.field
+    if field._resolver_cls is not Resolver:  # noqa: SLF001 invenio does not expose the resolver
+        return None
+    # vocabulary contexts compute the pid type from the vocabulary type
+    pid_type = pid_field.pid_type if hasattr(type(pid_field), "pid_type") else field._pid_type  # noqa: SLF001
+    if not pid_type:
+        return None
+    return (pid_type, field._object_type, pid_field.record_cls)  # noqa: SLF001
+
+
+def resolve_pids(
+    pid_field: PIDFieldContext,
+    pid_values: Iterable[str],
+    vocabulary_index: VocabularyIndex | None = None,
+) -> dict[str, Record]:
+    """Resolve registered pids of a pid field with one PID query and one record query.
+
+    Pids that are not registered or point to deleted records are not returned.
+
+    :param vocabulary_index: index of preloaded vocabularies, pids found there are not queried.
+    """
+    pid_values = set(pid_values)
+    resolved: dict[str, Record] = {}
+    if vocabulary_index is not None and pid_values:
+        resolved.update(vocabulary_index.lookup(pid_field, pid_values) or {})
+        pid_values -= resolved.keys()
+    key = get_bulk_resolution_key(pid_field) if pid_values else None
+    if key is None:
+        return resolved
+    pid_type, object_type, record_cls = key
+    with db.session.no_autoflush:
+        pids = PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type == pid_type,
+            PersistentIdentifier.pid_value.in_(pid_values),
+            PersistentIdentifier.object_type == object_type,
+            PersistentIdentifier.status == PIDStatus.REGISTERED,
+        ).all()
+    if not pids:
+        return resolved
+    records = {record.id: record for record in record_cls.get_records([pid.object_uuid for pid in pids])}
+
+    for pid in pids:
+        record = records.get(pid.object_uuid)
+        if record is None:
+            continue
+        # the same as PIDFieldContext.resolve does
+        pid_field.field._set_cache(record, pid)  # noqa: SLF001
+        # detached as in PIDRelation.resolve, the cached records must not be refreshed after commit
+        db.session.expunge(record.model)
+        resolved[pid.pid_value] = record
+    return resolved
+
+
+def _apply_to_values(result: Any, func: Callable[[dict[str, Any], list[str], list[str]], Any]) -> None:
+    """Call func(data, keys, attrs) on all referencing values of a relation result."""
+    try:
+        if hasattr(result, "_apply_items"):
+            result._apply_items(func)  # noqa: SLF001 list results have no public iteration
+        else:
+            data = result._lookup_data()  # noqa: SLF001
+            if isinstance(data, dict):
+                func(data, result.keys, result.attrs)
+    except KeyError:
+        pass
+
+
+def referenced_ids(relation: RelationBase, record: Record) -> list[Any]:
+    """Return ids referenced by a relation field in a record that are not dereferenced yet."""
+    suffix = relation._value_key_suffix  # noqa: SLF001
+    result = relation.get_value(record)
+    ids: list[Any] = []
+
+    def collect(data: dict[str, Any], keys: Any, attrs: Any) -> dict[str, Any]:  # noqa: ARG001
+        if "@v" not in data and suffix in data:
+            ids.append(data[suffix])
+        return data
+
+    _apply_to_values(result, collect)
+    return ids
+
+
+def prefetch_relations(mappings: Iterable[RelationsMapping], fields: Iterable[str] | None = None) -> None:
+    """Resolve references of relation mappings (``record.relations``) in bulk into their caches.
+
+    All mappings share the caches afterwards, so the records resolved for one of them are
+    reused by the others.
+
+    :param fields: names of relation fields to prefetch, all fields if not given.
+    """
+    mappings = list(mappings)
+    # (bulk resolution key) -> pid field, set of pid values, vocabulary index of the mapping
+    requests: dict[BulkResolutionKey, tuple[PIDFieldContext, set[str], VocabularyIndex | None]] = {}
+    # cache key -> bulk resolution keys of relations that use it
+    cache_usage: dict[str, set[BulkResolutionKey]] = defaultdict(set)
+    shared_caches: dict[str, dict[Any, Any]] = {}
+
+    for mapping in mappings:
+        mapping_fields: dict[str, RelationBase] = mapping._fields  # noqa: SLF001
+        mapping_cache: dict[str, dict[Any, Any]] = mapping._cache  # noqa: SLF001
+        for name in fields or mapping_fields:
+            relation = mapping_fields[name]
+            cache_key = relation._cache_key  # noqa: SLF001 set when the mapping injects its cache
+            shared_caches.setdefault(cache_key, {}).update(mapping_cache.get(cache_key, {}))
+            mapping_cache[cache_key] = shared_caches[cache_key]
+
+            pid_field = getattr(relation, "pid_field", None)
+            vocabulary_index = getattr(mapping, "_vocabulary_index", None)
+            if vocabulary_index is not None and vocabulary_index.is_indexed(pid_field):
+                # indexed vocabularies are keyed by their type, getting the pid type needs a query
+                type_id = pid_field._type_id  # type: ignore[union-attr]  # noqa: SLF001
+                key: BulkResolutionKey | None = (type_id, "vocabulary", pid_field.record_cls)  # type: ignore[union-attr]
+            else:
+                key = get_bulk_resolution_key(pid_field)
+            if key is None:
+                continue
+            ids = {
+                id_
+                for id_ in referenced_ids(relation, mapping._record)  # noqa: SLF001
+                if isinstance(id_, str) and id_ not in shared_caches[cache_key]
+            }
+            if ids:
+                requests.setdefault(key, (pid_field, set(), vocabulary_index))[1].update(ids)
+                cache_usage[cache_key].add(key)
+
+    resolved = {
+        key: resolve_pids(pid_field, ids, vocabulary_index)
+        for key, (pid_field, ids, vocabulary_index) in requests.items()
+    }
+    for cache_key, keys in cache_usage.items():
+        for key in keys:
+            shared_caches[cache_key].update(resolved[key])
+
+
+def _supports_value_cache(result: Any) -> bool:
+    """Return True if the result dereferences values with the standard invenio implementation."""
+    result_cls = type(result)
+    return result_cls._dereference_one is RelationResult._dereference_one and result_cls.dereference in (  # noqa: SLF001
+        RelationResult.dereference,
+        RelationListResult.dereference,
+    )
+
+
+class BatchedRelationsMapping(RelationsMapping):
+    """Relations mapping that resolves all references in bulk before dereferencing.
+
+    If a relation value cache is set, the values of relations with an explicit cache key
+    are taken from it and the newly dereferenced values are stored there. If a vocabulary
+    index is set, references to the indexed vocabularies are resolved from it.
+    """
+
+    def __init__(
+        self,
+        record: Record,
+        fields: dict[str, RelationBase],
+        value_cache: RelationValueCache | None = None,
+        value_cached_fields: frozenset[str] = frozenset(),
+        vocabulary_index: VocabularyIndex | None = None,
+    ):
+        """Initialize the relations mapping."""
+        super().__init__(record, fields)
+        # RelationsMapping overrides __setattr__
+        object.__setattr__(self, "_value_cache", value_cache)
+        object.__setattr__(self, "_value_cached_fields", value_cached_fields)
+        object.__setattr__(self, "_vocabulary_index", vocabulary_index)
+
+    def dereference(self, fields: Iterable[str] | None = None) -> None:
+        """Dereference relation fields, resolving the references in bulk first."""
+        # relation fields are shared by all records of the class, point them to this record's cache
+        for name, field in self._fields.items():
+            field.inject_cache(self._cache, name)
+        names = list(fields or self._fields)
+        cached = []
+        if self._value_cache is not None:
+            cached = [
+                name
+                for name in names
+                if name in self._value_cached_fields and _supports_value_cache(getattr(self, name))
+            ]
+            for name in cached:
+                _apply_to_values(getattr(self, name), self._value_cache_getter(self._fields[name]))
+
+        # values taken from the value cache contain "@v" and are not prefetched
+        prefetch_relations([self], names)
+
+        for name in names:
+            if name in cached:
+                result = getattr(self, name)
+                _apply_to_values(result, self._value_cache_setter(result))
+            else:
+                getattr(self, name).dereference()
+
+    def _value_cache_key(self, relation: RelationBase, data: dict[str, Any], keys: list[str], attrs: list[str]) -> Any:
+        return (
+            relation._cache_key,  # noqa: SLF001
+            data[relation._value_key_suffix],  # noqa: SLF001
+            tuple(keys),
+            tuple(attrs),
+        )
+
+    def _value_cache_getter(self, relation: RelationBase) -> Callable[[dict[str, Any], list[str], list[str]], Any]:
+        suffix = relation._value_key_suffix  # noqa: SLF001
+
+        def get_value(data: dict[str, Any], keys: list[str], attrs: list[str]) -> dict[str, Any]:
+            if "@v" not in data and suffix in data:
+                value = self._value_cache.get(self._value_cache_key(relation, data, keys, attrs))
+                if value is not None:
+                    data.update(value)
+            return data
+
+        return get_value
+
+    def _value_cache_setter(self, result: Any) -> Callable[[dict[str, Any], list[str], list[str]], Any]:
+        relation = result.field
+        suffix = relation._value_key_suffix  # noqa: SLF001
+
+        def set_value(data: dict[str, Any], keys: list[str], attrs: list[str]) -> dict[str, Any]:
+            if "@v" in data or suffix not in data:
+                return data
+            result._dereference_one(data, keys, attrs)  # noqa: SLF001
+            self._value_cache.set(
+                self._value_cache_key(relation, data, keys, attrs),
+                {k: v for k, v in data.items() if k != suffix},
+            )
+            return data
+
+        return set_value
+
+
+class BatchedMultiRelationsField(MultiRelationsField):
+    """MultiRelationsField whose dereference resolves references in bulk.
+
+    :param caches: caches of the relations (the ``relation_caches`` model dictionary), passed
+                   positionally so that they can not clash with names of relation fields:
+
+                   - ``value_cache``: cross-request cache of dereferenced values of relations
+                     with an explicit ``cache_key``,
+                   - ``vocabulary_index``: in-process index of preloaded vocabularies.
+    """
+
+    mapping_cls = BatchedRelationsMapping
+
+    def __init__(
+        self,
+        caches: Mapping[str, Any] | None = None,
+        /,
+        **fields: Any,
+    ):
+        """Initialize the field."""
+        super().__init__(**fields)
+        caches = caches or {}
+        value_cache: RelationValueCache | None = caches.get("value_cache")
+        vocabulary_index: VocabularyIndex | None = caches.get("vocabulary_index")
+        self._value_cache = value_cache
+        self._vocabulary_index = vocabulary_index
+        if vocabulary_index is not None:
+            for field in fields.values():
+                vocabulary_index.register(getattr(field, "pid_field", None))
+        # the cache key is set to the field name when relations are used, remember the explicit ones
+        self._value_cached_fields = frozenset(
+            name
+            for name, field in fields.items()
+            if isinstance(field, RelationBase) and field._cache_key is not None  # noqa: SLF001
+        )
+
+    def obj(self, instance: Record) -> RelationsMapping:
+        """Get the relations object."""
+        obj = self._get_cache(instance)
+        if obj:
+            return obj
+        obj = self.mapping_cls(
+            record=instance,
+            fields=self._fields,
+            value_cache=self._value_cache,
+            value_cached_fields=self._value_cached_fields,
+            vocabulary_index=self._vocabulary_index,
+        )
+        self._set_cache(instance, obj)
+        return obj
+
+    @property
+    def vocabulary_index(self) -> VocabularyIndex | None:
+        """In-process index of preloaded vocabularies used by this field."""
+        return self._vocabulary_index
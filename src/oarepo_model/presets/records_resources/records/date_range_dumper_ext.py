@@ -10,84 +10,80 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Any, override
 
 from invenio_rdm_records.records.dumpers.edtf import (  # pyright: ignore[reportAttributeAccessIssue]
     _format_date,  # pyright: ignore[reportAttributeAccessIssue]
     parse_edtf,  # pyright: ignore[reportAttributeAccessIssue]
 )
-from invenio_records.dumpers import SearchDumperExt
 
 from oarepo_model.customizations import AddToList, Customization
-from oarepo_model.datatypes.base import ARRAY_ITEM_PATH, DataType
+from oarepo_model.datatypes.base import DataType
 from oarepo_model.datatypes.collections import ObjectDataType
 from oarepo_model.datatypes.date import EDTFDateOrIntervalDataType
 from oarepo_model.presets import Preset
 
+from .path_dumper_ext import PathDumperExt, build_path_tree  # noqa: F401 build_path_tree was defined here
+
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
     from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.datatypes.registry import DataTypeRegistry
     from oarepo_model.model import InvenioModel
 
 
-class EDTFDateRangeDumperExt(SearchDumperExt):
-    """Dump EDTF date-or-interval fields to sibling OpenSearch date_range fields."""
+#: Number of distinct EDTF strings whose parsed range is kept in memory.
+EDTF_RANGE_CACHE_SIZE = 8192
 
-    def __init__(self, paths: list[list[str]]):
-        """Initialize with model paths to EDTF date-or-interval fields."""
-        super().__init__()
-        self.paths = paths
 
-    def dump(  # pyright: ignore[reportIncompatibleMethodOverride]
-        self,
-        record: Any,
-        data: dict[str, Any],
-    ) -> dict[str, Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
-        """Dump date_range fields into the search representation."""
-        _ = record
-        for path in self.paths:
-            self._apply(data, path, dump=True)
-        return data
-
-    def load(  # pyright: ignore[reportIncompatibleMethodOverride]
-        self,
-        data: dict[str, Any],
-        record_cls: type,
-    ) -> dict[str, Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
-        """Remove generated date_range fields from the record representation."""
-        _ = record_cls
-        for path in self.paths:
-            self._apply(data, path, dump=False)
-        return data
-
-    def _apply(self, data: Any, path: list[str], dump: bool) -> None:
-        """Apply dump or load operation to all values matching a path."""
-        if not path:
-            return
-        key = path[0]
-        if key == ARRAY_ITEM_PATH:
-            if isinstance(data, list):
-                for item in data:
-                    self._apply(item, path[1:], dump)
-            return
-        if not isinstance(data, dict) or key not in data:
-            return
-        if len(path) > 1:
-            self._apply(data[key], path[1:], dump)
-            return
-        if dump:
-            self._dump_value(data, key)
-        else:
-            data.pop(f"{key}_range", None)
-
-    def _dump_value(self, data: dict[str, Any], key: str) -> None:
-        """Dump one EDTF value to a sibling range field."""
-        parsed_date = parse_edtf(data[key])
-        data[f"{key}_range"] = {
-            "gte": _format_date(parsed_date.lower_strict()),
-            "lte": _format_date(parsed_date.upper_strict()),
-        }
+@functools.lru_cache(maxsize=EDTF_RANGE_CACHE_SIZE)
+def edtf_range(value: str) -> tuple[str, str]:
+    """Return the formatted (gte, lte) bounds of an EDTF date or interval.
+
+    The same date strings repeat heavily across records, so the parsed
+    bounds are kept in a bounded LRU cache keyed by the raw string.
+    """
+    parsed_date = parse_edtf(value)
+    return _format_date(parsed_date.lower_strict()), _format_date(parsed_date.upper_strict())
+
+
+def _dump_step(key: str) -> Callable[[Any], None]:
+    range_key = f"{key}_range"
+
+    def step(data: Any) -> None:
+        if isinstance(data, dict) and key in data:
+            gte, lte = edtf_range(data[key])
+            data[range_key] = {"gte": gte, "lte": lte}
+
+    return step
+
+
+def _load_step(key: str) -> Callable[[Any], None]:
+    range_key = f"{key}_range"
+
+    def step(data: Any) -> None:
+        if isinstance(data, dict) and key in data:
+            data.pop(range_key, None)
+
+    return step
+
+
+class EDTFDateRangeDumperExt(PathDumperExt):
+    """Dump EDTF date-or-interval fields to sibling OpenSearch date_range fields.
+
+    The configured paths are compiled once into a merged prefix tree of accessor
+    closures, so shared prefixes such as ``metadata`` are walked only once per record.
+    """
+
+    @override
+    def dump_step(self, key: str) -> Callable[[Any], None]:
+        return _dump_step(key)
+
+    @override
+    def load_step(self, key: str) -> Callable[[Any], None]:
+        return _load_step(key)
 
 
 class DateRangeDumperExtPreset(Preset):
@@ -127,6 +123,14 @@ def get_date_or_interval_paths(
 
 def get_model_nodes(builder: InvenioModelBuilder, model: InvenioModel) -> list[tuple[DataType, list[str]]]:
     """Return all visited data type nodes from the model."""
+    return get_registry_model_nodes(builder.type_registry, model)
+
+
+def get_registry_model_nodes(
+    type_registry: DataTypeRegistry,
+    model: InvenioModel,
+) -> list[tuple[DataType, list[str]]]:
+    """Return all visited data type nodes from the model, with types looked up in the type registry."""
     nodes: list[tuple[DataType, list[str]]] = []
 
     def collect(datatype: DataType, path: list[str], element: dict[str, Any]) -> None:
@@ -134,9 +138,9 @@ def get_model_nodes(builder: InvenioModelBuilder, model: InvenioModel) -> list[t
         nodes.append((datatype, path))
 
     if model.record_type is not None:
-        visit_schema(builder, model.record_type, [], collect)
+        _visit_registry_schema(type_registry, model.record_type, [], collect)
     if model.metadata_type is not None:
-        visit_schema(builder, model.metadata_type, ["metadata"], collect)
+        _visit_registry_schema(type_registry, model.metadata_type, ["metadata"], collect)
     return nodes
 
 
@@ -147,8 +151,17 @@ def visit_schema(
     visitor: Any,
 ) -> None:
     """Visit one model schema tree."""
+    _visit_registry_schema(builder.type_registry, schema_type, path, visitor)
+
+
+def _visit_registry_schema(
+    type_registry: DataTypeRegistry,
+    schema_type: Any,
+    path: list[str],
+    visitor: Any,
+) -> None:
     if isinstance(schema_type, (str, dict)):
-        datatype = builder.type_registry.get_type(schema_type)
+        datatype = type_registry.get_type(schema_type)
         datatype.visit({} if isinstance(schema_type, str) else schema_type, path, visitor)
     elif isinstance(schema_type, ObjectDataType):
         schema_type.visit({}, path, visitor)
@@ -10,6 +10,8 @@
 
 This module provides the DumperPreset that configures
 record dumpers for converting records to search-friendly formats.
+Consecutive path-based dumper extensions are fused into a single
+traversal of the record (see ``path_dumper_ext``).
 """
 
 from __future__ import annotations
@@ -25,6 +27,8 @@ from oarepo_model.customizations import (
 )
 from oarepo_model.presets import Preset
 
+from .path_dumper_ext import fuse_dumper_extensions
+
 if TYPE_CHECKING:
     from collections.abc import Generator
 
@@ -32,6 +36,14 @@ if TYPE_CHECKING:
     from oarepo_model.model import InvenioModel
 
 
+class SearchDumper(InvenioSearchDumper):
+    """Search dumper that fuses consecutive path dumper extensions."""
+
+    def __init__(self, extensions: list[Any] | None = None, *args: Any, **kwargs: Any):
+        """Initialize the dumper."""
+        super().__init__(fuse_dumper_extensions(extensions or []), *args, **kwargs)
+
+
 class RecordDumperPreset(Preset):
     """Preset for record dumper class."""
 
@@ -44,5 +56,5 @@ class RecordDumperPreset(Preset):
         model: InvenioModel,
         dependencies: dict[str, Any],
     ) -> Generator[Customization]:
-        yield AddClass("RecordDumper", clazz=InvenioSearchDumper)
+        yield AddClass("RecordDumper", clazz=SearchDumper)
         yield AddList("record_dumper_extensions")
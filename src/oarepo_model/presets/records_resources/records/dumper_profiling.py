@@ -0,0 +1,174 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Timing of record dumper extensions.
+
+If the ``dumper_profiling`` model configuration option is set, every extension of the
+record dumper is timed on each dump and load, and the whole dump is timed as
+``SearchDumper``. The timings are collected into counters and histograms of the
+model's ``DumperProfile``, available as ``Record.dumper.profile``:
+
+.. code-block:: python
+
+    Record.dumper.profile.stats()
+    # {"RelationDumperExt": {"dump": {"count": 10, "total": 0.12, "max": 0.03,
+    #                                 "histogram": {0.0001: 0, ..., inf: 10}}}, ...}
+
+Histogram buckets are cumulative (the number of observations lower or equal to the
+bucket bound) as in Prometheus, so they can be exported to a metrics system directly.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, override
+
+from invenio_records.dumpers import SearchDumperExt
+
+from oarepo_model.customizations import Customization, PrependMixin
+from oarepo_model.presets import Preset
+
+from .path_dumper_ext import FusedPathDumperExt
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.model import InvenioModel
+
+DUMPER_PROFILE_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, float("inf"))
+"""Upper bounds (in seconds) of the histogram buckets."""
+
+
+class DumperProfile:
+    """Counters and histograms of dumper extension timings.
+
+    :param buckets: upper bounds of the histogram buckets in seconds, the last one should be infinity.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DUMPER_PROFILE_BUCKETS):
+        """Create an empty profile."""
+        self.buckets = buckets
+        # (extension name, operation) -> [count, total, max, bucket counts...]
+        self._timings: dict[tuple[str, str], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, operation: str, seconds: float) -> None:
+        """Record a single timing of an extension operation (``dump`` or ``load``)."""
+        with self._lock:
+            timing = self._timings.get((name, operation))
+            if timing is None:
+                timing = self._timings[name, operation] = [0, 0.0, 0.0] + [0] * len(self.buckets)
+            timing[0] += 1
+            timing[1] += seconds
+            timing[2] = max(timing[2], seconds)
+            for idx, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    timing[3 + idx] += 1
+
+    def stats(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the collected timings per extension and operation."""
+        with self._lock:
+            ret: dict[str, dict[str, dict[str, Any]]] = {}
+            for (name, operation), timing in self._timings.items():
+                ret.setdefault(name, {})[operation] = {
+                    "count": int(timing[0]),
+                    "total": timing[1],
+                    "max": timing[2],
+                    "histogram": {bound: int(count) for bound, count in zip(self.buckets, timing[3:], strict=True)},
+                }
+            return ret
+
+    def clear(self) -> None:
+        """Drop all collected timings."""
+        with self._lock:
+            self._timings.clear()
+
+
+def extension_name(extension: SearchDumperExt) -> str:
+    """Return the name under which timings of an extension are collected."""
+    if isinstance(extension, FusedPathDumperExt):
+        return repr(extension)
+    return type(extension).__name__
+
+
+class ProfiledDumperExt(SearchDumperExt):
+    """Wrapper of a dumper extension that records the time of its dump and load."""
+
+    def __init__(self, extension: SearchDumperExt, profile: DumperProfile):
+        """Wrap the extension."""
+        super().__init__()
+        self.extension = extension
+        self.profile = profile
+        self.name = extension_name(extension)
+
+    def dump(self, record: Any, data: dict[str, Any]) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Dump with the wrapped extension and record the time."""
+        start = time.perf_counter()
+        try:
+            return self.extension.dump(record, data)
+        finally:
+            self.profile.observe(self.name, "dump", time.perf_counter() - start)
+
+    def load(self, data: dict[str, Any], record_cls: type) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Load with the wrapped extension and record the time."""
+        start = time.perf_counter()
+        try:
+            return self.extension.load(data, record_cls)
+        finally:
+            self.profile.observe(self.name, "load", time.perf_counter() - start)
+
+
+class ProfilingDumperMixin:
+    """Search dumper mixin timing the extensions and the whole dump."""
+
+    profile: DumperProfile
+    _extensions: list[SearchDumperExt]
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize the dumper and wrap its extensions."""
+        super().__init__(*args, **kwargs)
+        self._extensions = [ProfiledDumperExt(extension, self.profile) for extension in self._extensions]
+
+    def dump(self, record: Any, data: dict[str, Any]) -> Any:
+        """Dump the record and record the time."""
+        start = time.perf_counter()
+        try:
+            return super().dump(record, data)  # type: ignore[misc]
+        finally:
+            self.profile.observe("SearchDumper", "dump", time.perf_counter() - start)
+
+    def load(self, dump_data: dict[str, Any], record_cls: type) -> Any:
+        """Load the record and record the time."""
+        start = time.perf_counter()
+        try:
+            return super().load(dump_data, record_cls)  # type: ignore[misc]
+        finally:
+            self.profile.observe("SearchDumper", "load", time.perf_counter() - start)
+
+
+class DumperProfilingPreset(Preset):
+    """Preset timing the record dumper if ``dumper_profiling`` is configured in the model."""
+
+    modifies = ("RecordDumper",)
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        if not model.configuration.get("dumper_profiling"):
+            return
+
+        class ModelProfilingDumperMixin(ProfilingDumperMixin):
+            profile = DumperProfile()
+
+        yield PrependMixin("RecordDumper", ModelProfilingDumperMixin)
@@ -0,0 +1,211 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Budgeting of the number of fields in generated index mappings.
+
+Opensearch refuses to create an index whose mapping has more fields, nested
+fields or object levels than the ``index.mapping.*.limit`` settings allow. This
+module counts what the generated mappings actually contain (after all presets
+and user customizations have been applied) and:
+
+- if the limit is not set in the mapping and the usage plus headroom exceeds the
+  Opensearch default, the limit is set to the usage plus headroom,
+- if the limit is set (for example by ``SetIndexTotalFieldsLimit``) and the usage
+  exceeds it, the build fails with ``IndexFieldsLimitError`` listing the usage of
+  the largest subtrees of the mapping.
+
+Model configuration:
+
+- ``index_fields_budget``: set to True to enable the check, defaults to False so that
+  mappings of existing models are not changed,
+- ``index_fields_headroom``: fraction of the usage added to automatically set limits,
+  defaults to 0.2 so that dynamic parts of the mapping (custom fields, dynamic objects)
+  can grow.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import math
+from collections import Counter
+from typing import TYPE_CHECKING, Any, override
+
+from oarepo_model.api import FunctionalPreset
+from oarepo_model.builder import BuilderFile
+from oarepo_model.errors import IndexFieldsLimitError
+from oarepo_model.utils import dump_to_json
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.customizations import Customization
+    from oarepo_model.model import InvenioModel
+    from oarepo_model.presets import Preset
+
+log = logging.getLogger("oarepo_model")
+
+TOTAL_FIELDS_LIMIT = "index.mapping.total_fields.limit"
+NESTED_FIELDS_LIMIT = "index.mapping.nested_fields.limit"
+DEPTH_LIMIT = "index.mapping.depth.limit"
+
+DEFAULT_LIMITS = {
+    TOTAL_FIELDS_LIMIT: 1000,
+    NESTED_FIELDS_LIMIT: 50,
+    DEPTH_LIMIT: 20,
+}
+"""Opensearch defaults of the mapping limits."""
+
+DEFAULT_HEADROOM = 0.2
+
+BREAKDOWN_SIZE = 10
+"""Number of the largest subtrees listed in the error message."""
+
+
+@dataclasses.dataclass
+class IndexFieldsUsage:
+    """Usage of mapping limits by an index mapping."""
+
+    total_fields: int = 0
+    """Number of fields, including objects and multi-fields (``index.mapping.total_fields.limit``)."""
+
+    nested_fields: int = 0
+    """Number of nested mappings (``index.mapping.nested_fields.limit``)."""
+
+    depth: int = 0
+    """Maximum object depth, fields at the root level have depth 1 (``index.mapping.depth.limit``)."""
+
+    subtrees: Counter[str] = dataclasses.field(default_factory=Counter)
+    """Number of fields of each object subtree (first two levels of the mapping)."""
+
+    dynamic_paths: list[str] = dataclasses.field(default_factory=list)
+    """Paths of objects that may add fields at runtime."""
+
+    def get(self, setting: str) -> int:
+        """Return the usage of a limit setting."""
+        return {
+            TOTAL_FIELDS_LIMIT: self.total_fields,
+            NESTED_FIELDS_LIMIT: self.nested_fields,
+            DEPTH_LIMIT: self.depth,
+        }[setting]
+
+    def breakdown(self, size: int = BREAKDOWN_SIZE) -> str:
+        """Return a human readable list of the largest subtrees."""
+        lines = [f"  {path}: {count} fields" for path, count in self.subtrees.most_common(size)]
+        if self.dynamic_paths:
+            lines.append(f"  dynamic (may grow at runtime): {', '.join(self.dynamic_paths)}")
+        return "\n".join(lines)
+
+
+def count_mapping_fields(mapping: Mapping[str, Any]) -> IndexFieldsUsage:
+    """Count fields, nested fields and depth of an index mapping (content of the ``mappings`` key)."""
+    usage = IndexFieldsUsage()
+    total = _count_properties(mapping.get("properties", {}), "", 1, usage)
+    # runtime fields count towards the total fields limit as well
+    usage.total_fields = total + len(mapping.get("runtime", {}))
+    if mapping.get("dynamic") in (True, "true"):
+        usage.dynamic_paths.append("<root>")
+    return usage
+
+
+def _count_properties(properties: Mapping[str, Any], path: str, depth: int, usage: IndexFieldsUsage) -> int:
+    if properties:
+        usage.depth = max(usage.depth, depth)
+    total = 0
+    for key, field in properties.items():
+        field_path = f"{path}.{key}" if path else key
+        count = 1 + len(field.get("fields", {}))
+        if field.get("type") == "nested":
+            usage.nested_fields += 1
+        if field.get("dynamic") in (True, "true") and field.get("enabled", True):
+            usage.dynamic_paths.append(field_path)
+        if "properties" in field:
+            count += _count_properties(field["properties"], field_path, depth + 1, usage)
+            if depth <= 2:  # noqa: PLR2004 breakdown of the first two levels
+                usage.subtrees[field_path] = count
+        total += count
+    return total
+
+
+def get_mapping_setting(settings: Mapping[str, Any], setting: str) -> int | None:
+    """Return a mapping setting set in either the flat or the nested form, None if not set."""
+    if setting in settings:
+        return int(settings[setting])
+    value: Any = settings
+    for part in setting.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return int(value)
+
+
+def apply_index_fields_budget(
+    name: str,
+    index_definition: dict[str, Any],
+    headroom: float = DEFAULT_HEADROOM,
+) -> IndexFieldsUsage:
+    """Check the limits of an index definition (``{"mappings": ..., "settings": ...}``), set them if needed.
+
+    :param name: name of the mapping used in messages.
+    :raises IndexFieldsLimitError: if the mapping exceeds a limit explicitly set in the settings.
+    """
+    usage = count_mapping_fields(index_definition.get("mappings", {}))
+    settings = index_definition.get("settings", {})
+    errors = []
+    for setting, default in DEFAULT_LIMITS.items():
+        used = usage.get(setting)
+        required = math.ceil(used * (1 + headroom))
+        limit = get_mapping_setting(settings, setting)
+        if limit is None:
+            if required > default:
+                index_definition.setdefault("settings", {})[setting] = required
+                log.info("Mapping %s uses %s of %s, setting the limit to %s", name, used, setting, required)
+        elif used > limit:
+            errors.append(f"{setting} is {limit}, but the mapping uses {used}")
+        elif required > limit:
+            log.warning(
+                "Mapping %s uses %s of %s=%s, leaving less than %s%% headroom",
+                name,
+                used,
+                setting,
+                limit,
+                round(headroom * 100),
+            )
+    if errors:
+        raise IndexFieldsLimitError(
+            f"Mapping {name} exceeds index limits: {'; '.join(errors)}.\nLargest subtrees:\n{usage.breakdown()}",
+        )
+    return usage
+
+
+class IndexFieldsBudgetPreset(FunctionalPreset):
+    """Check and set mapping limits of all generated mappings after the model is fully customized."""
+
+    @override
+    def after_user_customizations_applied(
+        self,
+        model: InvenioModel,
+        types: list[dict[str, Any]],
+        presets: list[type[Preset] | list[type[Preset]] | tuple[type[Preset]]],
+        builder: InvenioModelBuilder,
+        customizations: list[Customization],
+        params: dict[str, Any],
+    ) -> None:
+        if not model.configuration.get("index_fields_budget", False):
+            return
+        headroom = model.configuration.get("index_fields_headroom", DEFAULT_HEADROOM)
+        for partial in builder.partials.values():
+            if not isinstance(partial, BuilderFile) or partial.module_name != "mappings":
+                continue
+            index_definition = json.loads(partial.content)
+            previous_settings = json.dumps(index_definition.get("settings"), sort_keys=True)
+            apply_index_fields_budget(partial.file_path, index_definition, headroom)
+            if json.dumps(index_definition.get("settings"), sort_keys=True) != previous_settings:
+                partial.content = dump_to_json(index_definition)
@@ -0,0 +1,329 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Optimization of generated index mappings.
+
+Data types generate fully indexed mappings with doc values for every field. When
+the ``mapping_optimization`` model configuration option is set, the generated
+mapping is post-processed using the element flags:
+
+- ``"indexed": false`` marks a display-only field. It is kept in ``_source`` but
+  not indexed at all: leaf fields get ``index: false``, ``doc_values: false`` and
+  ``norms: false`` (whichever the field type supports), objects get ``enabled: false``.
+- ``"searchable": false`` marks a field that is not faceted (facets are not generated
+  for it already). The field stays searchable, but its doc values are dropped.
+  Do not set this flag on fields used for sorting.
+
+If the same path is generated by several elements (for example by variants of a
+polymorphic field), it is optimized only if all of them agree.
+
+Keyword fields used by the generated facets can be tuned as well (see ``tune_facet_mapping``):
+if the ``facet_keyword_ignore_above`` model configuration option is set, their ``ignore_above``
+is set to it and enlarged so that no valid value is left out of facet buckets and, if the
+``facet_eager_global_ordinals`` option is set, they get ``eager_global_ordinals: true`` so
+that global ordinals of high-cardinality fields are built at refresh time instead of on the
+first aggregation. Without these options the generated facet mappings are not changed.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from oarepo_model.datatypes.base import ARRAY_ITEM_PATH
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterator, Mapping
+
+    from oarepo_model.datatypes.base import DataType
+
+INDEX_AND_DOC_VALUES_TYPES = frozenset(
+    {
+        "keyword",
+        "long",
+        "integer",
+        "short",
+        "byte",
+        "double",
+        "float",
+        "half_float",
+        "scaled_float",
+        "unsigned_long",
+        "date",
+        "date_nanos",
+        "boolean",
+        "ip",
+        "geo_point",
+        "flattened",
+    },
+)
+"""Mapping types supporting both ``index`` and ``doc_values`` parameters."""
+
+MAX_IGNORE_ABOVE = 8191
+"""Largest ignore_above whose terms always fit into the Lucene term limit of 32766 bytes (4 bytes per character)."""
+
+
+@dataclasses.dataclass
+class MappingOptimizationReport:
+    """Report of a mapping optimization."""
+
+    disabled_fields: list[str] = dataclasses.field(default_factory=list)
+    """Paths of fields that are no longer indexed."""
+
+    indexed_fields_removed: int = 0
+    """Number of indexed fields (including multi-fields and object children) removed from the index."""
+
+    doc_values_removed: int = 0
+    """Number of fields whose doc values were disabled."""
+
+    skipped_fields: list[str] = dataclasses.field(default_factory=list)
+    """Paths of flagged fields whose mapping type can not be optimized."""
+
+    eager_global_ordinals_fields: list[str] = dataclasses.field(default_factory=list)
+    """Paths of facet fields with eager global ordinals."""
+
+    ignore_above_fields: list[str] = dataclasses.field(default_factory=list)
+    """Paths of facet fields whose ignore_above was resized."""
+
+
+def optimize_mapping(
+    datatype: DataType,
+    element: dict[str, Any],
+    mapping: Mapping[str, Any],
+) -> tuple[dict[str, Any], MappingOptimizationReport]:
+    """Optimize a mapping generated by ``datatype.create_mapping(element)``.
+
+    The input mapping is not modified (parts of it might be shared, read-only
+    mappings of data types), an optimized copy is returned.
+    """
+    flags = _collect_flags(datatype, element)
+    report = MappingOptimizationReport()
+    ret = dict(mapping)
+    if "properties" in ret:
+        ret["properties"] = _optimize_properties(ret["properties"], (), flags, report)
+    return ret, report
+
+
+def tune_facet_mapping(
+    datatype: DataType,
+    element: dict[str, Any],
+    mapping: Mapping[str, Any],
+    facets: dict[str, list[dict[str, Any]]],
+    *,
+    prefix: str = "",
+    eager_global_ordinals: bool | Collection[str] = False,
+    ignore_above: int | None = None,
+    report: MappingOptimizationReport | None = None,
+) -> tuple[dict[str, Any], MappingOptimizationReport]:
+    """Tune keyword fields used by facets in a mapping generated by ``datatype.create_mapping(element)``.
+
+    :param facets: facet definitions of the data type, as returned by ``get_facets(builder, type, prefix)``.
+    :param prefix: prefix of the facet names and fields (for example ``metadata``).
+    :param eager_global_ordinals: True to enable eager global ordinals on all facet fields,
+                                  or a collection of facet names or fields to enable them on.
+    :param ignore_above: ignore_above of facet fields without ``max_length``, fields with ``max_length``
+                         get ignore_above large enough to keep all valid values. If not set,
+                         ignore_above of all fields is left as generated.
+    """
+    report = report or MappingOptimizationReport()
+    max_lengths: dict[tuple[str, ...], int] = {}
+    for mapping_path, _path, el in _iter_leaf_elements(_visit_elements(datatype, element)):
+        if "max_length" in el:
+            max_lengths[mapping_path] = max(max_lengths.get(mapping_path, 0), el["max_length"])
+
+    field_prefix = f"{prefix}." if prefix else ""
+    ret = dict(mapping)
+    for facet_name, facet_specs in facets.items():
+        field = facet_specs[-1].get("field") if facet_specs else None
+        if not isinstance(field, str) or not field.startswith(field_prefix):
+            continue
+        eager = eager_global_ordinals is True or (
+            eager_global_ordinals and (facet_name in eager_global_ordinals or field in eager_global_ordinals)
+        )
+
+        def tune(
+            field_mapping: dict[str, Any],
+            element_path: tuple[str, ...],
+            *,
+            field: str = field,
+            eager: bool = bool(eager),
+        ) -> dict[str, Any]:
+            if field_mapping.get("type") != "keyword":
+                return field_mapping
+            if eager and not field_mapping.get("eager_global_ordinals"):
+                field_mapping["eager_global_ordinals"] = True
+                report.eager_global_ordinals_fields.append(field)
+            if ignore_above is None:
+                return field_mapping
+            current = field_mapping.get("ignore_above")
+            if element_path in max_lengths:
+                size = max(max_lengths[element_path], current or 0)
+            else:
+                size = ignore_above
+            if min(size, MAX_IGNORE_ABOVE) != current:
+                field_mapping["ignore_above"] = min(size, MAX_IGNORE_ABOVE)
+                report.ignore_above_fields.append(field)
+            return field_mapping
+
+        ret = _update_field(ret, field.removeprefix(field_prefix).split("."), (), tune)
+    return ret, report
+
+
+def _update_field(
+    mapping: Mapping[str, Any],
+    parts: list[str],
+    element_path: tuple[str, ...],
+    update: Callable[[dict[str, Any], tuple[str, ...]], dict[str, Any]],
+) -> dict[str, Any]:
+    """Return a copy of mapping with the field at dotted path ``parts`` replaced by ``update(copy of field)``.
+
+    The path can end with a multi-field (``title.keyword``). Unknown paths are left untouched.
+    """
+    ret = dict(mapping)
+    if not parts:
+        return update(ret, element_path)
+    key, rest = parts[0], parts[1:]
+    if key in mapping.get("properties", {}):
+        ret["properties"] = {
+            **mapping["properties"],
+            key: _update_field(mapping["properties"][key], rest, (*element_path, key), update),
+        }
+    elif not rest and key in mapping.get("fields", {}):
+        # multi-field of the current element
+        ret["fields"] = {**mapping["fields"], key: update(dict(mapping["fields"][key]), element_path)}
+    return ret
+
+
+def _visit_elements(datatype: DataType, element: dict[str, Any]) -> dict[tuple[str, ...], list[dict[str, Any]]]:
+    """Return {model path: [elements]} of the data type and all its children."""
+    elements: dict[tuple[str, ...], list[dict[str, Any]]] = defaultdict(list)
+
+    def visitor(_datatype: DataType, path: list[str], el: dict[str, Any]) -> None:
+        elements[tuple(path)].append(el)
+
+    datatype.visit(element, [], visitor)
+    return elements
+
+
+def _iter_leaf_elements(
+    elements: dict[tuple[str, ...], list[dict[str, Any]]],
+) -> Iterator[tuple[tuple[str, ...], tuple[str, ...], dict[str, Any]]]:
+    """Yield (mapping path, model path, element) of elements that generate the mapping of their path."""
+    for path, path_elements in elements.items():
+        if (*path, ARRAY_ITEM_PATH) in elements:
+            # array container, the mapping is generated by its items
+            continue
+        mapping_path = tuple(x for x in path if x != ARRAY_ITEM_PATH)
+        for el in path_elements:
+            yield mapping_path, path, el
+
+
+def _collect_flags(datatype: DataType, element: dict[str, Any]) -> dict[tuple[str, ...], dict[str, bool]]:
+    """Return {mapping path: {"indexed": bool, "searchable": bool}} of all elements."""
+    elements = _visit_elements(datatype, element)
+
+    def flag(path: tuple[str, ...], el: dict[str, Any], name: str) -> bool:
+        # items of an array inherit the flags of the array
+        if name in el:
+            return bool(el[name])
+        if path and path[-1] == ARRAY_ITEM_PATH:
+            return all(flag(path[:-1], parent, name) for parent in elements.get(path[:-1], []))
+        return True
+
+    values: dict[tuple[str, ...], dict[str, list[bool]]] = defaultdict(lambda: defaultdict(list))
+    for mapping_path, path, el in _iter_leaf_elements(elements):
+        for name in ("indexed", "searchable"):
+            values[mapping_path][name].append(flag(path, el, name))
+
+    return {path: {name: any(v) for name, v in path_values.items()} for path, path_values in values.items()}
+
+
+def _optimize_properties(
+    properties: Mapping[str, Any],
+    path: tuple[str, ...],
+    flags: dict[tuple[str, ...], dict[str, bool]],
+    report: MappingOptimizationReport,
+) -> dict[str, Any]:
+    ret = {}
+    for key, field_mapping in properties.items():
+        field_path = (*path, key)
+        field_flags = flags.get(field_path)
+        if field_flags is None and key.endswith("_range"):
+            # dynamic sibling mapping (see DataType.create_dynamic_mapping) follows its field
+            field_flags = flags.get((*path, key.removesuffix("_range")))
+        if field_flags is None:
+            ret[key] = field_mapping
+        elif not field_flags["indexed"]:
+            ret[key] = _disable_field(field_mapping, ".".join(field_path), report)
+        else:
+            optimized = dict(field_mapping)
+            if not field_flags["searchable"]:
+                optimized = _disable_doc_values(optimized, report)
+            if "properties" in optimized:
+                optimized["properties"] = _optimize_properties(optimized["properties"], field_path, flags, report)
+            ret[key] = optimized
+    return ret
+
+
+def _mapping_type(field_mapping: Mapping[str, Any]) -> str | None:
+    if "type" in field_mapping:
+        return field_mapping["type"]
+    return "object" if "properties" in field_mapping else None
+
+
+def _count_indexed_fields(field_mapping: Mapping[str, Any]) -> int:
+    if _mapping_type(field_mapping) in ("object", "nested"):
+        if field_mapping.get("enabled") is False:
+            return 0
+        return sum(_count_indexed_fields(x) for x in field_mapping.get("properties", {}).values())
+    count = 0 if field_mapping.get("index") is False else 1
+    return count + sum(_count_indexed_fields(x) for x in field_mapping.get("fields", {}).values())
+
+
+def _disable_field(field_mapping: Mapping[str, Any], path: str, report: MappingOptimizationReport) -> dict[str, Any]:
+    mapping_type = _mapping_type(field_mapping)
+    removed = _count_indexed_fields(field_mapping)
+
+    if mapping_type == "nested":
+        # nested mappings can not be disabled, disable their children instead
+        ret = dict(field_mapping)
+        ret["properties"] = {
+            key: _disable_field(value, f"{path}.{key}", report)
+            for key, value in field_mapping.get("properties", {}).items()
+        }
+        return ret
+
+    if mapping_type == "object":
+        ret = {"type": "object", "enabled": False}
+    elif mapping_type in INDEX_AND_DOC_VALUES_TYPES:
+        ret = {**field_mapping, "index": False, "doc_values": False}
+    elif mapping_type == "text":
+        ret = {**field_mapping, "index": False, "norms": False}
+    elif mapping_type is not None and mapping_type.endswith("_range"):
+        ret = {**field_mapping, "index": False}
+    else:
+        report.skipped_fields.append(path)
+        return dict(field_mapping)
+
+    # multi-fields exist only to be searched in a different way
+    ret.pop("fields", None)
+    report.disabled_fields.append(path)
+    report.indexed_fields_removed += removed
+    return ret
+
+
+def _disable_doc_values(field_mapping: dict[str, Any], report: MappingOptimizationReport) -> dict[str, Any]:
+    if _mapping_type(field_mapping) in INDEX_AND_DOC_VALUES_TYPES and field_mapping.get("doc_values") is not False:
+        field_mapping["doc_values"] = False
+        report.doc_values_removed += 1
+    if "fields" in field_mapping:
+        field_mapping["fields"] = {
+            key: _disable_doc_values(dict(value), report) for key, value in field_mapping["fields"].items()
+        }
+    return field_mapping
@@ -37,7 +37,12 @@ class MetadataMappingPreset(Preset):
         if model.metadata_type is not None:
             from .record_mapping import get_mapping
 
-            mapping = get_mapping(builder, model.metadata_type)
+            mapping = get_mapping(
+                builder,
+                model.metadata_type,
+                configuration=model.configuration,
+                prefix="metadata",
+            )
 
             yield PatchJSONFile(
                 "record-mapping",
@@ -0,0 +1,226 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Dumper extensions that touch only values at declared paths.
+
+Every search dumper extension walks the dumped record on its own. Extensions that
+declare the paths they touch (``PathDumperExt``) are compiled into a prefix tree of
+accessor closures instead, and consecutive path extensions of a dumper are fused into
+one ``FusedPathDumperExt`` that walks the record only once for all of them.
+
+Paths are lists of keys, ``[]`` (``ARRAY_ITEM_PATH``) stands for the items of an array.
+The step of an extension is called with the object containing the last key of a path
+and may only change that object. Because of that the order in which steps of different
+paths run does not matter, and steps of the same path run in the order of extensions.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+from invenio_records.dumpers import SearchDumperExt
+
+from oarepo_model.datatypes.base import ARRAY_ITEM_PATH
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+class _PathNode:
+    """Node of the prefix tree built from the configured paths."""
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PathNode] = {}
+        self.leaf = False
+        # extensions having a path ending at this node
+        self.extensions: list[PathDumperExt] = []
+
+
+def build_path_tree(paths: Iterable[list[str]], extension: PathDumperExt | None = None) -> _PathNode:
+    """Merge paths into a prefix tree so that shared prefixes are traversed once."""
+    root = _PathNode()
+    add_paths(root, paths, extension)
+    return root
+
+
+def add_paths(root: _PathNode, paths: Iterable[list[str]], extension: PathDumperExt | None = None) -> None:
+    """Add paths of an extension to a prefix tree."""
+    for path in paths:
+        if not path:
+            continue
+        node = root
+        for key in path:
+            node = node.children.setdefault(key, _PathNode())
+        node.leaf = True
+        if extension is not None and extension not in node.extensions:
+            node.extensions.append(extension)
+
+
+def compile_path_tree(
+    node: _PathNode,
+    leaf_step: Callable[[str, _PathNode], Callable[[Any], None]],
+) -> Callable[[Any], None]:
+    """Compile a prefix tree node into a single accessor closure.
+
+    :param leaf_step: returns the step called on the object containing the key of a leaf.
+    """
+    steps: list[Callable[[Any], None]] = []
+    for key, child in node.children.items():
+        if key == ARRAY_ITEM_PATH:
+            steps.append(_array_step(compile_path_tree(child, leaf_step)))
+            continue
+        if child.leaf:
+            steps.append(leaf_step(key, child))
+        if child.children:
+            steps.append(_object_step(key, compile_path_tree(child, leaf_step)))
+
+    return _sequence(steps)
+
+
+def _sequence(steps: list[Callable[[Any], None]]) -> Callable[[Any], None]:
+    if len(steps) == 1:
+        return steps[0]
+
+    def apply_all(data: Any) -> None:
+        for step in steps:
+            step(data)
+
+    return apply_all
+
+
+def _array_step(inner: Callable[[Any], None]) -> Callable[[Any], None]:
+    def step(data: Any) -> None:
+        if isinstance(data, list):
+            for item in data:
+                inner(item)
+
+    return step
+
+
+def _object_step(key: str, inner: Callable[[Any], None]) -> Callable[[Any], None]:
+    def step(data: Any) -> None:
+        if isinstance(data, dict) and key in data:
+            inner(data[key])
+
+    return step
+
+
+class PathDumperExt(SearchDumperExt, ABC):
+    """Search dumper extension that changes the record only at the declared paths.
+
+    Subclasses must implement ``dump_step`` and ``load_step``, a subclass missing
+    either of them can not be instantiated.
+    """
+
+    def __init__(self, paths: list[list[str]]):
+        """Initialize with the paths the extension touches."""
+        super().__init__()
+        self.paths = paths
+        tree = build_path_tree(paths, self)
+        self._dump_accessor = compile_path_tree(tree, lambda key, _node: self.dump_step(key))
+        self._load_accessor = compile_path_tree(tree, lambda key, _node: self.load_step(key))
+
+    @abstractmethod
+    def dump_step(self, key: str) -> Callable[[Any], None]:
+        """Return the step dumping the value of ``key`` in the object it is called with."""
+
+    @abstractmethod
+    def load_step(self, key: str) -> Callable[[Any], None]:
+        """Return the step reverting the dump of the value of ``key`` in the object it is called with."""
+
+    def dump(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        record: Any,
+        data: dict[str, Any],
+    ) -> dict[str, Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Dump the values at the declared paths."""
+        _ = record
+        self._dump_accessor(data)
+        return data
+
+    def load(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        data: dict[str, Any],
+        record_cls: type,
+    ) -> dict[str, Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Revert the dump of the values at the declared paths."""
+        _ = record_cls
+        self._load_accessor(data)
+        return data
+
+
+class FusedPathDumperExt(SearchDumperExt):
+    """Runs several path dumper extensions in one traversal of the record."""
+
+    def __init__(self, extensions: list[PathDumperExt]):
+        """Merge the paths of the extensions into one prefix tree."""
+        super().__init__()
+        self.extensions = extensions
+        tree = _PathNode()
+        for extension in extensions:
+            add_paths(tree, extension.paths, extension)
+        self._dump_accessor = compile_path_tree(
+            tree,
+            lambda key, node: _sequence([extension.dump_step(key) for extension in node.extensions]),
+        )
+        # the same order as SearchDumper.load calls the extensions
+        self._load_accessor = compile_path_tree(
+            tree,
+            lambda key, node: _sequence([extension.load_step(key) for extension in node.extensions]),
+        )
+
+    def __repr__(self) -> str:
+        """Return the names of the fused extensions."""
+        return f"FusedPathDumperExt({', '.join(type(extension).__name__ for extension in self.extensions)})"
+
+    def dump(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        record: Any,
+        data: dict[str, Any],
+    ) -> dict[str, Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Dump the values of all fused extensions."""
+        _ = record
+        self._dump_accessor(data)
+        return data
+
+    def load(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self,
+        data: dict[str, Any],
+        record_cls: type,
+    ) -> dict[str, Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Revert the dump of all fused extensions."""
+        _ = record_cls
+        self._load_accessor(data)
+        return data
+
+
+def fuse_dumper_extensions(extensions: Iterable[SearchDumperExt]) -> list[SearchDumperExt]:
+    """Replace runs of consecutive path dumper extensions with fused extensions.
+
+    Other extensions might read or change any part of the record, so path extensions are
+    fused only with their neighbours to keep the order relative to the other extensions.
+    """
+    fused: list[SearchDumperExt] = []
+    run: list[PathDumperExt] = []
+
+    def flush() -> None:
+        if len(run) > 1:
+            fused.append(FusedPathDumperExt(list(run)))
+        else:
+            fused.extend(run)
+        run.clear()
+
+    for extension in extensions:
+        if isinstance(extension, PathDumperExt):
+            run.append(extension)
+        else:
+            flush()
+            fused.append(extension)
+    flush()
+    return fused
@@ -10,6 +10,7 @@
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING, Any, cast, override
 
 from deepmerge import always_merger
@@ -18,12 +19,17 @@ from oarepo_model.customizations import AddJSONFile, Customization
 from oarepo_model.datatypes.collections import ObjectDataType
 from oarepo_model.presets import Preset
 
+from ..services.records.record_facets import get_facets
+from .mapping_optimizer import MappingOptimizationReport, optimize_mapping, tune_facet_mapping
+
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Mapping
 
     from oarepo_model.builder import InvenioModelBuilder
     from oarepo_model.model import InvenioModel
 
+log = logging.getLogger("oarepo_model")
+
 
 class RecordMappingPreset(Preset):
     """Preset for record service class."""
@@ -38,7 +44,11 @@ class RecordMappingPreset(Preset):
         model: InvenioModel,
         dependencies: dict[str, Any],
     ) -> Generator[Customization]:
-        mapping = {"mappings": get_mapping(builder, model.record_type)} if model.record_type is not None else {}
+        mapping = (
+            {"mappings": get_mapping(builder, model.record_type, configuration=model.configuration)}
+            if model.record_type is not None
+            else {}
+        )
 
         mapping = always_merger.merge(
             {
@@ -75,20 +85,63 @@ class RecordMappingPreset(Preset):
         )
 
 
-def get_mapping(builder: InvenioModelBuilder, schema_type: Any) -> dict[str, Any]:
-    """Get the mapping for the given schema type."""
+def get_mapping(
+    builder: InvenioModelBuilder,
+    schema_type: Any,
+    *,
+    configuration: Mapping[str, Any] | None = None,
+    prefix: str = "",
+) -> dict[str, Any]:
+    """Get the mapping for the given schema type.
+
+    :param configuration: model configuration. If ``mapping_optimization`` is set, the mapping
+                          optimizer (see ``mapping_optimizer``) is run on the generated mapping.
+                          Facet fields are tuned if ``facet_eager_global_ordinals`` or
+                          ``facet_keyword_ignore_above`` is set.
+    :param prefix: path of the mapping in the index mapping, used to match facet fields.
+    """
     base_mapping: dict[str, Any]
     if isinstance(schema_type, (str, dict)):
         datatype = builder.type_registry.get_type(schema_type)
-        base_mapping = cast("Any", datatype).create_mapping(
-            {} if isinstance(schema_type, str) else schema_type,
-        )
+        element = {} if isinstance(schema_type, str) else schema_type
     elif isinstance(schema_type, ObjectDataType):
-        base_mapping = schema_type.create_mapping({})
+        datatype = schema_type
+        element = {}
     else:
         raise TypeError(
             f"Invalid schema type: {schema_type}. Expected str, dict or None.",
         )
+    base_mapping = cast("Any", datatype).create_mapping(element)
+
+    configuration = configuration or {}
+    report = MappingOptimizationReport()
+    if configuration.get("mapping_optimization"):
+        base_mapping, report = optimize_mapping(datatype, element, base_mapping)
+    eager_global_ordinals = configuration.get("facet_eager_global_ordinals", False)
+    ignore_above = configuration.get("facet_keyword_ignore_above")
+    if eager_global_ordinals or ignore_above is not None:
+        base_mapping, report = tune_facet_mapping(
+            datatype,
+            element,
+            base_mapping,
+            get_facets(builder, schema_type, prefix=prefix),
+            prefix=prefix,
+            eager_global_ordinals=eager_global_ordinals,
+            ignore_above=ignore_above,
+            report=report,
+        )
+    if report != MappingOptimizationReport():
+        log.info(
+            "Mapping of %s: removed %s indexed fields and %s doc values (disabled: %s, skipped: %s), "
+            "eager global ordinals on %s, resized ignore_above of %s",
+            prefix or (schema_type if isinstance(schema_type, str) else type(datatype).__name__),
+            report.indexed_fields_removed,
+            report.doc_values_removed,
+            ", ".join(report.disabled_fields) or "-",
+            ", ".join(report.skipped_fields) or "-",
+            ", ".join(report.eager_global_ordinals_fields) or "-",
+            ", ".join(report.ignore_above_fields) or "-",
+        )
     base_mapping_copy = {**base_mapping}
     base_mapping_copy.pop("type", None)
     return base_mapping_copy
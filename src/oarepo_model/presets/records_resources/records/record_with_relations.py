@@ -12,14 +12,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, override
 
-from invenio_records.systemfields.relations import MultiRelationsField
-
 from oarepo_model.customizations import (
     Customization,
     PrependMixin,
 )
 from oarepo_model.presets import Preset
 
+from .batched_relations import BatchedMultiRelationsField
+
 if TYPE_CHECKING:
     from collections.abc import Generator
 
@@ -31,13 +31,13 @@ class RecordWithRelationsPreset(Preset):
     """A preset that adds a MultiRelationsField to the Record class.
 
     This preset modifies the Record class by introducing a relations field
-    using MultiRelationsField. The relations field is configured based on
+    using BatchedMultiRelationsField. The relations field is configured based on
     dependencies provided during the application of the preset.
     """
 
     modifies = ("Record",)
 
-    depends_on = ("relations",)
+    depends_on = ("relations", "relation_caches")
 
     @override
     def apply(
@@ -47,7 +47,8 @@ class RecordWithRelationsPreset(Preset):
         dependencies: dict[str, Any],
     ) -> Generator[Customization]:
         class RecordWithRelationsMixin:
-            relations = MultiRelationsField(
+            relations = BatchedMultiRelationsField(
+                dependencies["relation_caches"],
                 **dependencies["relations"],
             )
 
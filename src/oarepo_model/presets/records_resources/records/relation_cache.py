@@ -0,0 +1,156 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Cross-request cache of dereferenced relation values.
+
+Invenio caches resolved relation targets only within a single record. Vocabulary
+and affiliation references are read-mostly and repeat across thousands of records,
+so the dereferenced payloads (the keys copied from the target plus ``@v``) can be
+shared by all records of the process. The cache is enabled by the
+``relation_value_cache`` model configuration option, which can be:
+
+- ``True`` for the process-wide cache shared by all models,
+- a dictionary of ``RelationValueCache`` arguments (``maxsize``, ``ttl``) for a model's own cache,
+- an instance of ``RelationValueCache``.
+
+Only relations with an explicit ``cache_key`` are cached (vocabularies use their
+vocabulary type as the cache key). Values are keyed by ``(cache_key, pid value, keys,
+attrs)``, expire after ``ttl`` seconds and are dropped when the target record is
+updated, deleted or reverted in this process (``invenio_records`` signals). Other
+processes see the change after ``ttl`` at the latest.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from invenio_records.signals import after_record_delete, after_record_revert, after_record_update
+
+RelationValueKey = tuple[str, Any, tuple[str, ...], tuple[str, ...]]
+"""(cache_key, pid value, keys, attrs) of a dereferenced value."""
+
+
+class RelationValueCache:
+    """Bounded per-process cache of dereferenced relation values with a time to live.
+
+    :param maxsize: maximum number of cached values, the least recently used are evicted.
+    :param ttl: time to live of a value in seconds.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 600):
+        """Create the cache and connect it to record change signals."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[RelationValueKey, tuple[float, dict[str, Any]]] = OrderedDict()
+        # target record id -> keys of values dereferenced from it
+        self._by_record: dict[str, set[RelationValueKey]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        for signal in (after_record_update, after_record_delete, after_record_revert):
+            signal.connect(self._on_record_changed)
+
+    def get(self, key: RelationValueKey) -> dict[str, Any] | None:
+        """Return a copy of the cached value or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def set(self, key: RelationValueKey, value: dict[str, Any]) -> None:
+        """Store a copy of a dereferenced value (must contain ``@v``)."""
+        value = copy.deepcopy(value)
+        record_id = str(value.get("@v", "")).split("::", 1)[0]
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            self._by_record.setdefault(record_id, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, record_id: Any) -> None:
+        """Remove all values dereferenced from the record with the given id."""
+        with self._lock:
+            for key in self._by_record.pop(str(record_id), ()):
+                if self._entries.pop(key, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        """Remove all values and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._by_record.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics, including the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: RelationValueKey) -> None:
+        _, value = self._entries.pop(key)
+        record_id = str(value.get("@v", "")).split("::", 1)[0]
+        keys = self._by_record.get(record_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_record[record_id]
+
+    def _on_record_changed(self, sender: Any, record: Any = None, **kwargs: Any) -> None:  # noqa: ARG002
+        if record is not None and getattr(record, "id", None) is not None:
+            self.invalidate(record.id)
+
+
+_process_relation_value_cache: RelationValueCache | None = None
+_process_relation_value_cache_lock = threading.Lock()
+
+
+def get_process_relation_value_cache() -> RelationValueCache:
+    """Return the relation value cache shared by all models of the process."""
+    global _process_relation_value_cache  # noqa: PLW0603 process-wide singleton
+    with _process_relation_value_cache_lock:
+        if _process_relation_value_cache is None:
+            _process_relation_value_cache = RelationValueCache()
+        return _process_relation_value_cache
+
+
+def get_relation_value_cache(config: Any) -> RelationValueCache | None:
+    """Create the cache from the ``relation_value_cache`` configuration value."""
+    if not config:
+        return None
+    if isinstance(config, RelationValueCache):
+        return config
+    if config is True:
+        return get_process_relation_value_cache()
+    if isinstance(config, dict):
+        return RelationValueCache(**config)
+    raise ValueError(f"Unknown relation_value_cache value {config!r}, expected True, a dict or a cache instance.")
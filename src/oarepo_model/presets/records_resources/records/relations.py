@@ -15,6 +15,9 @@ from typing import TYPE_CHECKING, Any, override
 from oarepo_model.customizations import AddDictionary, Customization
 from oarepo_model.presets import Preset
 
+from .relation_cache import get_relation_value_cache
+from .vocabulary_index import get_vocabulary_index
+
 if TYPE_CHECKING:
     from collections.abc import Generator
 
@@ -45,3 +48,29 @@ class RelationsPreset(Preset):
         dependencies: dict[str, Any],
     ) -> Generator[Customization]:
         yield AddDictionary("relations", {})
+
+
+class RelationCachesPreset(Preset):
+    """Preset that adds "relation_caches" dictionary to the model.
+
+    The caches are created once per model from the ``relation_value_cache`` and
+    ``vocabulary_preload`` configuration and shared by the relations fields of
+    the record and the draft.
+    """
+
+    provides = ("relation_caches",)
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        yield AddDictionary(
+            "relation_caches",
+            {
+                "value_cache": get_relation_value_cache(model.configuration.get("relation_value_cache")),
+                "vocabulary_index": get_vocabulary_index(model.configuration.get("vocabulary_preload")),
+            },
+        )
@@ -0,0 +1,321 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""In-process index of small vocabularies.
+
+Small generic vocabularies (languages, resource types, licenses, ...) are referenced
+by most records, so resolving their items from the database on every dereference is
+wasted work. The index loads all items of a vocabulary type at once and the batched
+relation resolution (see ``batched_relations``) then takes the referenced items from it
+instead of querying the database. Preloading is opt-in per vocabulary type via the
+``vocabulary_preload`` model configuration option, which can be:
+
+- a list of vocabulary types, indexed in the process-wide index shared by all models,
+- a dictionary with ``types`` and optionally ``max_size`` and ``ttl`` for a model's own index,
+- an instance of ``VocabularyIndex``.
+
+Each vocabulary type has a version that is increased whenever an item of the type is
+created, updated, deleted or reverted in this process (``invenio_records`` signals).
+A loaded snapshot is used only while its version is current and its ``ttl`` has not
+expired, otherwise it is reloaded on the next lookup. Vocabularies with more than
+``max_size`` items are not indexed and are resolved from the database as before.
+The vocabularies are loaded when the application is finalized, or on the first lookup
+if the database is not available at that time.
+
+The indexed records are read-only, lookups return copies of them. Specialized
+vocabularies (affiliations, funders, ...) are never indexed.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, override
+
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.signals import (
+    after_record_delete,
+    after_record_insert,
+    after_record_revert,
+    after_record_update,
+)
+from sqlalchemy.exc import SQLAlchemyError
+
+from oarepo_model.customizations import AddToList, Customization
+from oarepo_model.presets import Preset
+
+from .batched_relations import get_bulk_resolution_key
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from flask import Flask
+    from invenio_pidstore.models import PersistentIdentifier as PersistentIdentifierModel
+    from invenio_records.api import Record
+
+    from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.model import InvenioModel
+
+log = logging.getLogger("oarepo_model")
+
+
+@dataclasses.dataclass(frozen=True)
+class VocabularySnapshot:
+    """Items of a vocabulary type loaded at a given version.
+
+    ``items`` is None if the vocabulary had more than ``max_size`` items.
+    """
+
+    version: int
+    expires: float
+    items: dict[str, tuple[Record, PersistentIdentifierModel]] | None
+
+
+class VocabularyIndex:
+    """Versioned, read-only in-process index of small vocabularies.
+
+    :param types: vocabulary types to index.
+    :param max_size: vocabularies with more items are not indexed.
+    :param ttl: time in seconds after which a snapshot is reloaded even if it has not
+                changed in this process (changes made by other processes).
+    """
+
+    def __init__(self, types: Iterable[str] = (), max_size: int = 1000, ttl: float = 600):
+        """Create the index and connect it to record change signals."""
+        self.types: set[str] = set(types)
+        self.max_size = max_size
+        self.ttl = ttl
+        self._versions: dict[str, int] = {}
+        self._snapshots: dict[str, VocabularySnapshot] = {}
+        # remember a pid field context of each type, needed to preload the index
+        self._pid_fields: dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        for signal in (after_record_insert, after_record_update, after_record_delete, after_record_revert):
+            signal.connect(self._on_record_changed)
+
+    def enable(self, types: Iterable[str]) -> None:
+        """Add vocabulary types to the index."""
+        with self._lock:
+            self.types.update(types)
+
+    def is_indexed(self, pid_field: Any) -> bool:
+        """Return True if references of the pid field can be resolved from the index."""
+        # only generic vocabulary contexts (Vocabulary.pid.with_type_ctx) have a type id
+        return getattr(pid_field, "_type_id", None) in self.types
+
+    def register(self, pid_field: Any) -> None:
+        """Register a vocabulary pid field context so that its type can be preloaded."""
+        if self.is_indexed(pid_field):
+            with self._lock:
+                self._pid_fields.setdefault(pid_field._type_id, pid_field)  # noqa: SLF001
+
+    def lookup(self, pid_field: Any, pid_values: Iterable[str]) -> dict[str, Record] | None:
+        """Return copies of the indexed records of the given pid values.
+
+        Returns None if the vocabulary of the pid field is not indexed, in that case the
+        references must be resolved from the database.
+        """
+        if not self.is_indexed(pid_field):
+            return None
+        snapshot = self._get_snapshot(pid_field)
+        if snapshot.items is None:
+            return None
+        resolved: dict[str, Record] = {}
+        for pid_value in pid_values:
+            item = snapshot.items.get(pid_value)
+            if item is None:
+                self.misses += 1
+                continue
+            self.hits += 1
+            resolved[pid_value] = self._copy_record(pid_field, *item)
+        return resolved
+
+    def preload(self) -> None:
+        """Load all registered vocabulary types that are not loaded yet."""
+        with self._lock:
+            pid_fields = list(self._pid_fields.values())
+        for pid_field in pid_fields:
+            self._get_snapshot(pid_field)
+
+    def version(self, vocabulary_type: str) -> int:
+        """Return the current version of a vocabulary type."""
+        return self._versions.get(vocabulary_type, 0)
+
+    def invalidate(self, vocabulary_type: str) -> None:
+        """Mark the loaded items of a vocabulary type as outdated."""
+        with self._lock:
+            self._versions[vocabulary_type] = self._versions.get(vocabulary_type, 0) + 1
+
+    def clear(self) -> None:
+        """Drop all loaded vocabularies and reset statistics."""
+        with self._lock:
+            self._snapshots.clear()
+            self.hits = self.misses = self.loads = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return index statistics."""
+        with self._lock:
+            return {
+                "types": {
+                    type_id: {
+                        "version": snapshot.version,
+                        "size": None if snapshot.items is None else len(snapshot.items),
+                        "current": snapshot.version == self.version(type_id),
+                    }
+                    for type_id, snapshot in self._snapshots.items()
+                },
+                "hits": self.hits,
+                "misses": self.misses,
+                "loads": self.loads,
+            }
+
+    def _get_snapshot(self, pid_field: Any) -> VocabularySnapshot:
+        type_id = pid_field._type_id  # noqa: SLF001
+        snapshot = self._snapshots.get(type_id)
+        if self._is_current(type_id, snapshot):
+            return snapshot  # type: ignore[return-value]
+        with self._lock:
+            # another thread might have loaded the vocabulary in the meantime
+            snapshot = self._snapshots.get(type_id)
+            if self._is_current(type_id, snapshot):
+                return snapshot  # type: ignore[return-value]
+            snapshot = self._load(pid_field, self.version(type_id))
+            self._snapshots[type_id] = snapshot
+            return snapshot
+
+    def _is_current(self, type_id: str, snapshot: VocabularySnapshot | None) -> bool:
+        return (
+            snapshot is not None and snapshot.version == self.version(type_id) and snapshot.expires > time.monotonic()
+        )
+
+    def _load(self, pid_field: Any, version: int) -> VocabularySnapshot:
+        expires = time.monotonic() + self.ttl
+        key = get_bulk_resolution_key(pid_field)
+        if key is None:
+            return VocabularySnapshot(version=version, expires=expires, items=None)
+        pid_type, object_type, record_cls = key
+        self.loads += 1
+        with db.session.no_autoflush:
+            query = PersistentIdentifier.query.filter(
+                PersistentIdentifier.pid_type == pid_type,
+                PersistentIdentifier.object_type == object_type,
+                PersistentIdentifier.status == PIDStatus.REGISTERED,
+            )
+            # fetch one more than allowed to find out if the vocabulary is too large
+            pids = query.limit(self.max_size + 1).all()
+        if len(pids) > self.max_size:
+            log.info("Vocabulary %s has more than %s items, not indexing it.", pid_field._type_id, self.max_size)  # noqa: SLF001
+            return VocabularySnapshot(version=version, expires=expires, items=None)
+
+        records = {record.id: record for record in record_cls.get_records([pid.object_uuid for pid in pids])}
+        items: dict[str, tuple[Record, PersistentIdentifierModel]] = {}
+        for pid in pids:
+            record = records.get(pid.object_uuid)
+            if record is None:
+                continue
+            # the records are shared by all requests, they must not be bound to any session
+            db.session.expunge(record.model)
+            db.session.expunge(pid)
+            items[pid.pid_value] = (record, pid)
+        return VocabularySnapshot(version=version, expires=expires, items=items)
+
+    def _copy_record(self, pid_field: Any, record: Record, pid: PersistentIdentifierModel) -> Record:
+        # dereferencing copies nested values of the record into the referencing record,
+        # so each lookup gets its own copy of the data
+        record_copy = type(record)(copy.deepcopy(dict(record)), model=record.model)
+        pid_field.field._set_cache(record_copy, pid)  # noqa: SLF001 the same as PIDFieldContext.resolve does
+        return record_copy
+
+    def _on_record_changed(self, sender: Any, record: Any = None, **kwargs: Any) -> None:  # noqa: ARG002
+        if record is None:
+            return
+        vocabulary_type = record.get("type") if hasattr(record, "get") else None
+        if isinstance(vocabulary_type, dict):
+            vocabulary_type = vocabulary_type.get("id")
+        if isinstance(vocabulary_type, str) and vocabulary_type in self.types:
+            self.invalidate(vocabulary_type)
+
+
+_process_vocabulary_index: VocabularyIndex | None = None
+_process_vocabulary_index_lock = threading.Lock()
+
+
+def get_process_vocabulary_index() -> VocabularyIndex:
+    """Return the vocabulary index shared by all models of the process."""
+    global _process_vocabulary_index  # noqa: PLW0603 process-wide singleton
+    with _process_vocabulary_index_lock:
+        if _process_vocabulary_index is None:
+            _process_vocabulary_index = VocabularyIndex()
+        return _process_vocabulary_index
+
+
+def get_vocabulary_index(config: Any) -> VocabularyIndex | None:
+    """Create the index from the ``vocabulary_preload`` configuration value."""
+    if not config:
+        return None
+    if isinstance(config, VocabularyIndex):
+        return config
+    if isinstance(config, (list, tuple, set, frozenset)):
+        index = get_process_vocabulary_index()
+        index.enable(config)
+        return index
+    if isinstance(config, dict):
+        return VocabularyIndex(**config)
+    raise ValueError(
+        f"Unknown vocabulary_preload value {config!r}, "
+        "expected a list of vocabulary types, a dict or an index instance.",
+    )
+
+
+def preload_vocabulary_index(app: Flask, index: VocabularyIndex) -> None:
+    """Load the registered vocabularies of an index when the application is finalized.
+
+    The database might not be ready yet (for example when it is being created), in that
+    case the vocabularies are loaded on the first lookup.
+    """
+    with app.app_context():
+        try:
+            index.preload()
+        except SQLAlchemyError:
+            db.session.rollback()
+            log.warning("Could not preload vocabularies, they will be loaded on first use.", exc_info=True)
+
+
+class VocabularyPreloadPreset(Preset):
+    """Preset loading the vocabularies of ``vocabulary_preload`` when the application is finalized."""
+
+    modifies = ("api_finalizers", "app_finalizers")
+    depends_on = ("relation_caches",)
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        if not model.configuration.get("vocabulary_preload"):
+            return
+
+        # the same index is used by the relations fields of the record and the draft
+        index = dependencies["relation_caches"].get("vocabulary_index")
+        if index is None:
+            return
+
+        def preload_vocabularies(app: Flask) -> None:
+            preload_vocabulary_index(app, index)
+
+        yield AddToList("api_finalizers", preload_vocabularies)
+        yield AddToList("app_finalizers", preload_vocabularies)
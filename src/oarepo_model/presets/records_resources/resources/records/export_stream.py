@@ -0,0 +1,213 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Streaming export of search results.
+
+Adds ``GET /<model>/export/<export_code>`` endpoint that serializes all records
+matching the search query (``q`` and facets, as in the search endpoint) with the
+serializer of the given export into a chunked NDJSON response, one record per line:
+
+- for JSON exports (``application/json`` and ``+json`` mimetypes) the line is the
+  exported JSON itself,
+- for other exports the line is ``{"id": <record id>, "export": <exported string>}``.
+
+Exported records are full records, the ``list_projection`` of the model is not applied.
+
+The search is paged with ``search_after`` sorted by the record ``id``, so only one
+page of records is held in memory and no deep offsets are used. A client can resume
+an interrupted export by passing the id of the last received record in the ``after``
+query argument.
+
+Model configuration:
+
+- ``export_stream_page_size``: number of records fetched from the index at once,
+  defaults to 500.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, override
+
+import marshmallow as ma
+from flask import Response, g, request, stream_with_context
+from flask_resources import request_parser, resource_requestctx, route
+from invenio_records_resources.resources.records.resource import request_search_args
+from invenio_records_resources.resources.records.utils import search_preference
+from werkzeug.exceptions import NotFound
+
+from oarepo_model.customizations import Customization, PrependMixin
+from oarepo_model.model import Dependency
+from oarepo_model.presets import Preset
+from oarepo_model.presets.records_resources.services.records.list_projection import LIST_PROJECTION_ARG
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Iterator
+
+    from flask_principal import Identity
+    from oarepo_runtime.api import Export
+
+    from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.model import InvenioModel
+
+EXPORT_STREAM_AFTER_ARG = "after"
+"""Query argument with the id of the last received record, used to resume the export."""
+
+EXPORT_STREAM_MIMETYPE = "application/x-ndjson"
+
+DEFAULT_EXPORT_STREAM_PAGE_SIZE = 500
+
+request_export_stream_view_args = request_parser({"export_code": ma.fields.Str(required=True)}, location="view_args")
+
+
+class ExportStreamServiceMixin:
+    """Record service mixin iterating over all records matching a search."""
+
+    export_stream_page_size: int = DEFAULT_EXPORT_STREAM_PAGE_SIZE
+
+    def export_stream(
+        self,
+        identity: Identity,
+        params: dict[str, Any] | None = None,
+        *,
+        after: str | None = None,
+        search_preference: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Return an iterator of record items (as dicts) matching the search, sorted by id.
+
+        The permission is checked when called, the index is queried lazily page by page.
+
+        :param after: id of the record after which the iteration starts.
+        """
+        self.require_permission(identity, "search", params=params)  # type: ignore[attr-defined]
+        params = {k: v for k, v in (params or {}).items() if k not in ("page", "size", "sort")}
+        # exported records are never projected to the list fields
+        params[LIST_PROJECTION_ARG] = "full"
+        return self._export_stream_pages(identity, params, after, search_preference)
+
+    def _export_stream_pages(
+        self,
+        identity: Identity,
+        params: dict[str, Any],
+        after: str | None,
+        search_preference: str | None,
+    ) -> Iterator[dict[str, Any]]:
+        page_size = self.export_stream_page_size
+        while True:
+            search = self._search("search", identity, dict(params), search_preference)  # type: ignore[attr-defined]
+            search = search.sort("id").extra(size=page_size, track_total_hits=False)
+            if after is not None:
+                search = search.extra(search_after=[after])
+            search_result = search.execute()
+            hits = search_result.hits
+            if not hits:
+                return
+            after = hits[-1].meta.sort[0]
+
+            result_list = self.result_list(  # type: ignore[attr-defined]
+                self,
+                identity,
+                search_result,
+                params,
+                schema=self.schema,  # type: ignore[attr-defined]
+                links_tpl=None,
+                links_item_tpl=self.links_item_tpl,  # type: ignore[attr-defined]
+                expandable_fields=self.expandable_fields,  # type: ignore[attr-defined]
+                expand=False,
+            )
+            yield from result_list.hits
+            if len(hits) < page_size:
+                return
+
+
+def is_json_mimetype(mimetype: str) -> bool:
+    """Return True if the mimetype is a JSON mimetype."""
+    return mimetype == "application/json" or mimetype.endswith("+json")
+
+
+def export_stream_lines(items: Iterable[dict[str, Any]], export: Export) -> Iterator[str]:
+    """Serialize record items with the serializer of the export to NDJSON lines."""
+    json_export = is_json_mimetype(export.mimetype)
+    for item in items:
+        serialized = export.serializer.serialize_object(item)
+        if json_export:
+            if "\n" in serialized:
+                # pretty printed, NDJSON needs a single line per record
+                serialized = json.dumps(json.loads(serialized))
+        else:
+            serialized = json.dumps({"id": item.get("id"), "export": serialized})
+        yield f"{serialized}\n"
+
+
+class ExportStreamResourceConfigMixin:
+    """Resource config mixin with the exports available for streaming."""
+
+    export_stream_route = "/export/<export_code>"
+    export_stream_exports = Dependency("exports")
+
+
+class ExportStreamResourceMixin:
+    """Record resource mixin adding the streaming export endpoint."""
+
+    config: Any
+    service: Any
+
+    def create_url_rules(self) -> list[dict[str, Any]]:
+        """Create the URL rules including the streaming export."""
+        return [
+            *super().create_url_rules(),  # type: ignore[misc]
+            route("GET", self.config.export_stream_route, self.export_stream),
+        ]
+
+    @request_search_args
+    @request_export_stream_view_args
+    def export_stream(self) -> Response:
+        """Stream all records matching the search serialized by the export."""
+        export_code = resource_requestctx.view_args["export_code"]
+        export = next((e for e in self.config.export_stream_exports if e.code == export_code), None)
+        if export is None:
+            raise NotFound(f"Export {export_code} not found.")
+
+        params = dict(resource_requestctx.args)
+        # the unknown query arguments are collected as facets
+        params["facets"] = {k: v for k, v in params.get("facets", {}).items() if k != EXPORT_STREAM_AFTER_ARG}
+        items = self.service.export_stream(
+            g.identity,
+            params,
+            after=request.args.get(EXPORT_STREAM_AFTER_ARG),
+            search_preference=search_preference(),
+        )
+        return Response(
+            stream_with_context(export_stream_lines(items, export)),
+            mimetype=EXPORT_STREAM_MIMETYPE,
+            headers={
+                "Content-Disposition": f'attachment; filename="{export_code}.ndjson"',
+            },
+        )
+
+
+class ExportStreamPreset(Preset):
+    """Preset adding the streaming export of search results."""
+
+    modifies = ("RecordService", "RecordResource", "RecordResourceConfig")
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        page_size = model.configuration.get("export_stream_page_size", DEFAULT_EXPORT_STREAM_PAGE_SIZE)
+
+        class ModelExportStreamServiceMixin(ExportStreamServiceMixin):
+            export_stream_page_size = page_size
+
+        yield PrependMixin("RecordService", ModelExportStreamServiceMixin)
+        yield PrependMixin("RecordResource", ExportStreamResourceMixin)
+        yield PrependMixin("RecordResourceConfig", ExportStreamResourceConfigMixin)
@@ -9,15 +9,23 @@
 """Signposting preset for records.
 
 Allows exporting a record item with available datacite export as linkset and JSON linkset.
+Search results are serialized to a single linkset containing the links of all records
+on the page, the output is streamed record by record. The datacite export of each model
+on the page is resolved once, before the output is streamed.
 """
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING, Any, override
 
+from flask import has_request_context, stream_with_context
 from flask_resources.serializers import BaseSerializer
 from invenio_i18n import lazy_gettext as _
+from oarepo_runtime.proxies import current_runtime
 from oarepo_runtime.resources.signposting import (
+    create_linkset,
+    create_linkset_json,
     record_dict_to_json_linkset,
     record_dict_to_linkset,
 )
@@ -26,12 +34,66 @@ from oarepo_model.customizations import AddList, AddMetadataExport, Customizatio
 from oarepo_model.presets import Preset
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable, Iterator
 
     from oarepo_model.builder import InvenioModelBuilder
     from oarepo_model.model import InvenioModel
 
 
+DATACITE_MIMETYPE = "application/vnd.datacite.datacite+json"
+
+
+def _list_hits(obj_list: dict) -> tuple[list[dict], dict[str, Any]]:
+    """Return record items of a serialized search result and the datacite exports of their schemas.
+
+    The exports are looked up once per model before the output is streamed, so that
+    a missing export fails the request (with the same ValueError as a single record)
+    instead of truncating the response.
+    """
+    hits = obj_list.get("hits", {}).get("hits", [])
+    exports: dict[str, Any] = {}
+    for hit in hits:
+        schema = hit.get("$schema")
+        if schema in exports:
+            continue
+        model = current_runtime.models_by_schema.get(schema) if schema else None
+        export = model.get_export_by_mimetype(mimetype=DATACITE_MIMETYPE) if model is not None else None
+        if export is None:
+            raise ValueError("No export found for the given mimetype or code")
+        exports[schema] = export
+    return hits, exports
+
+
+def _datacite_dict(exports: dict[str, Any], hit: dict) -> dict:
+    """Export a record item with the pre-resolved datacite export of its schema."""
+    datacite = exports[hit["$schema"]].serializer.serialize_object(hit)
+    return json.loads(datacite) if isinstance(datacite, (str, bytes)) else datacite
+
+
+def _streamed(chunks: Iterator[str]) -> Iterable[str]:
+    """Keep the request context while the response is streamed (links are created from it)."""
+    return stream_with_context(chunks) if has_request_context() else chunks
+
+
+def _linkset_list_chunks(hits: list[dict], exports: dict[str, Any]) -> Iterator[str]:
+    separator = ""
+    for hit in hits:
+        linkset = create_linkset(_datacite_dict(exports, hit), hit)
+        if linkset:
+            yield f"{separator}{linkset}"
+            separator = ", "
+
+
+def _json_linkset_list_chunks(hits: list[dict], exports: dict[str, Any]) -> Iterator[str]:
+    yield '{"linkset": ['
+    separator = ""
+    for hit in hits:
+        for context in create_linkset_json(_datacite_dict(exports, hit), hit)["linkset"]:
+            yield f"{separator}{json.dumps(context)}"
+            separator = ", "
+    yield "]}"
+
+
 class LinksetSignpostingSerializer(BaseSerializer):
     """Linkset serializer serializing record item to linkset."""
 
@@ -40,9 +102,9 @@ class LinksetSignpostingSerializer(BaseSerializer):
         """Serialize a single object according to the response ctx."""
         return record_dict_to_linkset(obj)
 
-    def serialize_object_list(self, obj_list: list) -> bool:
-        """Serialize a list of objects according to the response ctx."""
-        raise NotImplementedError  # pragma: no cover
+    def serialize_object_list(self, obj_list: dict) -> Iterable[str]:
+        """Serialize a search result to a linkset with links of all records, streamed record by record."""
+        return _streamed(_linkset_list_chunks(*_list_hits(obj_list)))
 
 
 class JSONLinksetSignpostingSerializer(BaseSerializer):
@@ -52,9 +114,9 @@ class JSONLinksetSignpostingSerializer(BaseSerializer):
         """Serialize a single record item dict to a JSON linkset. Record item is expected to have datacite export."""
         return record_dict_to_json_linkset(obj)
 
-    def serialize_object_list(self, obj_list: list) -> bool:
-        """Serialize a list of objects according to the response ctx."""
-        raise NotImplementedError  # pragma: no cover
+    def serialize_object_list(self, obj_list: dict) -> Iterable[str]:
+        """Serialize a search result to a JSON linkset with links of all records, streamed record by record."""
+        return _streamed(_json_linkset_list_chunks(*_list_hits(obj_list)))
 
 
 class SignpostingPreset(Preset):
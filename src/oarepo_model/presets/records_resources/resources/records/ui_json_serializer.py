@@ -14,16 +14,23 @@ for user interface contexts. It includes:
 - JSONUISerializerPreset: A preset that provides the JSONUISerializer class
 - JSONUISerializer: A Marshmallow-based serializer that uses the RecordUISchema
   for object serialization and outputs JSON format with UI-specific context
+
+Localized ``<field>_l10n_<format>`` values are computed only for the formats
+listed in the ``ui_l10n_formats`` model configuration (all formats if not set).
+A request can override them by the ``l10n_formats`` query argument, for example
+``?l10n_formats=medium,long``.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, override
 
+from flask import has_request_context, request
 from flask_resources import BaseListSchema, MarshmallowSerializer
 from flask_resources.serializers import JSONSerializer
 
 from oarepo_model.customizations import AddClass, Customization
+from oarepo_model.datatypes.date import l10n_formats
 from oarepo_model.presets import Preset
 
 if TYPE_CHECKING:
@@ -46,6 +53,7 @@ class JSONUISerializerPreset(Preset):
         dependencies: dict[str, Any],
     ) -> Generator[Customization]:
         runtime_dependencies = builder.get_runtime_dependencies()
+        model_l10n_formats = model.configuration.get("ui_l10n_formats")
 
         class JSONUISerializer(MarshmallowSerializer):
             """UI JSON serializer."""
@@ -59,4 +67,23 @@ class JSONUISerializerPreset(Preset):
                     schema_context={"object_key": "ui"},
                 )
 
+            @override
+            def dump_obj(self, obj: Any) -> Any:
+                """Dump the object with only the requested localized formats."""
+                with l10n_formats(get_requested_l10n_formats(model_l10n_formats)):
+                    return super().dump_obj(obj)
+
+            @override
+            def dump_list(self, obj_list: Any) -> Any:
+                """Dump the list with only the requested localized formats."""
+                with l10n_formats(get_requested_l10n_formats(model_l10n_formats)):
+                    return super().dump_list(obj_list)
+
         yield AddClass("JSONUISerializer", JSONUISerializer)
+
+
+def get_requested_l10n_formats(default: list[str] | None) -> list[str] | None:
+    """Return localized formats requested by the ``l10n_formats`` query argument or the default."""
+    if has_request_context() and (requested := request.args.get("l10n_formats")):
+        return [fmt.strip() for fmt in requested.split(",") if fmt.strip()]
+    return default
@@ -0,0 +1,343 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Projection of search results to a subset of model fields.
+
+The ``list_projection`` model configuration option is a list of record paths,
+for example ``["metadata.title", "metadata.creators.name"]``. When it is set,
+JSON and UI JSON search responses contain only these model fields (fields that
+are not part of the model, such as ``id``, ``created`` or ``links``, are always
+returned):
+
+- the search request does not fetch the other model fields from ``_source``,
+- hits are dumped by ``RecordSchema`` and ``RecordUISchema`` restricted to the
+  projected fields (marshmallow ``only``), so the other fields are not processed.
+
+The projection applies only to search requests of the REST API that are serialized
+to JSON or UI JSON, both of published records and of drafts (``DraftListProjectionPreset``).
+Service calls outside of a resource request, exports and ``?projection=full`` requests
+return full records.
+
+Model fields are excluded from ``_source`` (``_source.excludes``) rather than
+listing the kept fields in ``_source.includes``, because the set of non-model fields
+depends on other presets (drafts, files, parent records, ...).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import weakref
+from typing import TYPE_CHECKING, Any, override
+
+import marshmallow
+from flask import g, has_app_context, has_request_context, request
+from invenio_records_resources.services.records.params.base import ParamInterpreter
+from invenio_records_resources.services.records.schema import ServiceSchemaWrapper
+
+from oarepo_model.customizations import Customization, PrependMixin
+from oarepo_model.datatypes.base import ARRAY_ITEM_PATH
+from oarepo_model.datatypes.collections import ObjectDataType
+from oarepo_model.presets import Preset
+from oarepo_model.utils import convert_to_python_identifier
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from flask_principal import Identity
+    from invenio_search.api import RecordsSearchV2
+
+    from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.datatypes.base import DataType
+    from oarepo_model.model import InvenioModel
+
+LIST_PROJECTION_ARG = "projection"
+"""Query argument, ``?projection=full`` disables the projection for a request.
+
+Service calls disable the projection of their search by ``"projection": "full"`` in search params."""
+
+SYSTEM_FIELDS = frozenset(
+    {"id", "pid", "uuid", "version_id", "created", "updated", "$schema", "indexed_at", "expires_at"},
+)
+"""Top-level fields needed to load and link records, never projected out."""
+
+LIST_PROJECTION_MIMETYPES = frozenset({"application/json", "application/vnd.inveniordm.v1+json"})
+"""Response mimetypes of search requests that are projected."""
+
+
+def is_list_projection_requested() -> bool:
+    """Return True if the current request is a REST API request for a projected JSON response."""
+    if not has_app_context() or not has_request_context():
+        return False
+    resource_requestctx = getattr(g, "resource_requestctx", None)
+    if resource_requestctx is None or resource_requestctx.accept_mimetype not in LIST_PROJECTION_MIMETYPES:
+        return False
+    return request.args.get(LIST_PROJECTION_ARG) != "full"
+
+
+@dataclasses.dataclass(frozen=True)
+class ListProjection:
+    """Projection of model fields computed from the type tree."""
+
+    schema_only: frozenset[str]
+    """Projected dotted field names of the record schema."""
+
+    schema_model_fields: frozenset[str]
+    """Top-level field names of the record schema that come from the model."""
+
+    ui_schema_only: frozenset[str]
+    """Projected dotted field names of the record UI schema."""
+
+    ui_schema_model_fields: frozenset[str]
+    """Top-level field names of the record UI schema that come from the model."""
+
+    source_excludes: tuple[str, ...]
+    """Paths of model fields not fetched from the index."""
+
+    def get_only(self, schema_cls: type[marshmallow.Schema], *, ui: bool) -> set[str]:
+        """Return marshmallow ``only`` for a schema: all non-model fields and projected model fields."""
+        model_fields = self.ui_schema_model_fields if ui else self.schema_model_fields
+        only = self.ui_schema_only if ui else self.schema_only
+        declared = schema_cls._declared_fields  # noqa: SLF001 marshmallow declared fields
+        return {name for name in declared if name not in model_fields} | {
+            path for path in only if path.split(".", 1)[0] in declared
+        }
+
+
+class _Node:
+    """Node of the model type tree, merged from all elements at the same path."""
+
+    def __init__(self) -> None:
+        self.elements: list[tuple[DataType, dict[str, Any]]] = []
+        self.children: dict[str, _Node] = {}
+
+    def child(self, key: str) -> _Node:
+        return self.children.setdefault(key, _Node())
+
+    @property
+    def is_object(self) -> bool:
+        return bool(self.children) and any(isinstance(datatype, ObjectDataType) for datatype, _ in self.elements)
+
+    def items(self) -> _Node:
+        """Skip arrays, return the node of the (innermost) array item."""
+        node = self
+        while ARRAY_ITEM_PATH in node.children:
+            node = node.children[ARRAY_ITEM_PATH]
+        return node
+
+
+def _type_tree(builder: InvenioModelBuilder, schema_type: Any) -> _Node:
+    if isinstance(schema_type, (str, dict)):
+        datatype = builder.type_registry.get_type(schema_type)
+        element = {} if isinstance(schema_type, str) else schema_type
+    else:
+        datatype, element = schema_type, {}
+    root = _Node()
+
+    def visitor(dt: DataType, path: list[str], el: dict[str, Any]) -> None:
+        node = root
+        for key in path:
+            node = node.child(key)
+        node.elements.append((dt, el))
+
+    datatype.visit(element, [], visitor)
+    return root
+
+
+def get_list_projection(builder: InvenioModelBuilder, model: InvenioModel, paths: Iterable[str]) -> ListProjection:
+    """Compute the projection of the model to the given record paths.
+
+    :raises ValueError: if a path does not exist in the model.
+    """
+    root = _Node()
+    if model.record_type is not None:
+        root = _type_tree(builder, model.record_type)
+    if model.metadata_type is not None:
+        root.children["metadata"] = _type_tree(builder, model.metadata_type)
+    for key in SYSTEM_FIELDS:
+        root.children.pop(key, None)
+
+    schema_only: set[str] = set()
+    ui_schema_only: set[str] = set()
+    kept: set[tuple[str, ...]] = set()
+    for path in paths:
+        parts = path.split(".")
+        node = root
+        schema_path: list[str] = []
+        ui_path: list[str] = []
+        for idx, key in enumerate(parts):
+            if key not in node.children:
+                raise ValueError(f"List projection path {path} does not exist in model {model.name}.")
+            node = node.children[key].items()
+            kept.add(tuple(parts[: idx + 1]))
+            schema_path.append(convert_to_python_identifier(key))
+            if not node.is_object or idx == len(parts) - 1:
+                # leaf or not projectable deeper (polymorphic, dynamic, ...): take the whole field
+                ui_names = {
+                    name
+                    for datatype, element in node.elements
+                    for name in datatype.create_ui_marshmallow_fields(key, element)
+                } or {key}
+                ui_schema_only.update(".".join([*ui_path, name]) for name in ui_names)
+                break
+            ui_path.append(key)
+        schema_only.add(".".join(schema_path))
+
+    return ListProjection(
+        schema_only=frozenset(schema_only),
+        schema_model_fields=frozenset(convert_to_python_identifier(key) for key in root.children),
+        ui_schema_only=frozenset(ui_schema_only),
+        ui_schema_model_fields=frozenset(
+            name
+            for key, child in root.children.items()
+            for datatype, element in child.elements
+            for name in datatype.create_ui_marshmallow_fields(key, element)
+        )
+        | frozenset(root.children),
+        source_excludes=tuple(_source_excludes(root, (), kept)),
+    )
+
+
+def _source_excludes(node: _Node, path: tuple[str, ...], kept: set[tuple[str, ...]]) -> Iterable[str]:
+    for key, child in node.children.items():
+        child_path = (*path, key)
+        if child_path not in kept:
+            yield ".".join(child_path)
+            # dynamic sibling fields (see DataType.create_dynamic_mapping) are dumped to the index as well
+            for datatype, element in child.elements:
+                for sibling in datatype.create_dynamic_mapping(key, element):
+                    yield ".".join((*path, sibling))
+            continue
+        if any(k[: len(child_path)] == child_path and len(k) > len(child_path) for k in kept):
+            yield from _source_excludes(child.items(), child_path, kept)
+
+
+class ListProjectionParam(ParamInterpreter):
+    """Do not fetch model fields that are not in the list projection."""
+
+    list_projection: ListProjection
+
+    @override
+    def apply(self, identity: Identity, search: RecordsSearchV2, params: dict[str, Any]) -> RecordsSearchV2:
+        if (
+            self.list_projection.source_excludes
+            and params.get(LIST_PROJECTION_ARG) != "full"
+            and is_list_projection_requested()
+        ):
+            search = search.source(excludes=list(self.list_projection.source_excludes))
+        return search
+
+
+class ListProjectionSearchOptionsMixin:
+    """Search options mixin adding ``ListProjectionParam`` to params interpreters."""
+
+    list_projection_param_cls: type[ListProjectionParam]
+
+    def build_params_interpreters_cls(self) -> list[Any]:
+        """Return params interpreters with the list projection, computed once per search options class."""
+        return [*super().build_params_interpreters_cls(), self.list_projection_param_cls]  # type: ignore[misc]
+
+
+_list_projection_schemas: weakref.WeakKeyDictionary[Any, ServiceSchemaWrapper] = weakref.WeakKeyDictionary()
+
+
+class ListProjectionRecordListMixin:
+    """Result list mixin dumping hits of projected searches with the projected record schema."""
+
+    list_projection: ListProjection
+
+    _schema: Any
+
+    def __init__(self, service: Any, identity: Identity, results: Any, params: Any = None, **kwargs: Any):
+        """Use the projected schema for hits of a search (that is, if there are search params)."""
+        super().__init__(service, identity, results, params, **kwargs)  # type: ignore[call-arg]
+        if params is not None and kwargs.get("schema") is None and is_list_projection_requested():
+            self._schema = self.get_list_projection_schema(service)
+
+    def get_list_projection_schema(self, service: Any) -> ServiceSchemaWrapper:
+        """Return the projected schema of a service, created once per service."""
+        try:
+            return _list_projection_schemas[service]
+        except KeyError:
+            pass
+        schema_cls = service.config.schema
+        only = self.list_projection.get_only(schema_cls, ui=False)
+        wrapper = ServiceSchemaWrapper(service, schema_cls)
+        wrapper.schema = schema_cls(only=only)
+        _list_projection_schemas[service] = wrapper
+        return wrapper
+
+
+class ListProjectionUISerializerMixin:
+    """UI serializer mixin dumping search results with the projected UI schema."""
+
+    list_projection: ListProjection
+
+    @property
+    def list_schema(self) -> Any:
+        """Return the projected list schema if the projection is requested, the list schema otherwise."""
+        list_schema = self.__dict__.get("list_schema")
+        if list_schema is None or not is_list_projection_requested():
+            return list_schema
+        projected = self.__dict__.get("_projected_list_schema")
+        if projected is None:
+            projected = self.__dict__["_projected_list_schema"] = self._create_projected_list_schema(list_schema)
+        return projected
+
+    @list_schema.setter
+    def list_schema(self, value: Any) -> None:
+        self.__dict__["list_schema"] = value
+        self.__dict__.pop("_projected_list_schema", None)
+
+    def _create_projected_list_schema(self, list_schema: Any) -> Any:
+        object_schema_cls = list_schema.object_schema_cls
+        only = self.list_projection.get_only(object_schema_cls, ui=True)
+
+        class ProjectedUISchema(object_schema_cls):  # type: ignore[valid-type,misc]
+            def __init__(self, *args: Any, **kwargs: Any):
+                kwargs.setdefault("only", only)
+                super().__init__(*args, **kwargs)
+
+        context = getattr(list_schema, "context", None)
+        return type(list_schema)(
+            object_schema_cls=ProjectedUISchema,
+            **({"context": context} if context else {}),
+        )
+
+
+class ListProjectionPreset(Preset):
+    """Preset projecting search results if ``list_projection`` is configured in the model."""
+
+    modifies = ("RecordSearchOptions", "RecordList", "JSONUISerializer")
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        paths = model.configuration.get("list_projection")
+        if not paths:
+            return
+        projection = get_list_projection(builder, model, paths)
+
+        class ModelListProjectionParam(ListProjectionParam):
+            list_projection = projection
+
+        class ModelListProjectionSearchOptionsMixin(ListProjectionSearchOptionsMixin):
+            list_projection_param_cls = ModelListProjectionParam
+
+        class ModelListProjectionRecordListMixin(ListProjectionRecordListMixin):
+            list_projection = projection
+
+        class ModelListProjectionUISerializerMixin(ListProjectionUISerializerMixin):
+            list_projection = projection
+
+        yield PrependMixin("RecordSearchOptions", ModelListProjectionSearchOptionsMixin)
+        yield PrependMixin("RecordList", ModelListProjectionRecordListMixin)
+        yield PrependMixin("JSONUISerializer", ModelListProjectionUISerializerMixin)
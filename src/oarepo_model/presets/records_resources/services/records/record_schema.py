@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Any, cast, override
 import marshmallow
 from invenio_records_resources.services.records.schema import BaseRecordSchema
 
+from oarepo_model.compiled_schema import CompiledSchemaMixin
 from oarepo_model.customizations import AddClass, Customization, PrependMixin
 from oarepo_model.datatypes.collections import ObjectDataType
 from oarepo_model.presets import Preset
@@ -57,6 +58,10 @@ class RecordSchemaPreset(Preset):
                 get_marshmallow_schema(builder, model.record_type),
             )
 
+        if model.configuration.get("compiled_schemas"):
+            # load and dump through compiled closures, falling back to marshmallow
+            yield PrependMixin("RecordSchema", CompiledSchemaMixin)
+
 
 def get_marshmallow_schema(
     builder: InvenioModelBuilder,
@@ -6,16 +6,30 @@
 # oarepo-model is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 #
-"""Module to generate record search options class."""
+"""Module to generate record search options class.
+
+Facets of the generated search options are evaluated by ``PrunedGroupedFacetsParam``.
+A search request can ask for a single facet group by the ``facet_group`` query
+argument, for example ``?facet_group=curator``. Only aggregations of facets in
+that group (and of facets with an active filter) are then sent to OpenSearch.
+
+Facets inside the same ``nested`` field share a single nested aggregation with
+one sub-aggregation per facet. The response is split back per facet, so the
+public facet structure is the same as with one nested aggregation per facet.
+"""
 
 from __future__ import annotations
 
+import copy
 import inspect
 from typing import TYPE_CHECKING, Any, override
 
 from invenio_records_resources.services.records.config import SearchOptions
+from invenio_records_resources.services.records.facets import FacetsResponse
 from invenio_records_resources.services.records.params.facets import FacetsParam
 from invenio_records_resources.services.records.queryparser import QueryParser
+from invenio_search.engine import dsl
+from oarepo_runtime.services.facets.nested_facet import NestedLabeledFacet
 from oarepo_runtime.services.facets.params import GroupedFacetsParam
 from oarepo_runtime.services.queryparsers.transformer import (
     SearchQueryValidator,
@@ -25,7 +39,11 @@ from oarepo_model.customizations import AddClass, Customization
 from oarepo_model.presets import Preset
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
+
+    from flask_principal import Identity
+    from invenio_records_resources.services.records.facets.facets import TermsFacet
+    from invenio_search.api import RecordsSearchV2
 
     from oarepo_model.builder import InvenioModelBuilder
     from oarepo_model.model import InvenioModel
@@ -35,6 +53,180 @@ from oarepo_model.customizations import (
 )
 from oarepo_model.model import Dependency, InvenioModel, ModelMixin
 
+FACET_GROUP_PARAM = "facet_group"
+"""Query argument selecting the facet group whose aggregations are computed."""
+
+
+def get_facet_group_facets(
+    facets: dict[str, TermsFacet],
+    facet_groups: dict[str, Iterable[str]],
+) -> dict[str, dict[str, TermsFacet]]:
+    """Return facets of each facet group.
+
+    Used as a transform of the ``facet_group_facets`` dependency of the generated search
+    options, so that the mapping is computed once per search options class.
+    """
+    return {group: {name: facets[name] for name in names} for group, names in facet_groups.items()}
+
+
+MERGED_NESTED_AGGREGATION_PREFIX = "__nested__"
+"""Prefix of names of nested aggregations shared by several facets."""
+
+
+def get_merged_nested_facets(facets: dict[str, Any]) -> dict[str, list[str]]:
+    """Group names of nested facets by their nested path.
+
+    Only paths shared by at least two facets are returned.
+    """
+    by_path: dict[str, list[str]] = {}
+    for name, facet in facets.items():
+        if type(facet) is NestedLabeledFacet:
+            by_path.setdefault(facet._path, []).append(name)  # noqa: SLF001 - path of the runtime facet
+    return {path: names for path, names in by_path.items() if len(names) > 1}
+
+
+class MergedNestedFacetsResponse(FacetsResponse):
+    """Facets response that splits shared nested aggregations back per facet."""
+
+    _merged_facets: dict[str, str] = {}  # noqa: RUF012 - set per request in create_response_cls
+
+    @classmethod
+    def create_merged_response_cls(cls, facets_param: Any, merged_facets: dict[str, str]) -> type[FacetsResponse]:
+        """Create response class for a request, ``merged_facets`` maps facet name to aggregation name."""
+        response_cls = cls.create_response_cls(facets_param)
+        response_cls._merged_facets = merged_facets  # noqa: SLF001
+        return response_cls
+
+    def _iter_facets(self) -> Any:
+        for name, facet in self._facets_param.facets.items():  # type: ignore[attr-defined]
+            aggregation_name = self._merged_facets.get(name)
+            if aggregation_name is None:
+                data = getattr(self.aggregations, name)
+            else:
+                # the same shape as a nested aggregation of a single facet
+                merged = getattr(self.aggregations, aggregation_name)
+                data = dsl.AttrDict({"doc_count": merged.doc_count, "inner": getattr(merged, name)})
+            yield name, facet, data, self._facets_param.selected_values.get(name, [])  # type: ignore[attr-defined]
+
+
+class PrunedGroupedFacetsParam(GroupedFacetsParam):
+    """Grouped facets that aggregate only the facets of the requested facet group.
+
+    Without the ``facet_group`` argument the behaviour is the same as of
+    ``GroupedFacetsParam``. With it, aggregations are restricted to the facets
+    of the group that are available to the identity, plus all facets that
+    have an active filter, so that the selected values stay visible.
+    """
+
+    requested_facet_group: str | None = None
+
+    @property
+    @override
+    def facet_groups(self) -> dict[str, Any] | None:
+        facet_groups = getattr(self.config, "facet_groups", None)
+        if facet_groups is None:
+            return None
+        precomputed = getattr(self.config, "facet_group_facets", None)
+        if precomputed is not None:
+            return precomputed
+        return get_facet_group_facets(self.config.facets, facet_groups)
+
+    @override
+    def identity_facets(self, identity: Identity) -> dict[str, TermsFacet]:
+        user_facets = super().identity_facets(identity)
+        if self.requested_facet_group is None:
+            return user_facets
+        group_facets = (self.facet_groups or {}).get(self.requested_facet_group)
+        if group_facets is None:
+            return user_facets
+        return {name: facet for name, facet in user_facets.items() if name in group_facets or name in self._filters}
+
+    @override
+    def aggregate_with_user_facets(
+        self,
+        search: RecordsSearchV2,
+        user_facets: dict[str, TermsFacet],
+    ) -> RecordsSearchV2:
+        merged_nested = get_merged_nested_facets(user_facets)
+        merged_names = {name for names in merged_nested.values() for name in names}
+        for name, facet in user_facets.items():
+            if name not in merged_names:
+                search.aggs.bucket(name, facet.get_aggregation())
+        for path, names in merged_nested.items():
+            nested = search.aggs.bucket(f"{MERGED_NESTED_AGGREGATION_PREFIX}{path}", "nested", path=path)
+            for name in names:
+                nested.bucket(name, user_facets[name]._inner.get_aggregation())  # type: ignore[attr-defined] # noqa: SLF001
+        return search
+
+    @override
+    def apply(self, identity: Identity, search: RecordsSearchV2, params: dict) -> RecordsSearchV2:
+        facets_values = params.pop("facets", {})
+        if FACET_GROUP_PARAM not in self.facets and FACET_GROUP_PARAM in facets_values:
+            requested = facets_values.pop(FACET_GROUP_PARAM)
+            if isinstance(requested, (list, tuple)):
+                requested = requested[0] if requested else None
+            self.requested_facet_group = requested or None
+
+        for name, values in facets_values.items():
+            if name in self.facets:
+                self.add_filter(name, values)
+
+        user_facets = self.identity_facets(identity)
+        self_copy = copy.copy(self)
+        self_copy._facets = user_facets  # noqa: SLF001 - align response facets with aggregations
+        merged_facets = {
+            name: f"{MERGED_NESTED_AGGREGATION_PREFIX}{path}"
+            for path, names in get_merged_nested_facets(user_facets).items()
+            for name in names
+        }
+        search = search.response_class(
+            MergedNestedFacetsResponse.create_merged_response_cls(self_copy, merged_facets),
+        )
+
+        search = self.aggregate_with_user_facets(search, user_facets)
+        search = self.filter(search)
+
+        params.update(self.selected_values)
+        return search
+
+
+def with_grouped_facets_param(interpreter_classes: Iterable[Any]) -> list[Any]:
+    """Return a copy of the interpreter chain with FacetsParam replaced by PrunedGroupedFacetsParam."""
+    # make a copy of the list
+    interpreter_classes = list(interpreter_classes)
+    # replace FacetsParam with PrunedGroupedFacetsParam
+    for idx, clazz in enumerate(interpreter_classes):
+        if inspect.isclass(clazz) and issubclass(clazz, FacetsParam):
+            interpreter_classes[idx] = PrunedGroupedFacetsParam
+            break
+    else:
+        # could not find, insert at the start
+        interpreter_classes.insert(0, PrunedGroupedFacetsParam)
+    return interpreter_classes
+
+
+class GroupedFacetsSearchOptionsMixin:
+    """Search options mixin replacing ``FacetsParam`` with ``PrunedGroupedFacetsParam``.
+
+    The chain of params interpreters is computed once per search options class (each
+    subclass gets its own) and returned as a tuple, so that it can not be modified.
+    Mixins extending the chain override ``build_params_interpreters_cls``.
+    """
+
+    @property
+    def params_interpreters_cls(self) -> tuple[Any, ...]:
+        """Return params interpreters of the search options class."""
+        cls = type(self)
+        cached = cls.__dict__.get("_cached_params_interpreters_cls")
+        if cached is None:
+            cached = tuple(self.build_params_interpreters_cls())
+            cls._cached_params_interpreters_cls = cached  # type: ignore[attr-defined]
+        return cached
+
+    def build_params_interpreters_cls(self) -> list[Any]:
+        """Compute params interpreters of the search options class."""
+        return with_grouped_facets_param(super().params_interpreters_cls)  # type: ignore[misc]
+
 
 class RecordSearchOptionsPreset(Preset):
     """Preset for record search options class."""
@@ -50,24 +242,10 @@ class RecordSearchOptionsPreset(Preset):
     ) -> Generator[Customization]:
         yield AddDictionary("FacetGroups", {}, exists_ok=True)
 
-        class RecordSearchOptionsMixin(ModelMixin):
+        class RecordSearchOptionsMixin(GroupedFacetsSearchOptionsMixin, ModelMixin):
             facets = Dependency("RecordFacets")
             facet_groups = Dependency("FacetGroups")
-
-            @property
-            def params_interpreters_cls(self) -> Any:
-                interpreter_classes = super().params_interpreters_cls  # type: ignore[misc]
-                # make a copy of the list
-                interpreter_classes = list(interpreter_classes)
-                # replace FacetsParam with GroupedFacetsParam
-                for idx, clazz in enumerate(interpreter_classes):
-                    if inspect.isclass(clazz) and issubclass(clazz, FacetsParam):
-                        interpreter_classes[idx] = GroupedFacetsParam
-                        break
-                else:
-                    # could not find, insert at the start
-                    interpreter_classes.insert(0, GroupedFacetsParam)
-                return interpreter_classes
+            facet_group_facets = Dependency("RecordFacets", "FacetGroups", transform=get_facet_group_facets)
 
             query_parser_cls = staticmethod(
                 QueryParser.factory(
@@ -35,6 +35,7 @@ from marshmallow_utils.fields import FormatDate
 
 from oarepo_model.customizations import AddClass, Customization, PrependMixin
 from oarepo_model.datatypes.collections import ObjectDataType
+from oarepo_model.datatypes.date import lazy_l10n_field_class
 from oarepo_model.presets import Preset
 
 if TYPE_CHECKING:
@@ -44,21 +45,25 @@ if TYPE_CHECKING:
     from oarepo_model.model import InvenioModel
 
 
+LazyFormatDate = lazy_l10n_field_class(FormatDate)
+"""FormatDate formatted only if its format is requested, see ``l10n_formats``."""
+
+
 class InvenioRecordUISchema(BaseObjectSchema):
     """UI schema for Invenio records.
 
     This schema should be RDM compatible on the top-level fields.
     """
 
-    created_date_l10n_short = FormatDate(attribute="created", format="short")
-    created_date_l10n_medium = FormatDate(attribute="created", format="medium")
-    created_date_l10n_long = FormatDate(attribute="created", format="long")
-    created_date_l10n_full = FormatDate(attribute="created", format="full")
+    created_date_l10n_short = LazyFormatDate(attribute="created", format="short")
+    created_date_l10n_medium = LazyFormatDate(attribute="created", format="medium")
+    created_date_l10n_long = LazyFormatDate(attribute="created", format="long")
+    created_date_l10n_full = LazyFormatDate(attribute="created", format="full")
 
-    updated_date_l10n_short = FormatDate(attribute="updated", format="short")
-    updated_date_l10n_medium = FormatDate(attribute="updated", format="medium")
-    updated_date_l10n_long = FormatDate(attribute="updated", format="long")
-    updated_date_l10n_full = FormatDate(attribute="updated", format="full")
+    updated_date_l10n_short = LazyFormatDate(attribute="updated", format="short")
+    updated_date_l10n_medium = LazyFormatDate(attribute="updated", format="medium")
+    updated_date_l10n_long = LazyFormatDate(attribute="updated", format="long")
+    updated_date_l10n_full = LazyFormatDate(attribute="updated", format="full")
 
     # TODO: custom fields
 
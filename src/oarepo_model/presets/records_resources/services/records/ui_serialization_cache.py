@@ -0,0 +1,288 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Cache of UI serializations of records.
+
+The UI representation of a record (vocabulary titles, localized dates, ...)
+depends only on the record revision, the locale and the UI schema, so it can be
+cached. The cache is enabled by the ``ui_serialization_cache`` model
+configuration option, which can be:
+
+- ``"memory"`` for a per-process LRU cache,
+- ``"redis"`` for a cache in redis at ``CACHE_REDIS_URL``,
+- an instance of ``UISerializationCache`` (for example ``RedisUISerializationCache``
+  with a custom client).
+
+Cached values are keyed by ``(model, record id, revision_id, locale, ui schema
+fingerprint)`` and all entries of a record are dropped when the record is
+updated or deleted through the service.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, override
+
+import marshmallow
+from flask import current_app
+from flask_babel import get_locale
+from invenio_records_resources.services.records.components import ServiceComponent
+
+from oarepo_model.customizations import AddToList, Customization, PrependMixin
+from oarepo_model.datatypes.date import get_l10n_formats
+from oarepo_model.presets import Preset
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from oarepo_model.builder import InvenioModelBuilder
+    from oarepo_model.model import InvenioModel
+
+
+class UISerializationCache:
+    """Base class of UI serialization cache backends.
+
+    Values are JSON strings stored under a record key (all entries of a single
+    record) and a variant key (revision, locale, ...) so that a whole record can
+    be invalidated at once.
+    """
+
+    def get(self, record_key: str, variant_key: str) -> str | None:
+        """Return the cached value or None."""
+        raise NotImplementedError  # pragma: no cover
+
+    def set(self, record_key: str, variant_key: str, value: str) -> None:
+        """Store a value."""
+        raise NotImplementedError  # pragma: no cover
+
+    def invalidate(self, record_key: str) -> None:
+        """Remove all values of a record."""
+        raise NotImplementedError  # pragma: no cover
+
+
+class MemoryUISerializationCache(UISerializationCache):
+    """Per-process LRU cache bounded by the number of records."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Create the cache holding at most ``maxsize`` records."""
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, dict[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @override
+    def get(self, record_key: str, variant_key: str) -> str | None:
+        with self._lock:
+            variants = self._entries.get(record_key)
+            if variants is None:
+                return None
+            self._entries.move_to_end(record_key)
+            return variants.get(variant_key)
+
+    @override
+    def set(self, record_key: str, variant_key: str, value: str) -> None:
+        with self._lock:
+            self._entries.setdefault(record_key, {})[variant_key] = value
+            self._entries.move_to_end(record_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    @override
+    def invalidate(self, record_key: str) -> None:
+        with self._lock:
+            self._entries.pop(record_key, None)
+
+
+class RedisUISerializationCache(UISerializationCache):
+    """Cache in a redis-compatible store, one hash per record.
+
+    :param client: redis-compatible client (``hget``, ``hset``, ``expire``, ``delete``).
+                   If not set, a client for ``CACHE_REDIS_URL`` is created on first use.
+    :param ttl: time to live of the cached record in seconds.
+    """
+
+    def __init__(self, client: Any = None, ttl: int = 3600, prefix: str = "oarepo-ui:"):
+        """Create the cache."""
+        self._client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    @property
+    def client(self) -> Any:
+        """Return the redis client."""
+        if self._client is None:
+            import redis
+
+            self._client = redis.StrictRedis.from_url(current_app.config["CACHE_REDIS_URL"])
+        return self._client
+
+    @override
+    def get(self, record_key: str, variant_key: str) -> str | None:
+        value = self.client.hget(self.prefix + record_key, variant_key)
+        if isinstance(value, bytes):
+            return value.decode("utf-8")
+        return value
+
+    @override
+    def set(self, record_key: str, variant_key: str, value: str) -> None:
+        key = self.prefix + record_key
+        self.client.hset(key, variant_key, value)
+        self.client.expire(key, self.ttl)
+
+    @override
+    def invalidate(self, record_key: str) -> None:
+        self.client.delete(self.prefix + record_key)
+
+
+def get_ui_serialization_cache(config: Any) -> UISerializationCache | None:
+    """Create the cache backend from the ``ui_serialization_cache`` configuration value."""
+    if not config:
+        return None
+    if isinstance(config, UISerializationCache):
+        return config
+    if config == "memory" or config is True:
+        return MemoryUISerializationCache()
+    if config == "redis":
+        return RedisUISerializationCache()
+    raise ValueError(f"Unknown ui_serialization_cache value {config!r}, expected 'memory', 'redis' or a backend.")
+
+
+def schema_fingerprint(schema: type[marshmallow.Schema] | marshmallow.Schema) -> str:
+    """Return a hash of the structure of a schema, including nested schemas."""
+    parts: list[str] = []
+    _collect_schema_parts(schema if isinstance(schema, type) else type(schema), parts, set())
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _collect_schema_parts(schema_cls: type[marshmallow.Schema], parts: list[str], seen: set[type]) -> None:
+    if schema_cls in seen:
+        return
+    seen.add(schema_cls)
+    parts.append(f"{schema_cls.__module__}.{schema_cls.__qualname__}")
+    for name, field in sorted(schema_cls._declared_fields.items()):  # noqa: SLF001 marshmallow declared fields
+        _collect_field_parts(name, field, parts, seen)
+
+
+def _collect_field_parts(name: str, field: marshmallow.fields.Field, parts: list[str], seen: set[type]) -> None:
+    field_cls = type(field)
+    parts.append(f"{name}:{field_cls.__module__}.{field_cls.__qualname__}:{field.attribute}:{field.data_key}")
+    if isinstance(field, marshmallow.fields.Nested):
+        nested = field.nested
+        if callable(nested) and not isinstance(nested, type):
+            nested = nested()
+        if isinstance(nested, marshmallow.Schema):
+            nested = type(nested)
+        if isinstance(nested, type) and issubclass(nested, marshmallow.Schema):
+            _collect_schema_parts(nested, parts, seen)
+    elif isinstance(field, marshmallow.fields.List):
+        _collect_field_parts(f"{name}[]", field.inner, parts, seen)
+
+
+class UISerializationCacheMixin(marshmallow.Schema):
+    """UI schema mixin caching the serialized fields of each record.
+
+    Only field serialization is cached, post-dump processors still run on every dump.
+    """
+
+    ui_serialization_cache: UISerializationCache
+    ui_serialization_cache_model: str
+
+    _fingerprint: str | None = None
+
+    @classmethod
+    def ui_cache_record_key(cls, obj: Any) -> str | None:
+        """Return the record key of an object, None if it can not be cached."""
+        if not isinstance(obj, dict) or obj.get("id") is None or obj.get("revision_id") is None:
+            return None
+        return f"{cls.ui_serialization_cache_model}:{obj['id']}"
+
+    def ui_cache_variant_key(self, obj: dict[str, Any]) -> str:
+        """Return the variant key of the serialization of the object."""
+        fingerprint = type(self)._fingerprint  # noqa: SLF001 - class level cache
+        if fingerprint is None:
+            fingerprint = type(self)._fingerprint = schema_fingerprint(self)
+        formats = get_l10n_formats()
+        return ":".join(
+            (
+                str(obj["revision_id"]),
+                "draft" if obj.get("is_draft") else "record",
+                "expanded" if "expanded" in obj else "",
+                str(get_locale() or ""),
+                ",".join(sorted(formats)) if formats is not None else "*",
+                fingerprint,
+            ),
+        )
+
+    @override
+    def _serialize(self, obj: Any, *, many: bool = False) -> Any:
+        record_key = None if many or self.only or self.exclude else self.ui_cache_record_key(obj)
+        if record_key is None:
+            return super()._serialize(obj, many=many)  # type: ignore[misc]
+
+        cache = self.ui_serialization_cache
+        variant_key = self.ui_cache_variant_key(obj)
+        cached = cache.get(record_key, variant_key)
+        if cached is not None:
+            return json.loads(cached)
+
+        ret = super()._serialize(obj, many=many)  # type: ignore[misc]
+        try:
+            serialized = json.dumps(ret)
+        except TypeError, ValueError:
+            return ret  # not json serializable, do not cache
+        cache.set(record_key, variant_key, serialized)
+        return ret
+
+
+class UISerializationCacheComponent(ServiceComponent):
+    """Service component dropping cached UI serializations of modified records."""
+
+    ui_serialization_cache: UISerializationCache
+    ui_serialization_cache_model: str
+
+    def _invalidate(self, record: Any) -> None:
+        if record is not None and record.get("id") is not None:
+            self.ui_serialization_cache.invalidate(f"{self.ui_serialization_cache_model}:{record['id']}")
+
+    def update(self, identity: Any, *, record: Any = None, **kwargs: Any) -> None:  # noqa: ARG002
+        """Invalidate the record on update."""
+        self._invalidate(record)
+
+    def delete(self, identity: Any, *, record: Any = None, **kwargs: Any) -> None:  # noqa: ARG002
+        """Invalidate the record on delete."""
+        self._invalidate(record)
+
+
+class UISerializationCachePreset(Preset):
+    """Preset enabling the UI serialization cache if configured in the model."""
+
+    modifies = ("RecordUISchema", "record_service_components")
+
+    @override
+    def apply(
+        self,
+        builder: InvenioModelBuilder,
+        model: InvenioModel,
+        dependencies: dict[str, Any],
+    ) -> Generator[Customization]:
+        cache = get_ui_serialization_cache(model.configuration.get("ui_serialization_cache"))
+        if cache is None:
+            return
+
+        class ModelUISerializationCacheMixin(UISerializationCacheMixin):
+            ui_serialization_cache = cache
+            ui_serialization_cache_model = model.name
+
+        class ModelUISerializationCacheComponent(UISerializationCacheComponent):
+            ui_serialization_cache = cache
+            ui_serialization_cache_model = model.name
+
+        yield PrependMixin("RecordUISchema", ModelUISerializationCacheMixin)
+        yield AddToList("record_service_components", ModelUISerializationCacheComponent)
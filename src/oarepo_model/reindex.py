@@ -0,0 +1,289 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Bulk reindexing of records of a generated model.
+
+The generic invenio reindex goes through the service and indexes one record at a
+time. ``ModelReindexer`` streams record ids from the database in chunks (keyset
+pagination by id, so memory does not grow with the number of records), loads each
+chunk with one query, resolves the relations of the whole chunk in bulk (see
+``prefetch_relations``) and dumps the records with the model's dumper. With ``workers``
+set, the chunks are dumped in a pool of forked processes, each with its own application
+context and database session. The bulk requests are sent to the search cluster from a
+thread pool, so that dumping the next chunks overlaps with indexing the previous ones.
+
+After each chunk has been indexed, the id of its last record is written to the checkpoint
+file, and a reindex started with the same checkpoint continues after it. Chunks are
+checkpointed in their order, regardless of the order in which they were dumped or sent.
+The checkpoint does not move past a chunk with failed records, so a resumed reindex
+retries them; ids of the failed records are collected in the statistics.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import json
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from flask import current_app
+from invenio_db import db
+
+from oarepo_model.presets.records_resources.records.batched_relations import prefetch_relations
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from types import SimpleNamespace
+
+    from flask import Flask
+    from invenio_records.api import Record
+
+ChunkDumper = Callable[[list[Any]], list[dict[str, Any]]]
+"""Loads records of a chunk of ids and dumps them to bulk index actions."""
+
+
+class BulkSender(Protocol):
+    """Sends a list of bulk actions to the search cluster, returns ids of the failed actions."""
+
+    def __call__(self, actions: list[dict[str, Any]]) -> list[str]:
+        """Send the actions."""
+        ...
+
+
+def search_bulk_sender() -> BulkSender:
+    """Return a sender that uses the bulk API of the current search client."""
+    from invenio_search import current_search_client
+    from opensearchpy.helpers import bulk
+
+    # the threads of the pool do not have the application context
+    client = current_search_client._get_current_object()  # noqa: SLF001
+
+    def send(actions: list[dict[str, Any]]) -> list[str]:
+        _, errors = bulk(client, actions, raise_on_error=False, raise_on_exception=False)
+        # each error is {<op type>: {"_id": ..., "error": ...}}
+        return [str(info.get("_id")) for error in errors for info in error.values()]
+
+    return send
+
+
+@dataclasses.dataclass
+class ReindexStats:
+    """Progress of a reindex."""
+
+    indexed: int = 0
+    failed: int = 0
+    failed_ids: list[str] = dataclasses.field(default_factory=list)
+    """Ids of records that failed to be indexed."""
+
+    started: float = dataclasses.field(default_factory=time.monotonic)
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of indexed records per second."""
+        elapsed = time.monotonic() - self.started
+        return self.indexed / elapsed if elapsed > 0 else 0.0
+
+
+class Checkpoint:
+    """Ids of the last indexed records of each record class, persisted in a JSON file."""
+
+    def __init__(self, path: Path | str | None):
+        """Load the checkpoint from the file if it exists."""
+        self.path = Path(path) if path else None
+        self.positions: dict[str, str] = {}
+        if self.path and self.path.exists():
+            self.positions = json.loads(self.path.read_text())
+
+    def get(self, name: str) -> str | None:
+        """Return the id of the last indexed record of a record class."""
+        return self.positions.get(name)
+
+    def set(self, name: str, last_id: str) -> None:
+        """Remember the id of the last indexed record of a record class and save the checkpoint."""
+        self.positions[name] = last_id
+        if self.path:
+            # write to a temporary file first, an interrupted write must not corrupt the checkpoint
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps(self.positions))
+            tmp_path.replace(self.path)
+
+
+_worker_dump: ChunkDumper | None = None
+"""Dumper of the current worker process, set by the pool initializer."""
+
+
+def _init_dump_worker(app: Flask, dump: ChunkDumper) -> None:
+    global _worker_dump  # noqa: PLW0603 - one dumper per worker process
+    # the worker keeps its own application context (and so its own database session) for its lifetime
+    app.app_context().push()
+    # connections of the pool were inherited from the parent process, they must not be shared with it
+    db.engine.dispose(close=False)
+    _worker_dump = dump
+
+
+def _dump_chunk_in_worker(ids: list[Any]) -> list[dict[str, Any]]:
+    if _worker_dump is None:  # pragma: no cover
+        raise RuntimeError("Worker dumper has not been initialized.")
+    return _worker_dump(ids)
+
+
+class ModelReindexer:
+    """Reindexes all records of a model in bulk.
+
+    :param model: namespace of the built model.
+    :param batch_size: number of records dumped and sent in one bulk request.
+    :param concurrency: maximum number of bulk requests being sent at the same time.
+    :param workers: number of forked processes dumping the records. 0 or 1 dumps in the current process.
+    :param sender: sends bulk actions, defaults to the bulk API of the search client.
+    :param checkpoint: checkpoint used to resume an interrupted reindex.
+    :param progress: called with the statistics after each indexed chunk.
+    """
+
+    def __init__(
+        self,
+        model: SimpleNamespace,
+        *,
+        batch_size: int = 500,
+        concurrency: int = 2,
+        workers: int = 0,
+        sender: BulkSender | None = None,
+        checkpoint: Checkpoint | None = None,
+        progress: Callable[[ReindexStats], None] | None = None,
+    ):
+        """Initialize the reindexer."""
+        self.model = model
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.workers = workers
+        self.sender = sender
+        self.checkpoint = checkpoint or Checkpoint(None)
+        self.progress = progress
+        self.stats = ReindexStats()
+        # set after a chunk with failed records, the checkpoint does not move past it
+        self._checkpoint_blocked = False
+
+    def reindex(self, include_drafts: bool = False) -> ReindexStats:
+        """Reindex published records and optionally drafts."""
+        service = self.model.proxies.current_service
+        self.reindex_class("Record", self.model.Record, service.indexer)
+        if include_drafts and getattr(self.model, "Draft", None) is not None:
+            self.reindex_class("Draft", self.model.Draft, service.draft_indexer)
+        return self.stats
+
+    def reindex_class(self, name: str, record_cls: type[Record], indexer: Any) -> None:
+        """Reindex all non-deleted records of a record class."""
+        sender = self.sender or search_bulk_sender()
+        # futures of chunks being sent, in the order of chunks
+        pending: list[tuple[Future[list[str]], str, int]] = []
+        self._checkpoint_blocked = False
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for ids, actions in self.iter_dumped_chunks(record_cls, indexer, self.checkpoint.get(name)):
+                pending.append((executor.submit(sender, actions), str(ids[-1]), len(actions)))
+                while len(pending) >= self.concurrency:
+                    wait([pending[0][0]], return_when=FIRST_COMPLETED)
+                    self._collect(name, pending)
+            while pending:
+                wait([pending[0][0]])
+                self._collect(name, pending)
+
+    def _collect(self, name: str, pending: list[tuple[Future[list[str]], str, int]]) -> None:
+        """Account the finished chunks at the head of the pending list and move the checkpoint."""
+        while pending and pending[0][0].done():
+            future, last_id, count = pending.pop(0)
+            failed_ids = future.result()
+            self.stats.indexed += count - len(failed_ids)
+            self.stats.failed += len(failed_ids)
+            self.stats.failed_ids.extend(failed_ids)
+            # chunks are checkpointed in order and not past a failed chunk,
+            # so a resumed reindex neither skips nor loses any record
+            if failed_ids:
+                self._checkpoint_blocked = True
+            if not self._checkpoint_blocked:
+                self.checkpoint.set(name, last_id)
+            if self.progress:
+                self.progress(self.stats)
+
+    def iter_id_chunks(self, record_cls: type[Record], after: str | None = None) -> Iterator[list[Any]]:
+        """Yield ids of non-deleted records ordered by id in chunks of ``batch_size``."""
+        model_cls = record_cls.model_cls
+        while True:
+            query = db.session.query(model_cls.id).filter(model_cls.is_deleted != True)  # noqa: E712
+            if after is not None:
+                query = query.filter(model_cls.id > after)
+            ids = [row[0] for row in query.order_by(model_cls.id).limit(self.batch_size)]
+            if not ids:
+                return
+            yield ids
+            after = ids[-1]
+
+    def iter_dumped_chunks(
+        self,
+        record_cls: type[Record],
+        indexer: Any,
+        after: str | None = None,
+    ) -> Iterator[tuple[list[Any], list[dict[str, Any]]]]:
+        """Yield (ids, bulk index actions) of chunks of non-deleted records in the order of ids.
+
+        With more than one worker, at most ``2 * workers`` chunks are being dumped at any time.
+        """
+        chunks = self.iter_id_chunks(record_cls, after)
+        if self.workers <= 1:
+            for ids in chunks:
+                yield ids, self.dump_chunk(record_cls, indexer, ids)
+            return
+
+        app = current_app._get_current_object()  # noqa: SLF001
+        dump = functools.partial(self.dump_chunk, record_cls, indexer)
+        # the dumper is bound to the workers of this pool, the forked processes do not pickle it;
+        # the workers are forked at the first submit, before any bulk request is sent from a thread
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_dump_worker,
+            initargs=(app, dump),
+        ) as executor:
+            pending: deque[tuple[list[Any], Future[list[dict[str, Any]]]]] = deque()
+            for ids in chunks:
+                pending.append((ids, executor.submit(_dump_chunk_in_worker, ids)))
+                if len(pending) >= 2 * self.workers:
+                    ids, future = pending.popleft()
+                    yield ids, future.result()
+            while pending:
+                ids, future = pending.popleft()
+                yield ids, future.result()
+
+    def dump_chunk(self, record_cls: type[Record], indexer: Any, ids: list[Any]) -> list[dict[str, Any]]:
+        """Load records of a chunk and dump them to bulk index actions."""
+        records = record_cls.get_records(ids)
+        relations = [record.relations for record in records if hasattr(record, "relations")]
+        if relations:
+            prefetch_relations(relations)
+        actions = []
+        for record in records:
+            index = indexer.record_to_index(record)
+            actions.append(
+                {
+                    "_op_type": "index",
+                    "_index": index,
+                    "_id": str(record.id),
+                    "_version": record.revision_id,
+                    "_version_type": indexer._version_type,  # noqa: SLF001
+                    # the same as RecordIndexer.index does, including the before_record_index signal
+                    "_source": indexer._prepare_record(record, index),  # noqa: SLF001
+                },
+            )
+        # the records are not needed anymore, do not keep them in the session
+        for record in records:
+            db.session.expunge(record.model)
+        return actions
@@ -0,0 +1,197 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Complexity statistics of a built model.
+
+The statistics are computed from the model type tree (the same visitor that the
+dumper extensions use), the generated files and the classes of the built namespace.
+They are meant to spot models that are expensive to load, validate or index before
+they reach production:
+
+```python
+print(my_model.get_stats().format())
+```
+
+or ``oarepo model stats <model>`` on the command line. The retained memory is an
+estimate: the generated files, class dictionaries and the containers reachable from
+them are summed by ``sys.getsizeof``, other objects are counted without their content.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+import marshmallow
+
+from .datatypes.base import ARRAY_ITEM_PATH
+from .datatypes.collections import ArrayDataType, ObjectDataType
+from .datatypes.polymorphic import PolymorphicDataType
+from .datatypes.relations import PIDRelation
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from .datatypes.registry import DataTypeRegistry
+    from .model import InvenioModel
+
+
+@dataclasses.dataclass
+class MappingStats:
+    """Usage of the mapping limits by one generated index mapping."""
+
+    usage: dict[str, int]
+    """Setting name -> number of fields (depth) used by the mapping."""
+
+    limits: dict[str, int]
+    """Setting name -> limit configured in the index settings or the opensearch default."""
+
+
+@dataclasses.dataclass
+class ModelStats:
+    """Complexity statistics of a model."""
+
+    leaf_fields: int = 0
+    """Number of distinct paths of fields that are neither objects, arrays nor unions."""
+
+    max_depth: int = 0
+    """Maximum number of keys on a path, array items are not counted."""
+
+    max_array_nesting: int = 0
+    """Maximum number of arrays on a path."""
+
+    polymorphic_unions: int = 0
+    relations: int = 0
+    """Number of relation fields (including vocabularies)."""
+
+    facets: int = 0
+    mappings: dict[str, MappingStats] = dataclasses.field(default_factory=dict)
+    """File name -> usage of the mapping limits."""
+
+    generated_classes: int = 0
+    schema_classes: int = 0
+    """Number of generated marshmallow schema classes."""
+
+    retained_memory: int = 0
+    """Estimated size of the generated files and classes in bytes."""
+
+    def format(self) -> str:
+        """Return a human readable report."""
+        lines = [
+            f"leaf fields: {self.leaf_fields}",
+            f"max depth: {self.max_depth}",
+            f"max array nesting: {self.max_array_nesting}",
+            f"polymorphic unions: {self.polymorphic_unions}",
+            f"relations: {self.relations}",
+            f"facets: {self.facets}",
+            f"generated classes: {self.generated_classes} ({self.schema_classes} schemas)",
+            f"estimated retained memory: {self.retained_memory / 1024:.1f} KiB",
+        ]
+        for file_name, mapping in self.mappings.items():
+            lines.append(f"mapping {file_name}:")
+            lines.extend(f"  {setting}: {used} / {mapping.limits[setting]}" for setting, used in mapping.usage.items())
+        return "\n".join(lines)
+
+
+def get_model_stats(
+    type_registry: DataTypeRegistry,
+    model: InvenioModel,
+    namespace: SimpleNamespace,
+) -> ModelStats:
+    """Compute the complexity statistics of a built model.
+
+    Only the type registry of the model builder is needed, so that the builder itself
+    is not kept alive by the built model.
+    """
+    from .presets.records_resources.records.date_range_dumper_ext import get_registry_model_nodes
+
+    stats = ModelStats()
+    leaf_paths: set[tuple[str, ...]] = set()
+    for datatype, path in get_registry_model_nodes(type_registry, model):
+        keys = [key for key in path if key != ARRAY_ITEM_PATH]
+        stats.max_depth = max(stats.max_depth, len(keys))
+        stats.max_array_nesting = max(stats.max_array_nesting, len(path) - len(keys))
+        if isinstance(datatype, PolymorphicDataType):
+            stats.polymorphic_unions += 1
+        elif isinstance(datatype, PIDRelation):
+            stats.relations += 1
+        elif not isinstance(datatype, (ObjectDataType, ArrayDataType)):
+            leaf_paths.add(tuple(path))
+    stats.leaf_fields = len(leaf_paths)
+
+    facets = getattr(namespace, "RecordFacets", None)
+    if isinstance(facets, dict):
+        stats.facets = len(facets)
+
+    files = getattr(namespace, "__files__", {})
+    stats.mappings = get_mapping_stats(files)
+
+    classes = [value for value in vars(namespace).values() if isinstance(value, type)]
+    stats.generated_classes = len(classes)
+    stats.schema_classes = sum(1 for cls in classes if issubclass(cls, marshmallow.Schema))
+
+    # the class dictionaries are kept alive so that their ids are not reused while counting
+    class_dicts = [vars(cls) for cls in classes]
+    seen: set[int] = set()
+    stats.retained_memory = (
+        estimate_size(files, seen)
+        + sum(sys.getsizeof(cls) for cls in classes)
+        + sum(estimate_size(class_dict, seen) for class_dict in class_dicts)
+    )
+    return stats
+
+
+def get_mapping_stats(files: dict[str, Any]) -> dict[str, MappingStats]:
+    """Return the usage of the mapping limits of the generated mapping files."""
+    from .presets.records_resources.records.index_fields_budget import (
+        DEFAULT_LIMITS,
+        count_mapping_fields,
+        get_mapping_setting,
+    )
+
+    ret: dict[str, MappingStats] = {}
+    for file_name, content in files.items():
+        if not file_name.startswith("mappings/") or not file_name.endswith(".json"):
+            continue
+        index_definition = json.loads(content) if isinstance(content, (str, bytes)) else content
+        usage = count_mapping_fields(index_definition.get("mappings", {}))
+        settings = index_definition.get("settings", {})
+        limits = {}
+        for setting, default in DEFAULT_LIMITS.items():
+            limit = get_mapping_setting(settings, setting)
+            limits[setting] = default if limit is None else limit
+        ret[file_name] = MappingStats(
+            usage={setting: usage.get(setting) for setting in DEFAULT_LIMITS},
+            limits=limits,
+        )
+    return ret
+
+
+def estimate_size(obj: Any, seen: set[int]) -> int:
+    """Return the size of an object and the containers reachable from it.
+
+    Objects already in ``seen`` are not counted again, objects other than mappings,
+    lists, tuples and sets are counted without their content.
+    """
+    stack = [obj]
+    size = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, (dict, MappingProxyType)):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+    return size
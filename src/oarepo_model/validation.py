@@ -0,0 +1,275 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see http://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Batch validation of records against the generated model schemas.
+
+Records are loaded through the generated ``RecordSchema`` and the loaded data
+are validated against the generated record JSON schema, without going through
+the service layer. This is intended for migrations, where many records need to
+be checked before they are imported.
+
+Usage:
+
+```python
+for result in my_model.validate_many(read_records(), workers=4):
+    if not result.valid:
+        print(result.index, result.errors)
+```
+
+``validate_lines`` validates a JSON lines file (one record per line) the same way,
+reporting line numbers and lines that are not valid JSON
+(``oarepo model validate`` command).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import json
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, cast
+
+import marshmallow
+from jsonschema.validators import validator_for
+from marshmallow.exceptions import SCHEMA
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+    from types import SimpleNamespace
+
+DEFAULT_CHUNK_SIZE = 100
+"""Number of records sent to a worker process at once."""
+
+
+@dataclasses.dataclass
+class ValidationResult:
+    """Result of validation of a single record."""
+
+    index: int
+    """Position of the record in the validated iterable."""
+
+    valid: bool
+    """True if the record passed both marshmallow and JSON schema validation."""
+
+    errors: list[tuple[str, str]] = dataclasses.field(default_factory=list)
+    """List of (dotted path, message) of validation errors."""
+
+    data: dict[str, Any] | None = None
+    """Loaded data of the record, if requested and the record is valid."""
+
+
+@dataclasses.dataclass
+class InvalidInput:
+    """Placeholder of a record that could not be parsed, reported as invalid without validation."""
+
+    message: str
+
+
+class RecordValidator:
+    """Validator of records using the generated marshmallow schema and JSON schema."""
+
+    def __init__(
+        self,
+        schema_cls: type[marshmallow.Schema],
+        json_schema: dict[str, Any] | None,
+        *,
+        return_data: bool = False,
+    ):
+        """Initialize the validator.
+
+        :param schema_cls: marshmallow schema used to load the records.
+        :param json_schema: JSON schema validating the loaded records, None to skip.
+        :param return_data: whether valid results should contain the loaded data.
+        """
+        self.schema = schema_cls()
+        self.json_validator = validator_for(json_schema)(json_schema) if json_schema else None
+        self.return_data = return_data
+
+    def validate(self, index: int, record: dict[str, Any] | InvalidInput) -> ValidationResult:
+        """Validate a single record."""
+        if isinstance(record, InvalidInput):
+            return ValidationResult(index=index, valid=False, errors=[("", record.message)])
+        try:
+            loaded = self.schema.load(record)
+        except marshmallow.ValidationError as e:
+            return ValidationResult(index=index, valid=False, errors=flatten_errors(e.messages))
+
+        if self.json_validator is not None:
+            errors = [
+                (".".join(str(x) for x in error.absolute_path), error.message)
+                for error in self.json_validator.iter_errors(loaded)
+            ]
+            if errors:
+                return ValidationResult(index=index, valid=False, errors=errors)
+
+        return ValidationResult(index=index, valid=True, data=loaded if self.return_data else None)
+
+    def validate_chunk(self, chunk: list[tuple[int, dict[str, Any]]]) -> list[ValidationResult]:
+        """Validate a chunk of (index, record) pairs."""
+        return [self.validate(index, record) for index, record in chunk]
+
+
+def flatten_errors(messages: Any, path: str = "") -> list[tuple[str, str]]:
+    """Convert nested marshmallow error messages to a list of (dotted path, message)."""
+    if isinstance(messages, dict):
+        ret: list[tuple[str, str]] = []
+        for key, value in messages.items():
+            if key == SCHEMA:
+                ret.extend(flatten_errors(value, path))
+            else:
+                ret.extend(flatten_errors(value, f"{path}.{key}" if path else str(key)))
+        return ret
+    if isinstance(messages, (list, tuple)):
+        return [error for message in messages for error in flatten_errors(message, path)]
+    # lazy translated strings are converted here so that results can be sent between processes
+    return [(path, str(messages))]
+
+
+def get_record_json_schema_file(namespace: SimpleNamespace) -> str | None:
+    """Return the content of the record JSON schema file generated for the model, None if there is none."""
+    files = [x for x in namespace.__files__ if x.startswith("jsonschemas/") and x.endswith(".json")]
+    if not files:
+        return None
+    return cast("str", namespace.__files__[files[0]])
+
+
+def get_record_json_schema(namespace: SimpleNamespace) -> dict[str, Any] | None:
+    """Return the record JSON schema generated for the model, None if there is none."""
+    content = get_record_json_schema_file(namespace)
+    return json.loads(content) if content is not None else None
+
+
+_worker_validator: RecordValidator | None = None
+"""Validator of the current worker process, set by the pool initializer."""
+
+
+def _init_worker(validator: RecordValidator) -> None:
+    global _worker_validator  # noqa: PLW0603 - one validator per worker process
+    _worker_validator = validator
+
+
+def _validate_chunk_in_worker(chunk: list[tuple[int, dict[str, Any]]]) -> list[ValidationResult]:
+    if _worker_validator is None:  # pragma: no cover
+        raise RuntimeError("Worker validator has not been initialized.")
+    return _worker_validator.validate_chunk(chunk)
+
+
+def _chunks(records: Iterable[dict[str, Any]], chunk_size: int) -> Iterator[list[tuple[int, dict[str, Any]]]]:
+    enumerated = enumerate(records)
+    while chunk := list(itertools.islice(enumerated, chunk_size)):
+        yield chunk
+
+
+def validate_many(
+    records: Iterable[dict[str, Any]],
+    *,
+    namespace: SimpleNamespace,
+    workers: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    json_schema: bool = True,
+    return_data: bool = False,
+) -> Iterator[ValidationResult]:
+    """Validate records and yield a result for each of them, in input order.
+
+    The input is consumed lazily in chunks of ``chunk_size`` records and at most
+    ``2 * workers`` chunks are in flight at any time, so the whole input is never
+    held in memory.
+
+    :param records: iterable of records in the REST API (input) format.
+    :param namespace: the built model.
+    :param workers: number of worker processes. 0 or 1 validates in the current process.
+                    Worker processes are forked, so that they share the built model.
+    :param chunk_size: number of records sent to a worker at once.
+    :param json_schema: whether to validate the loaded data against the record JSON schema.
+    :param return_data: whether results of valid records should contain the loaded data.
+    """
+    validator = RecordValidator(
+        namespace.RecordSchema,
+        get_record_json_schema(namespace) if json_schema else None,
+        return_data=return_data,
+    )
+
+    if workers <= 1:
+        for chunk in _chunks(records, chunk_size):
+            yield from validator.validate_chunk(chunk)
+        return
+
+    # the validator is bound to the workers of this pool, the forked processes do not pickle it
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(validator,),
+    ) as executor:
+        pending: deque[Future[list[ValidationResult]]] = deque()
+        for chunk in _chunks(records, chunk_size):
+            pending.append(executor.submit(_validate_chunk_in_worker, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+@dataclasses.dataclass
+class LineValidationResult:
+    """Result of validation of a single line of a JSON lines input."""
+
+    line_number: int
+    """Number of the line in the input, starting with 1."""
+
+    line: str
+    """The line as read from the input."""
+
+    result: ValidationResult
+    """Validation result, a line that is not valid JSON has an error with an empty path."""
+
+
+def validate_lines(
+    lines: Iterable[str],
+    *,
+    namespace: SimpleNamespace,
+    workers: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    json_schema: bool = True,
+) -> Iterator[LineValidationResult]:
+    """Validate records of a JSON lines input and yield a result for each non-empty line, in input order.
+
+    Lines that are not valid JSON are passed to ``validate_many`` as ``InvalidInput``
+    in their place, so only the lines that are being validated are kept in memory
+    (see ``validate_many``) and the memory does not grow with the size of the input.
+    """
+    # lines read from the input whose results have not been yielded yet
+    pending: deque[tuple[int, str]] = deque()
+
+    def read_records() -> Iterator[dict[str, Any] | InvalidInput]:
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            pending.append((line_number, line))
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield InvalidInput(f"Invalid JSON: {e}")
+                continue
+            if not isinstance(record, dict):
+                yield InvalidInput("Invalid JSON: expected an object")
+                continue
+            yield record
+
+    for result in validate_many(
+        read_records(),  # type: ignore[arg-type]
+        namespace=namespace,
+        workers=workers,
+        chunk_size=chunk_size,
+        json_schema=json_schema,
+    ):
+        line_number, line = pending.popleft()
+        yield LineValidationResult(line_number, line, result)
@@ -0,0 +1,61 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for the streaming export of search results."""
+
+from __future__ import annotations
+
+import json
+
+
+def _create_records(app, projection_model, identity_simple, count):
+    service = app.extensions["projection_test"].records_service
+    ids = [
+        service.create(
+            identity_simple,
+            {"metadata": {"title": f"Record {i}", "height": i}, "files": {"enabled": False}},
+        ).id
+        for i in range(count)
+    ]
+    projection_model.Record.index.refresh()
+    return sorted(ids)
+
+
+def test_export_stream(app, projection_model, identity_simple, search_clear, location, client, headers):
+    # the model is configured with page size 2, so 5 records are fetched in 3 pages
+    ids = _create_records(app, projection_model, identity_simple, 5)
+
+    res = client.get("/projection-test/export/json", headers=headers.json)
+    assert res.status_code == 200
+    assert res.mimetype == "application/x-ndjson"
+    lines = [json.loads(line) for line in res.get_data(as_text=True).splitlines()]
+    assert [line["id"] for line in lines] == ids
+    # full records, not the list projection configured in the model
+    assert all("height" in line["metadata"] for line in lines)
+
+    # resume after the second record
+    res = client.get("/projection-test/export/json", query_string={"after": ids[1]}, headers=headers.json)
+    assert res.status_code == 200
+    assert [json.loads(line)["id"] for line in res.get_data(as_text=True).splitlines()] == ids[2:]
+
+    # query is applied
+    res = client.get("/projection-test/export/json", query_string={"q": f"id:{ids[3]}"}, headers=headers.json)
+    assert [json.loads(line)["id"] for line in res.get_data(as_text=True).splitlines()] == [ids[3]]
+
+
+def test_export_stream_service(app, projection_model, identity_simple, search_clear, location):
+    ids = _create_records(app, projection_model, identity_simple, 3)
+    service = app.extensions["projection_test"].records_service
+
+    assert [item["id"] for item in service.export_stream(identity_simple)] == ids
+    assert [item["id"] for item in service.export_stream(identity_simple, after=ids[0])] == ids[1:]
+
+
+def test_export_stream_unknown_export(app, projection_model, search_clear, client, headers):
+    res = client.get("/projection-test/export/unknown", headers=headers.json)
+    assert res.status_code == 404
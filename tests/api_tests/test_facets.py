@@ -57,3 +57,122 @@ def test_draft_facets_preset_adds_is_published_facet(
 ):
     """Test that DraftFacetsPreset adds is_published facet to search options."""
     assert hasattr(facet_model.facets, "is_published")
+
+
+def test_requested_facet_group_prunes_aggregations(
+    app,
+    facet_service,
+    identity_simple,
+    input_facets_data,
+    facet_model,
+    search,
+    search_clear,
+    location,
+):
+    item = facet_service.create(identity_simple, input_facets_data)
+    facet_service.publish(identity_simple, item.id)
+    facet_model.Record.index.refresh()
+
+    all_aggregations = facet_service.search(identity_simple, size=1).to_dict()["aggregations"]
+    # identity without roles gets the facets of the default group
+    assert {"metadata.b", "metadata.jej.c"} <= set(all_aggregations)
+
+    pruned = facet_service.search(identity_simple, size=1, facets={"facet_group": ["b_only"]}).to_dict()
+    assert set(pruned["aggregations"]) == {"metadata.b"}
+    assert pruned["hits"]["total"] == 1
+
+    # a facet with an active filter keeps its aggregation
+    filtered = facet_service.search(
+        identity_simple,
+        size=1,
+        facets={"facet_group": ["b_only"], "metadata.jej.c": ["x"]},
+    ).to_dict()
+    assert set(filtered["aggregations"]) == {"metadata.b", "metadata.jej.c"}
+
+    # unknown group does not prune anything
+    unknown = facet_service.search(identity_simple, size=1, facets={"facet_group": ["unknown"]}).to_dict()
+    assert set(unknown["aggregations"]) == set(all_aggregations)
+
+
+def test_nested_facets_share_aggregation(
+    app,
+    facet_service,
+    identity_simple,
+    facet_model,
+    search,
+    search_clear,
+    location,
+):
+    from invenio_search.engine import dsl
+
+    from oarepo_model.presets.records_resources.services.records.search_options import (
+        MERGED_NESTED_AGGREGATION_PREFIX,
+        PrunedGroupedFacetsParam,
+        get_merged_nested_facets,
+    )
+
+    facets = facet_model.RecordFacets
+    merged = get_merged_nested_facets(facets)
+    assert set(merged["metadata.b_nes"]) == {"metadata.b_nes.c", "metadata.b_nes.f.g"}
+
+    # the query contains one nested aggregation with a sub-aggregation per facet
+    nested_facets = {name: facets[name] for name in ("metadata.b_nes.c", "metadata.b_nes.f.g")}
+    param = PrunedGroupedFacetsParam(facet_model.RecordSearchOptions)
+    aggs = param.aggregate_with_user_facets(dsl.Search(), nested_facets).to_dict()["aggs"]
+    assert list(aggs) == [f"{MERGED_NESTED_AGGREGATION_PREFIX}metadata.b_nes"]
+    merged_agg = aggs[f"{MERGED_NESTED_AGGREGATION_PREFIX}metadata.b_nes"]
+    assert merged_agg["nested"] == {"path": "metadata.b_nes"}
+    assert set(merged_agg["aggs"]) == {"metadata.b_nes.c", "metadata.b_nes.f.g"}
+
+    item = facet_service.create(
+        identity_simple,
+        {"files": {"enabled": False}, "metadata": {"b_nes": {"c": "x", "f": {"g": "y"}}}},
+    )
+    facet_service.publish(identity_simple, item.id)
+    facet_model.Record.index.refresh()
+
+    # the identity gets the nested facets through the default facet group
+    aggregations = facet_service.search(identity_simple, size=1).to_dict()["aggregations"]
+    assert not any(name.startswith(MERGED_NESTED_AGGREGATION_PREFIX) for name in aggregations)
+    assert [b["key"] for b in aggregations["metadata.b_nes.c"]["buckets"]] == ["x"]
+    assert [b["key"] for b in aggregations["metadata.b_nes.f.g"]["buckets"]] == ["y"]
+
+    filtered = facet_service.search(identity_simple, size=1, facets={"metadata.b_nes.c": ["x"]}).to_dict()
+    assert filtered["hits"]["total"] == 1
+    assert [b["key"] for b in filtered["aggregations"]["metadata.b_nes.f.g"]["buckets"]] == ["y"]
+
+
+def test_facet_group_facets_are_precomputed(app, facet_model):
+    search_options = facet_model.RecordSearchOptions
+    facet_group_facets = search_options.facet_group_facets
+    assert set(facet_group_facets["b_only"]) == {"metadata.b"}
+    assert set(facet_group_facets["default"]) == {
+        "metadata.b",
+        "metadata.jej.c",
+        "metadata.b_nes.c",
+        "metadata.b_nes.f.g",
+    }
+    # computed once and stored on the search options class
+    assert search_options.facet_group_facets is facet_group_facets
+
+
+def test_params_interpreters_cls_is_computed_once(app, facet_model):
+    from invenio_records_resources.services.records.params.facets import FacetsParam
+
+    from oarepo_model.presets.records_resources.services.records.search_options import (
+        PrunedGroupedFacetsParam,
+    )
+
+    for options_cls in (facet_model.RecordSearchOptions, facet_model.DraftSearchOptions):
+        first = options_cls().params_interpreters_cls
+        assert options_cls().params_interpreters_cls is first
+        assert options_cls.__dict__["_cached_params_interpreters_cls"] is first
+        facet_params = [c for c in first if issubclass(c, FacetsParam)]
+        assert facet_params == [PrunedGroupedFacetsParam]
+
+        # a subclass gets its own cached chain
+        subclass = type("SubSearchOptions", (options_cls,), {})
+        subclass_chain = subclass().params_interpreters_cls
+        assert subclass.__dict__["_cached_params_interpreters_cls"] is subclass_chain
+        assert subclass_chain is not first
+        assert subclass_chain == first
@@ -0,0 +1,48 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+"""Tests for the projection of search results to the list fields."""
+
+from __future__ import annotations
+
+
+def test_list_projection(app, projection_model, identity_simple, search_clear, location, client, headers):
+    service = app.extensions["projection_test"].records_service
+    record = service.create(
+        identity_simple,
+        {"metadata": {"title": "Projected", "height": 10, "some_bool_val": True}, "files": {"enabled": False}},
+    )
+    projection_model.Record.index.refresh()
+
+    # the model is configured with list_projection = ["metadata.title"]
+    res = client.get("/projection-test", headers=headers.json)
+    assert res.status_code == 200
+    (hit,) = res.json["hits"]["hits"]
+    assert hit["id"] == record.id
+    assert hit["metadata"] == {"title": "Projected"}
+    assert "links" in hit
+
+    res = client.get("/projection-test", query_string={"projection": "full"}, headers=headers.json)
+    (hit,) = res.json["hits"]["hits"]
+    assert hit["metadata"] == {"title": "Projected", "height": 10, "some_bool_val": True}
+
+    # UI serializer dumps the hits with the projected UI schema
+    res = client.get("/projection-test", headers=headers.ui)
+    assert res.status_code == 200
+    (hit,) = res.json["hits"]["hits"]
+    assert "height" not in hit["ui"]
+    assert "some_bool_val_i18n" not in hit["ui"]
+
+    res = client.get("/projection-test", query_string={"projection": "full"}, headers=headers.ui)
+    (hit,) = res.json["hits"]["hits"]
+    assert hit["ui"]["height"] == "10"
+    assert hit["ui"]["some_bool_val_i18n"] == "true"
+
+    # reading a single record is not projected
+    res = client.get(f"/projection-test/{record.id}", headers=headers.json)
+    assert res.json["metadata"]["height"] == 10
@@ -0,0 +1,136 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+import json
+import os
+import threading
+
+from oarepo_model.reindex import Checkpoint, ModelReindexer, search_bulk_sender
+
+
+class StandInBulkEndpoint:
+    """Collects bulk requests instead of sending them to the search cluster."""
+
+    def __init__(self, failing_ids=()):
+        self.requests = []
+        self.failing_ids = set(failing_ids)
+        self.lock = threading.Lock()
+
+    def __call__(self, actions):
+        with self.lock:
+            self.requests.append(actions)
+        return [action["_id"] for action in actions if action["_id"] in self.failing_ids]
+
+    @property
+    def ids(self):
+        return [action["_id"] for actions in self.requests for action in actions]
+
+
+def test_reindex(app, test_service, identity_simple, input_data, empty_model, search, search_clear, location, tmp_path):
+    Record = empty_model.Record
+    pids = [test_service.create(identity_simple, input_data).id for _ in range(5)]
+    record_ids = sorted(str(Record.pid.resolve(pid).id) for pid in pids)
+
+    endpoint = StandInBulkEndpoint(failing_ids=[record_ids[2]])
+    checkpoint_path = tmp_path / "checkpoint.json"
+    progress = []
+    stats = ModelReindexer(
+        empty_model,
+        batch_size=2,
+        concurrency=2,
+        sender=endpoint,
+        checkpoint=Checkpoint(checkpoint_path),
+        progress=lambda stats: progress.append(stats.indexed),
+    ).reindex()
+
+    assert sorted(endpoint.ids) == record_ids
+    assert sorted(len(actions) for actions in endpoint.requests) == [1, 2, 2]
+    action = endpoint.requests[0][0]
+    assert action["_op_type"] == "index"
+    assert action["_index"]
+    assert action["_source"]["uuid"] == action["_id"]
+    assert stats.indexed == 4
+    assert stats.failed == 1
+    assert stats.failed_ids == [record_ids[2]]
+    assert progress == [2, 3, 4]
+    # the checkpoint stays before the chunk with the failed record
+    assert json.loads(checkpoint_path.read_text()) == {"Record": record_ids[1]}
+
+    # a resumed reindex continues after the checkpoint and retries the failed record
+    endpoint = StandInBulkEndpoint()
+    stats = ModelReindexer(
+        empty_model,
+        batch_size=2,
+        sender=endpoint,
+        checkpoint=Checkpoint(checkpoint_path),
+    ).reindex()
+    assert endpoint.ids == record_ids[2:]
+    assert stats.indexed == 3
+    assert stats.failed_ids == []
+    assert json.loads(checkpoint_path.read_text()) == {"Record": record_ids[-1]}
+
+
+class ProcessRecordingReindexer(ModelReindexer):
+    """Dumps only the ids and the process that dumped them.
+
+    Records created in a test are not committed, so they are not visible to the worker processes.
+    """
+
+    def dump_chunk(self, record_cls, indexer, ids):
+        return [{"_id": str(id_), "pid": os.getpid()} for id_ in ids]
+
+
+def test_reindex_in_worker_processes(
+    app, test_service, identity_simple, input_data, empty_model, search_clear, location, tmp_path
+):
+    Record = empty_model.Record
+    pids = [test_service.create(identity_simple, input_data).id for _ in range(5)]
+    record_ids = sorted(str(Record.pid.resolve(pid).id) for pid in pids)
+
+    endpoint = StandInBulkEndpoint(failing_ids=[record_ids[2]])
+    checkpoint_path = tmp_path / "checkpoint.json"
+    stats = ProcessRecordingReindexer(
+        empty_model,
+        batch_size=1,
+        workers=2,
+        sender=endpoint,
+        checkpoint=Checkpoint(checkpoint_path),
+    ).reindex()
+
+    assert sorted(endpoint.ids) == record_ids
+    dumping_pids = {action["pid"] for actions in endpoint.requests for action in actions}
+    assert dumping_pids
+    assert os.getpid() not in dumping_pids
+    assert stats.indexed == 4
+    assert stats.failed_ids == [record_ids[2]]
+    # chunks are checkpointed in order of ids, not in order of dumping
+    assert json.loads(checkpoint_path.read_text()) == {"Record": record_ids[1]}
+
+
+def test_search_bulk_sender(app, test_service, identity_simple, input_data, empty_model, search_clear, location):
+    Record = empty_model.Record
+    pids = [test_service.create(identity_simple, input_data).id for _ in range(3)]
+    Record.index.refresh()
+
+    # send the dumped records through the bulk API of the search cluster
+    stats = ModelReindexer(empty_model, batch_size=2).reindex()
+    assert stats.indexed == 3
+    assert stats.failed_ids == []
+    Record.index.refresh()
+    assert test_service.search(identity_simple).total == 3
+
+    # actions rejected by the cluster are reported by id
+    sender = search_bulk_sender()
+    record = Record.pid.resolve(pids[0])
+    indexer = test_service.indexer
+    index = indexer.record_to_index(record)
+    source = indexer._prepare_record(record, index)
+    source["metadata"]["height"] = "not a number"
+    assert sender([{"_op_type": "index", "_index": index, "_id": "invalid", "_source": source}]) == ["invalid"]
@@ -8,6 +8,9 @@
 #
 from __future__ import annotations
 
+from invenio_db import db
+from sqlalchemy import event
+
 
 def test_relations(
     app,
@@ -107,3 +110,75 @@ def test_relations(
     assert md["triple_array"][0]["array"][1]["array"][0]["metadata"]["title"] == "Record 2"
     assert md["triple_array"][0]["array"][1]["array"][1]["id"] == rec3_id
     assert md["triple_array"][0]["array"][1]["array"][1]["metadata"]["title"] == "Record 3"
+
+
+def test_batched_relations_prefetch(
+    app,
+    identity_simple,
+    empty_model,
+    relation_model,
+    search,
+    search_clear,
+    location,
+):
+    from oarepo_model.presets.records_resources.records.batched_relations import (
+        prefetch_relations,
+        referenced_ids,
+    )
+
+    target_service = empty_model.proxies.current_service
+    target_ids = [
+        target_service.create(
+            identity_simple,
+            {"files": {"enabled": False}, "metadata": {"title": f"Record {idx}"}},
+        ).id
+        for idx in range(3)
+    ]
+
+    relation_service = relation_model.proxies.current_service
+    records = [
+        relation_model.Record.get_record(
+            relation_service.create(
+                identity_simple,
+                {
+                    "files": {"enabled": False},
+                    "metadata": {
+                        "direct": {"id": target_ids[idx]},
+                        "double_array": [{"array": [{"id": target_id} for target_id in target_ids]}],
+                    },
+                },
+            )._record.id,
+        )
+        for idx in range(2)
+    ]
+    # stored records contain only the references
+    assert referenced_ids(records[0].relations._fields["metadata.direct"], records[0]) == [target_ids[0]]
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count_statement)
+    try:
+        prefetch_relations([record.relations for record in records])
+        cache_key = records[0].relations._fields["metadata.direct"]._cache_key
+        assert set(records[1].relations._cache[cache_key]) == set(target_ids)
+
+        for record in records:
+            record.relations.dereference()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count_statement)
+
+    # one PID query and one record query for all references of both records
+    assert len(statements) == 2, statements
+    assert "pidstore_pid" in statements[0]
+    assert empty_model.Record.model_cls.__tablename__ in statements[1]
+
+    for idx, record in enumerate(records):
+        assert record["metadata"]["direct"]["metadata"]["title"] == f"Record {idx}"
+        assert [x["metadata"]["title"] for x in record["metadata"]["double_array"][0]["array"]] == [
+            "Record 0",
+            "Record 1",
+            "Record 2",
+        ]
@@ -10,6 +10,8 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 from flask import Blueprint
 from oarepo_runtime import current_runtime
@@ -154,3 +156,61 @@ def test_signposting_linksets_without_datacite(
         linkset_export.serializer.serialize_object(item.to_dict())
     with pytest.raises(ValueError, match="No export found for the given mimetype or code"):
         json_linkset_export.serializer.serialize_object(item.to_dict())
+
+
+def test_signposting_linkset_lists(
+    app_with_bp,
+    test_datacite_service,
+    file_service,
+    identity_simple,
+    input_data,
+    datacite_exports_model,
+    search_clear,
+    location,
+):
+    items = [test_datacite_service.create(identity_simple, input_data).to_dict() for _ in range(2)]
+    obj_list = {"hits": {"hits": items, "total": 2}}
+    model = current_runtime.models["datacite_export_test"]
+
+    linkset = "".join(model.get_export_by_mimetype("application/linkset").serializer.serialize_object_list(obj_list))
+    for item in items:
+        assert f'/uploads/{item["id"]}>; rel=describes; type="text/html"' in linkset
+
+    json_linkset = json.loads(
+        "".join(model.get_export_by_mimetype("application/linkset+json").serializer.serialize_object_list(obj_list)),
+    )
+    anchors = [context["anchor"] for context in json_linkset["linkset"] if "cite-as" in context]
+    assert anchors == [item["links"]["self_html"] for item in items]
+
+
+def test_signposting_linkset_search(
+    app_with_bp,
+    test_datacite_service,
+    identity_simple,
+    input_data_with_files_disabled,
+    datacite_exports_model,
+    search_clear,
+    location,
+    client,
+    headers,
+):
+    for _ in range(2):
+        item = test_datacite_service.create(identity_simple, input_data_with_files_disabled)
+        test_datacite_service.publish(identity_simple, item.id)
+    datacite_exports_model.Record.index.refresh()
+
+    hits = client.get("/datacite-export-test", headers=headers.json).json["hits"]["hits"]
+    assert len(hits) == 2
+    landing_pages = [hit["links"]["self_html"] for hit in hits]
+
+    res = client.get("/datacite-export-test", headers={"Accept": "application/linkset"})
+    assert res.status_code == 200
+    linkset = res.get_data(as_text=True)
+    for landing_page in landing_pages:
+        assert f'{landing_page}>; rel=describes; type="text/html"' in linkset
+
+    res = client.get("/datacite-export-test", headers={"Accept": "application/linkset+json"})
+    assert res.status_code == 200
+    json_linkset = json.loads(res.get_data(as_text=True))
+    anchors = [context["anchor"] for context in json_linkset["linkset"] if "cite-as" in context]
+    assert anchors == landing_pages
@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+import pytest
+from invenio_records.signals import after_record_update
+from invenio_vocabularies.records.api import Vocabulary
+
+from oarepo_model.presets.records_resources.records.batched_relations import resolve_pids
+from oarepo_model.presets.records_resources.records.vocabulary_index import (
+    VocabularyIndex,
+    get_process_vocabulary_index,
+    get_vocabulary_index,
+)
+
+
+def test_vocabulary_index(app, vocabulary_fixtures):
+    index = VocabularyIndex(types=["languages"])
+    languages = Vocabulary.pid.with_type_ctx("languages")
+
+    resolved = index.lookup(languages, ["en", "unknown"])
+    assert set(resolved) == {"en"}
+    assert resolved["en"]["title"]["en"] == "English"
+
+    # lookups return copies, the indexed records are never modified
+    resolved["en"]["title"]["en"] = "changed"
+    assert index.lookup(languages, ["en"])["en"]["title"]["en"] == "English"
+    assert index.stats()["loads"] == 1
+    assert index.stats()["types"]["languages"] == {"version": 0, "size": 2, "current": True}
+
+    # a change of a vocabulary item increases the version and reloads the vocabulary
+    after_record_update.send(app, record={"id": "en", "type": {"id": "languages"}})
+    assert index.version("languages") == 1
+    assert not index.stats()["types"]["languages"]["current"]
+    assert set(index.lookup(languages, ["en", "cs"])) == {"en", "cs"}
+    assert index.stats()["loads"] == 2
+
+    # vocabularies of other types are not indexed
+    assert index.lookup(Vocabulary.pid.with_type_ctx("resourcetypes"), ["en"]) is None
+
+    # references resolved from the index are not queried
+    assert set(resolve_pids(languages, ["en", "cs"], vocabulary_index=index)) == {"en", "cs"}
+    assert index.stats()["loads"] == 2
+
+
+def test_vocabulary_index_max_size(app, vocabulary_fixtures):
+    index = VocabularyIndex(types=["languages"], max_size=1)
+    languages = Vocabulary.pid.with_type_ctx("languages")
+    assert index.lookup(languages, ["en"]) is None
+    assert index.stats()["types"]["languages"]["size"] is None
+    # too large vocabularies are resolved from the database
+    assert set(resolve_pids(languages, ["en"], vocabulary_index=index)) == {"en"}
+
+
+def test_get_vocabulary_index():
+    assert get_vocabulary_index(None) is None
+    index = get_vocabulary_index(["languages"])
+    assert index is get_process_vocabulary_index()
+    assert "languages" in index.types
+    assert get_vocabulary_index({"types": ["licenses"], "max_size": 10}).max_size == 10
+    with pytest.raises(ValueError, match="Unknown vocabulary_preload"):
+        get_vocabulary_index("languages")
@@ -337,8 +337,12 @@ def facet_model(model_types):
         record_type="Record",
         customizations=[
             AddFacetGroup("curator", ["metadata.b", "metadata.jej.c", "metadata.vlastni"]),
-            AddFacetGroup("default", ["metadata.b", "metadata.jej.c"]),
+            AddFacetGroup(
+                "default",
+                ["metadata.b", "metadata.jej.c", "metadata.b_nes.c", "metadata.b_nes.f.g"],
+            ),
             AddFacetGroup("owner", ["metadata.jej.c", "metadata.b"]),
+            AddFacetGroup("b_only", ["metadata.b"]),
         ],
     )
 
@@ -772,6 +776,30 @@ def ui_links_model(model_types):
     return ui_links_model
 
 
+@pytest.fixture(scope="session")
+def projection_model(model_types):
+    from oarepo_model.api import model
+    from oarepo_model.presets.records_resources import records_resources_preset
+
+    t1 = time.time()
+
+    projection_model = model(
+        name="projection_test",
+        version="1.0.0",
+        presets=[records_resources_preset],
+        types=[model_types],
+        metadata_type="Metadata",
+        customizations=[],
+        configuration={"list_projection": ["metadata.title"], "export_stream_page_size": 2},
+    )
+    projection_model.register()
+
+    t2 = time.time()
+    log.info("Model created in %.2f seconds", t2 - t1)
+
+    return projection_model
+
+
 @pytest.fixture(scope="module")
 def app_config(
     app_config,
@@ -879,6 +907,7 @@ def extra_entry_points(
     ui_links_model,
     datacite_exports_model,
     synthetic_metadata_model,
+    projection_model,
 ):
     return {
         "invenio_base.blueprints": [
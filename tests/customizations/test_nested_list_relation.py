@@ -0,0 +1,68 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from invenio_records.systemfields.relations import InvalidRelationValue
+from oarepo_runtime.records.systemfields.relations import PIDArbitraryNestedListRelation
+
+from oarepo_model.customizations.high_level.add_pid_relation import ARRAY_PATH_ITEM, AddPIDRelation
+from oarepo_model.customizations.high_level.nested_list_relation import PIDNestedListsRelation
+
+RECORD = {
+    "metadata": {
+        "creators": [
+            {"person": {"affiliations": [{"ref": {"id": "a"}}, {"ref": {"id": "b"}}, {"name": "no ref"}]}},
+            {"person": {}},
+            {"person": {"affiliations": [{"ref": {"id": "c"}}]}},
+        ],
+    },
+}
+
+
+def _relations(cls: type) -> Any:
+    return cls(array_paths=["metadata.creators", "person.affiliations"], relation_field="ref", pid_field=None)
+
+
+def test_nested_list_relation_matches_arbitrary_path_relation():
+    relation = _relations(PIDNestedListsRelation)
+    arbitrary = _relations(PIDArbitraryNestedListRelation)
+
+    result = relation.get_value(RECORD)
+    assert [v["id"] for v in result.iter_values()] == ["a", "b", "c"]
+    assert result._lookup_data() == arbitrary.get_value(RECORD)._lookup_data()
+
+    visited = []
+    result._apply_items(lambda v, keys, attrs: visited.append(v["id"]))
+    assert visited == ["a", "b", "c"]
+
+    with pytest.raises(InvalidRelationValue):
+        list(relation.get_value({"metadata": {"creators": {"person": {}}}}).iter_values())
+
+
+def test_add_pid_relation_uses_nested_list_relation():
+    relations = {}
+
+    class Builder:
+        def get_dictionary(self, name):
+            return relations
+
+    AddPIDRelation(
+        name="metadata.creators.person.affiliations.ref",
+        path=["metadata", "creators", ARRAY_PATH_ITEM, "person", "affiliations", ARRAY_PATH_ITEM, "ref"],
+        keys=["id"],
+        pid_field=None,
+    ).apply(Builder(), None)
+
+    relation = relations["metadata.creators.person.affiliations.ref"]
+    assert isinstance(relation, PIDNestedListsRelation)
+    assert relation.array_segments == (("metadata", "creators"), ("person", "affiliations"))
+    assert relation.relation_segments == ("ref",)
@@ -0,0 +1,178 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+from typing import Any
+
+import marshmallow as ma
+import pytest
+
+from oarepo_model.compiled_schema import CompiledSchemaMixin, compile_schema
+
+ELEMENT = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "fulltext+keyword", "required": True},
+        "count": {"type": "int", "min_inclusive": 0},
+        "ratio": {"type": "double"},
+        "flag": {"type": "boolean"},
+        "published": {"type": "date"},
+        "created": {"type": "datetime"},
+        "tags": {"type": "array", "items": {"type": "keyword", "max_length": 5}},
+        "extra": {"type": "dynamic-object"},
+        "authors": {
+            "type": "array",
+            "items": {
+                "type": "polymorphic",
+                "discriminator": "kind",
+                "oneof": [
+                    {"discriminator": "person", "type": "Person"},
+                    {"discriminator": "organization", "type": "Organization"},
+                ],
+            },
+        },
+        "location": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "keyword"},
+                "zip": {"type": "keyword", "pattern": "^[0-9]+$"},
+            },
+        },
+    },
+}
+
+EXTRA_TYPES = {
+    "Person": {
+        "type": "object",
+        "properties": {"kind": {"type": "keyword"}, "name": {"type": "keyword"}},
+    },
+    "Organization": {
+        "type": "object",
+        "properties": {"kind": {"type": "keyword"}, "ror": {"type": "keyword"}},
+    },
+}
+
+VALID = [
+    {"title": "a"},
+    {
+        "title": "Book",
+        "count": 3,
+        "ratio": 0.5,
+        "flag": True,
+        "published": "2024-02-29",
+        "created": "2024-02-29T10:00:00",
+        "tags": ["a", "bc"],
+        "extra": {"anything": [1, 2]},
+        "authors": [
+            {"kind": "person", "name": "Doe"},
+            {"kind": "organization", "ror": "123"},
+        ],
+        "location": {"city": "Prague", "zip": "16000"},
+    },
+    {"title": "coerced", "count": "7", "ratio": 1, "flag": "true", "published": "20240229"},
+]
+
+INVALID = [
+    {},
+    {"title": None},
+    {"title": "a", "count": -1},
+    {"title": "a", "count": 1.5},
+    {"title": "a", "ratio": "nan"},
+    {"title": "a", "published": "2023-02-29"},
+    {"title": "a", "tags": ["too long"]},
+    {"title": "a", "tags": "a"},
+    {"title": "a", "authors": [{"kind": "robot"}]},
+    {"title": "a", "authors": [{"kind": 1}]},
+    {"title": "a", "authors": [{"kind": ["person"]}]},
+    {"title": "a", "authors": [{"kind": {"a": 1}}]},
+    {"title": "a", "authors": [{"name": "Doe"}]},
+    {"title": "a", "location": {"zip": "abc"}},
+    {"title": "a", "location": {"unknown": 1}},
+    {"title": "a", "unknown": 1},
+    [],
+]
+
+
+@pytest.fixture
+def schemas(datatype_registry) -> tuple[type[ma.Schema], type[ma.Schema]]:
+    datatype_registry.add_types(EXTRA_TYPES)
+    plain = datatype_registry.get_type(ELEMENT).create_marshmallow_schema(ELEMENT)
+    compiled = type("CompiledSchema", (CompiledSchemaMixin, plain), {})
+    return plain, compiled
+
+
+def _load(schema: ma.Schema, data: Any) -> tuple[str, Any]:
+    try:
+        return "ok", schema.load(data)
+    except ma.ValidationError as e:
+        return "error", e.messages
+
+
+@pytest.mark.parametrize("data", VALID + INVALID)
+def test_compiled_load_is_identical(schemas, data):
+    plain, compiled = schemas
+    assert _load(compiled(), data) == _load(plain(), data)
+    assert _load(compiled(unknown=ma.EXCLUDE), data) == _load(plain(unknown=ma.EXCLUDE), data)
+    assert _load(compiled(unknown=ma.INCLUDE), data) == _load(plain(unknown=ma.INCLUDE), data)
+
+
+@pytest.mark.parametrize("data", VALID)
+def test_compiled_dump_is_identical(schemas, data):
+    plain, compiled = schemas
+    loaded = plain().load(data)
+    assert compiled().dump(loaded) == plain().dump(loaded)
+    assert compiled().dump({**loaded, "ignored": 1}) == plain().dump(loaded)
+
+
+def test_compile_schema(schemas):
+    plain, _ = schemas
+    compiled = compile_schema(plain)
+    assert compiled is not None
+    assert compiled is compile_schema(plain())
+    assert compiled.fully_compiled
+
+    for data in VALID:
+        assert compiled.load(data) == plain().load(data)
+        loaded = plain().load(data)
+        assert compiled.dump(loaded) == plain().dump(loaded)
+
+    with pytest.raises(ma.ValidationError) as e:
+        compiled.load({"title": "a", "count": -1})
+    assert e.value.messages == {"count": ["Must be greater than or equal to 0."]}
+
+
+def test_schema_with_hooks_is_not_compiled():
+    class HookSchema(ma.Schema):
+        a = ma.fields.String()
+
+        @ma.post_load
+        def upper(self, data: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+            return {"a": data["a"].upper()}
+
+    assert compile_schema(HookSchema) is None
+
+    class CompiledHookSchema(CompiledSchemaMixin, HookSchema):
+        pass
+
+    assert CompiledHookSchema().load({"a": "x"}) == {"a": "X"}
+
+
+def test_uncompiled_fields_are_delegated():
+    class Schema(CompiledSchemaMixin, ma.Schema):
+        a = ma.fields.String()
+        b = ma.fields.Method(serialize="get_b", deserialize="load_b")
+
+        def get_b(self, obj: Any) -> str:
+            return "b"
+
+        def load_b(self, value: Any) -> str:
+            return value * 2
+
+    assert Schema().load({"a": "x", "b": "y"}) == {"a": "x", "b": "yy"}
+    assert Schema().dump({"a": "x"}) == {"a": "x", "b": "b"}
@@ -0,0 +1,110 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+import edtf
+import marshmallow as ma
+import pytest
+
+from oarepo_model.datatypes.date import (
+    CachedMultilayerEDTFValidator,
+    EDTFValidationCache,
+    edtf_validation_cache,
+)
+
+
+def test_cache_is_shared_between_validator_instances():
+    cache = EDTFValidationCache(maxsize=10)
+    first = CachedMultilayerEDTFValidator(types=[edtf.Date], cache=cache)
+    second = CachedMultilayerEDTFValidator(types=[edtf.Date], cache=cache)
+
+    assert first("2020-05") == "2020-05"
+    assert second("2020-05") == "2020-05"
+
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.fast_path == 1
+    assert info.currsize == 1
+
+
+def test_cache_is_keyed_by_allowed_types():
+    cache = EDTFValidationCache(maxsize=10)
+    date_or_interval = CachedMultilayerEDTFValidator(types=[edtf.Date, edtf.Interval], cache=cache)
+    date_only = CachedMultilayerEDTFValidator(types=[edtf.Date], cache=cache)
+
+    assert date_or_interval("1964/2008") == "1964/2008"
+    with pytest.raises(ma.ValidationError):
+        date_only("1964/2008")
+    assert cache.info().currsize == 1
+
+
+def test_cache_is_bounded():
+    cache = EDTFValidationCache(maxsize=2)
+    validator = CachedMultilayerEDTFValidator(types=[edtf.Date], cache=cache)
+    for value in ("2001", "2002", "2003"):
+        validator(value)
+    assert cache.info().currsize == 2
+
+    cache.resize(1)
+    assert cache.info().currsize == 1
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 1, 0)
+
+
+@pytest.mark.parametrize(
+    ("value", "types"),
+    [
+        ("2020", [edtf.Date]),
+        ("2020-02", [edtf.Date]),
+        ("2020-02-29", [edtf.Date]),
+        ("2020/2021-05", [edtf.Interval]),
+        ("2004-02-01/2005-02-08", [edtf.Date, edtf.Interval]),
+    ],
+)
+def test_fast_path_accepts_common_shapes(value, types):
+    cache = EDTFValidationCache()
+    assert CachedMultilayerEDTFValidator(types=types, cache=cache)(value) == value
+    assert cache.info().fast_path == 1
+
+
+@pytest.mark.parametrize(
+    ("value", "types"),
+    [
+        ("2021-02-29", [edtf.Date]),
+        ("2020-13", [edtf.Date]),
+        ("2021/2020", [edtf.Interval]),
+        ("2020-05/2020", [edtf.Interval]),
+        ("2020", [edtf.Interval]),
+        ("2020?", [edtf.Date]),
+    ],
+)
+def test_fast_path_defers_to_parser(value, types):
+    cache = EDTFValidationCache()
+    validator = CachedMultilayerEDTFValidator(types=types, cache=cache)
+    try:
+        validator(value)
+    except ma.ValidationError:
+        pass
+    assert cache.info().fast_path == 0
+
+
+def test_invalid_values_are_not_cached():
+    cache = EDTFValidationCache()
+    validator = CachedMultilayerEDTFValidator(types=[edtf.Date], cache=cache)
+    for _ in range(2):
+        with pytest.raises(ma.ValidationError):
+            validator("not a date")
+    assert cache.info().currsize == 0
+    assert cache.info().misses == 2
+
+
+def test_validators_use_process_wide_cache_by_default():
+    assert CachedMultilayerEDTFValidator(types=[edtf.Date]).cache is edtf_validation_cache
@@ -0,0 +1,166 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+from oarepo_model.presets.records_resources.records.mapping_optimizer import (
+    MAX_IGNORE_ABOVE,
+    optimize_mapping,
+    tune_facet_mapping,
+)
+
+ELEMENT = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "fulltext+keyword"},
+        "note": {"type": "fulltext+keyword", "indexed": False},
+        "code": {"type": "keyword", "searchable": False},
+        "count": {"type": "int", "indexed": False},
+        "tags": {"type": "array", "indexed": False, "items": {"type": "keyword"}},
+        "published": {"type": "edtf-date-or-interval", "indexed": False},
+        "display": {
+            "type": "object",
+            "indexed": False,
+            "properties": {"a": {"type": "keyword"}, "b": {"type": "fulltext+keyword"}},
+        },
+        "items": {
+            "type": "nested",
+            "indexed": False,
+            "properties": {"a": {"type": "keyword"}},
+        },
+    },
+}
+
+
+def test_optimize_mapping(datatype_registry):
+    datatype = datatype_registry.get_type(ELEMENT)
+    original = datatype.create_mapping(ELEMENT)
+    optimized, report = optimize_mapping(datatype, ELEMENT, original)
+    properties = optimized["properties"]
+
+    assert properties["title"] == original["properties"]["title"]
+    assert properties["note"] == {"type": "text", "index": False, "norms": False}
+    assert properties["code"] == {"type": "keyword", "ignore_above": 256, "doc_values": False}
+    assert properties["count"] == {"type": "integer", "index": False, "doc_values": False}
+    assert properties["tags"]["index"] is False
+    assert properties["published"]["index"] is False
+    assert properties["published_range"] == {"type": "date_range", "index": False}
+    assert properties["display"] == {"type": "object", "enabled": False}
+    assert properties["items"]["type"] == "nested"
+    assert properties["items"]["properties"]["a"]["index"] is False
+
+    # note + note.keyword, count, tags, published, published_range, display.a, display.b + keyword, items.a
+    assert report.indexed_fields_removed == 10
+    assert report.doc_values_removed == 1
+    assert report.skipped_fields == []
+    assert "display" in report.disabled_fields
+
+    # original (possibly shared) mappings are not modified
+    assert "index" not in datatype.create_mapping(ELEMENT)["properties"]["count"]
+
+
+def test_polymorphic_fields_are_optimized_only_if_all_variants_agree(datatype_registry):
+    datatype_registry.add_types(
+        {
+            "A": {"type": "object", "properties": {"kind": {"type": "keyword"}, "x": {"type": "keyword"}}},
+            "B": {
+                "type": "object",
+                "properties": {
+                    "kind": {"type": "keyword", "indexed": False},
+                    "x": {"type": "keyword", "indexed": False},
+                    "y": {"type": "keyword", "indexed": False},
+                },
+            },
+        },
+    )
+    element = {
+        "type": "object",
+        "properties": {
+            "value": {
+                "type": "polymorphic",
+                "discriminator": "kind",
+                "oneof": [{"discriminator": "a", "type": "A"}, {"discriminator": "b", "type": "B"}],
+            },
+        },
+    }
+    datatype = datatype_registry.get_type(element)
+    optimized, _ = optimize_mapping(datatype, element, datatype.create_mapping(element))
+    value = optimized["properties"]["value"]["properties"]
+    assert "index" not in value["x"]
+    assert value["y"]["index"] is False
+
+
+FACET_ELEMENT = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "fulltext+keyword", "max_length": 1000},
+        "code": {"type": "keyword"},
+        "huge": {"type": "keyword", "max_length": 100000},
+        "short": {"type": "keyword", "max_length": 10},
+        "text": {"type": "fulltext"},
+        "nested": {"type": "nested", "properties": {"tag": {"type": "keyword", "max_length": 500}}},
+    },
+}
+
+
+def test_tune_facet_mapping(datatype_registry):
+    datatype = datatype_registry.get_type(FACET_ELEMENT)
+    facets = datatype.get_facet("metadata", FACET_ELEMENT, [], {})
+    mapping, report = tune_facet_mapping(
+        datatype,
+        FACET_ELEMENT,
+        datatype.create_mapping(FACET_ELEMENT),
+        facets,
+        prefix="metadata",
+        eager_global_ordinals=["metadata.code", "metadata.nested.tag"],
+        ignore_above=256,
+    )
+    properties = mapping["properties"]
+
+    assert properties["title"]["fields"]["keyword"] == {"type": "keyword", "ignore_above": 1000}
+    assert properties["code"] == {"type": "keyword", "ignore_above": 256, "eager_global_ordinals": True}
+    assert properties["huge"]["ignore_above"] == MAX_IGNORE_ABOVE
+    assert properties["short"]["ignore_above"] == 256
+    assert properties["text"] == {"type": "text"}
+    assert properties["nested"]["properties"]["tag"] == {
+        "type": "keyword",
+        "ignore_above": 500,
+        "eager_global_ordinals": True,
+    }
+    assert sorted(report.eager_global_ordinals_fields) == ["metadata.code", "metadata.nested.tag"]
+    assert sorted(report.ignore_above_fields) == ["metadata.huge", "metadata.nested.tag", "metadata.title.keyword"]
+
+    # original (shared) mappings are not modified
+    assert datatype.create_mapping(FACET_ELEMENT)["properties"]["title"]["fields"]["keyword"]["ignore_above"] == 256
+
+
+def test_tune_facet_mapping_keeps_ignore_above(datatype_registry):
+    datatype = datatype_registry.get_type(FACET_ELEMENT)
+    facets = datatype.get_facet("metadata", FACET_ELEMENT, [], {})
+    generated = datatype.create_mapping(FACET_ELEMENT)
+    # without ignore_above the generated values are kept, even for fields with max_length
+    mapping, report = tune_facet_mapping(datatype, FACET_ELEMENT, generated, facets, prefix="metadata")
+    assert mapping == generated
+    assert report.ignore_above_fields == []
+
+
+def test_tune_facet_mapping_defaults(datatype_registry):
+    datatype = datatype_registry.get_type(FACET_ELEMENT)
+    facets = datatype.get_facet("", FACET_ELEMENT, [], {})
+    mapping, _ = tune_facet_mapping(
+        datatype,
+        FACET_ELEMENT,
+        datatype.create_mapping(FACET_ELEMENT),
+        facets,
+        eager_global_ordinals=True,
+        ignore_above=512,
+    )
+    properties = mapping["properties"]
+    assert properties["code"] == {"type": "keyword", "ignore_above": 512, "eager_global_ordinals": True}
+    assert properties["short"] == {"type": "keyword", "ignore_above": 256, "eager_global_ordinals": True}
+    assert properties["title"]["fields"]["keyword"]["eager_global_ordinals"] is True
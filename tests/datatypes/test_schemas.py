@@ -361,6 +361,39 @@ def test_time_field(test_schema):
         schema.load({"a": "17:00:01"})
 
 
+def test_date_fields_fast_validation(test_schema):
+    from oarepo_model.datatypes.date import iso_validation_cache
+
+    iso_validation_cache.clear()
+    date_schema = test_schema({"type": "date"})
+    datetime_schema = test_schema({"type": "datetime"})
+    time_schema = test_schema({"type": "time"})
+
+    for _ in range(2):
+        assert date_schema.load({"a": "2023-01-02"}) == {"a": "2023-01-02"}
+        assert datetime_schema.load({"a": "2023-01-02T10:20:30Z"}) == {"a": "2023-01-02T10:20:30Z"}
+        assert time_schema.load({"a": "10:20"}) == {"a": "10:20"}
+
+    info = iso_validation_cache.info()
+    assert info.fast_path == 3
+    assert info.hits == 3
+
+    # invalid values fall back to marshmallow and keep its error messages
+    with pytest.raises(ma.ValidationError) as exc:
+        date_schema.load({"a": "2023-02-30"})
+    assert exc.value.messages == {"a": ["Not a valid date."]}
+
+    with pytest.raises(ma.ValidationError) as exc:
+        datetime_schema.load({"a": "2023-01-02T25:00:00"})
+    assert exc.value.messages == {"a": ["Not a valid datetime."]}
+
+    with pytest.raises(ma.ValidationError) as exc:
+        time_schema.load({"a": "noon"})
+    assert exc.value.messages == {"a": ["Not a valid time."]}
+
+    assert iso_validation_cache.info().currsize == 3
+
+
 def test_edtf_time_field(test_schema):
     schema = test_schema(
         {
@@ -16,6 +16,8 @@ import pytest
 from babel.numbers import format_decimal
 from flask_babel import get_locale
 
+from oarepo_model.datatypes.date import get_l10n_formats, l10n_formats
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -61,6 +63,24 @@ def test_date_ui_schema(test_ui_schema):
     }
 
 
+def test_date_ui_schema_requested_formats(test_ui_schema):
+    schema = test_ui_schema(
+        {
+            "type": "date",
+        },
+    )
+
+    with l10n_formats(["medium"]):
+        assert get_l10n_formats() == {"medium"}
+        assert schema.dump({"a": "2023-01-01"}) == {"a_l10n_medium": "Jan 1, 2023"}
+
+    with l10n_formats([]):
+        assert schema.dump({"a": "2023-01-01"}) == {}
+
+    assert get_l10n_formats() is None
+    assert len(schema.dump({"a": "2023-01-01"})) == 4
+
+
 def test_datetime_ui_schema(test_ui_schema):
     schema = test_ui_schema(
         {
@@ -0,0 +1,78 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+import json
+
+import marshmallow as ma
+
+from oarepo_model.bench import FieldTimer, ModelBenchmark, percentile
+
+
+def test_percentile():
+    assert percentile([], 50) == 0.0
+    values = [float(x) for x in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 99) == 3.0
+
+
+def test_field_timer():
+    class Inner(ma.Schema):
+        name = ma.fields.String()
+
+    class Outer(ma.Schema):
+        title = ma.fields.String()
+        items = ma.fields.List(ma.fields.Nested(Inner))
+
+    schema = Outer()
+    timer = FieldTimer()
+    timer.instrument(schema)
+    schema.load({"title": "x", "items": [{"name": "a"}, {"name": "b"}]})
+
+    assert timer.calls["title"] == 1
+    assert timer.calls["items"] == 3  # the list and its two items
+    assert timer.calls["items.name"] == 2
+    assert {path for path, _, _ in timer.top(10)} == {"title", "items", "items.name"}
+    assert len(timer.top(1)) == 1
+
+
+def test_model_benchmark(app, empty_model):
+    records = [
+        {"metadata": {"title": "First"}, "files": {"enabled": False}},
+        {"metadata": {"title": "Second", "height": 10}, "files": {"enabled": False}},
+        {"metadata": {"height": "not a number"}, "files": {"enabled": False}},
+    ]
+    report = ModelBenchmark(empty_model, top_fields=5).run(records)
+
+    assert report.records == 3
+    assert report.failed == 1
+    assert report.errors[0][:2] == (3, "load")
+    assert len(report.latencies) == 2
+    assert all(report.steps[step] > 0 for step in ("load", "dump", "ui"))
+    assert "metadata.title" in {path for path, _, _ in report.top_fields}
+
+    formatted = report.format()
+    assert "records: 3 (1 failed)" in formatted
+    assert "p99" in formatted
+
+
+def test_bench_command(app, cli_runner, empty_model, tmp_path):
+    from oarepo_model.cli import bench
+
+    input_file = tmp_path / "records.jsonl"
+    input_file.write_text(
+        "\n".join(json.dumps({"metadata": {"title": f"Record {i}"}, "files": {"enabled": False}}) for i in range(5)),
+    )
+    profile_file = tmp_path / "bench.prof"
+    result = cli_runner(bench, "test", "--input", str(input_file), "--limit", "3", "--profile", str(profile_file))
+    assert result.exit_code == 0, result.output
+    assert "records: 3 (0 failed)" in result.output
+    assert "top fields:" in result.output
+    assert profile_file.exists()
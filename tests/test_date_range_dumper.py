@@ -14,6 +14,8 @@ from oarepo_model.api import model
 from oarepo_model.presets.records_resources import records_preset
 from oarepo_model.presets.records_resources.records.date_range_dumper_ext import (
     EDTFDateRangeDumperExt,
+    build_path_tree,
+    edtf_range,
 )
 
 
@@ -152,3 +154,64 @@ def test_dumps_and_loads_nested_date_range_paths():
     assert "date_range" not in loaded["metadata"]["related_resources"][0]["dates"][0]
     assert loaded["metadata"]["related_resources"][0]["events"][0]["dates"][0]["date"] == "1999/2000"
     assert "date_range" not in loaded["metadata"]["related_resources"][0]["events"][0]["dates"][0]
+
+
+def test_shared_prefixes_are_merged():
+    tree = build_path_tree(
+        [
+            ["metadata", "dates", "[]", "date"],
+            ["metadata", "dates", "[]", "end"],
+            ["metadata", "issued"],
+        ],
+    )
+    assert list(tree.children) == ["metadata"]
+    metadata = tree.children["metadata"]
+    assert set(metadata.children) == {"dates", "issued"}
+    assert metadata.children["issued"].leaf
+    assert set(metadata.children["dates"].children["[]"].children) == {"date", "end"}
+
+    dumper = EDTFDateRangeDumperExt(
+        [
+            ["metadata", "dates", "[]", "date"],
+            ["metadata", "dates", "[]", "end"],
+            ["metadata", "issued"],
+        ],
+    )
+    result = dumper.dump(
+        None,
+        {
+            "metadata": {
+                "dates": [{"date": "2020", "end": "2021-03"}, {"other": "x"}],
+                "issued": "2019-01-02",
+            },
+        },
+    )
+    assert result == {
+        "metadata": {
+            "dates": [
+                {
+                    "date": "2020",
+                    "date_range": {"gte": "2020-01-01", "lte": "2020-12-31"},
+                    "end": "2021-03",
+                    "end_range": {"gte": "2021-03-01", "lte": "2021-03-31"},
+                },
+                {"other": "x"},
+            ],
+            "issued": "2019-01-02",
+            "issued_range": {"gte": "2019-01-02", "lte": "2019-01-02"},
+        },
+    }
+    # ranges are separate dictionaries even if the cached bounds are shared
+    assert (
+        result["metadata"]["dates"][0]["date_range"]
+        is not dumper.dump(None, {"metadata": {"dates": [{"date": "2020"}]}})["metadata"]["dates"][0]["date_range"]
+    )
+
+
+def test_edtf_range_is_cached():
+    edtf_range.cache_clear()
+    assert edtf_range("1999/2000") == ("1999-01-01", "2000-12-31")
+    assert edtf_range("1999/2000") == ("1999-01-01", "2000-12-31")
+    info = edtf_range.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
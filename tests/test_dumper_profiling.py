@@ -0,0 +1,107 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+from copy import deepcopy
+
+import pytest
+from invenio_records.dumpers import SearchDumperExt
+
+from oarepo_model.api import model
+from oarepo_model.presets.records_resources import records_preset
+from oarepo_model.presets.records_resources.records.date_range_dumper_ext import EDTFDateRangeDumperExt
+from oarepo_model.presets.records_resources.records.dumper_profiling import DumperProfile
+from oarepo_model.presets.records_resources.records.path_dumper_ext import (
+    FusedPathDumperExt,
+    PathDumperExt,
+    fuse_dumper_extensions,
+)
+
+
+class UpperDumperExt(PathDumperExt):
+    def dump_step(self, key):
+        def step(data):
+            if isinstance(data, dict) and key in data:
+                data[f"{key}_upper"] = data[key].upper()
+
+        return step
+
+    def load_step(self, key):
+        def step(data):
+            if isinstance(data, dict):
+                data.pop(f"{key}_upper", None)
+
+        return step
+
+
+class OtherDumperExt(SearchDumperExt):
+    pass
+
+
+def test_fuse_dumper_extensions():
+    dates = EDTFDateRangeDumperExt([["metadata", "dates", "[]", "date"]])
+    titles = UpperDumperExt([["metadata", "title"], ["metadata", "dates", "[]", "date"]])
+    other = OtherDumperExt()
+
+    fused = fuse_dumper_extensions([dates, titles, other, dates])
+    assert isinstance(fused[0], FusedPathDumperExt)
+    assert fused[0].extensions == [dates, titles]
+    assert fused[1:] == [other, dates]
+    assert repr(fused[0]) == "FusedPathDumperExt(EDTFDateRangeDumperExt, UpperDumperExt)"
+
+    data = {"metadata": {"title": "abc", "dates": [{"date": "2020"}, {}]}}
+    dumped = fused[0].dump(None, deepcopy(data))
+    # the same result as running the extensions one after another
+    assert dumped == titles.dump(None, dates.dump(None, deepcopy(data)))
+    assert dumped["metadata"]["dates"][0] == {
+        "date": "2020",
+        "date_range": {"gte": "2020-01-01", "lte": "2020-12-31"},
+        "date_upper": "2020",
+    }
+    assert fused[0].load(dumped, None) == data
+
+
+def test_path_dumper_ext_requires_steps():
+    class DumpOnlyDumperExt(PathDumperExt):
+        def dump_step(self, key):
+            return lambda data: None
+
+    with pytest.raises(TypeError):
+        DumpOnlyDumperExt([["metadata", "title"]])
+
+
+def test_dumper_profile():
+    profile = DumperProfile(buckets=(0.1, 1.0, float("inf")))
+    profile.observe("Ext", "dump", 0.05)
+    profile.observe("Ext", "dump", 0.5)
+    profile.observe("Ext", "load", 2)
+    stats = profile.stats()
+    assert stats["Ext"]["dump"]["count"] == 2
+    assert stats["Ext"]["dump"]["max"] == 0.5
+    assert stats["Ext"]["dump"]["histogram"] == {0.1: 1, 1.0: 2, float("inf"): 2}
+    assert stats["Ext"]["load"]["histogram"] == {0.1: 0, 1.0: 0, float("inf"): 1}
+    profile.clear()
+    assert profile.stats() == {}
+
+
+def test_dumper_profiling_preset():
+    m = model(
+        name="dumper_profiling_test",
+        version="1.0.0",
+        presets=[records_preset],
+        types=[{"Metadata": {"properties": {"date": {"type": "edtf-date-or-interval"}}}}],
+        metadata_type="Metadata",
+        configuration={"dumper_profiling": True},
+    )
+    dumper = m.Record.dumper
+    extensions = {extension.name: extension for extension in dumper._extensions}
+    assert set(extensions) == {"RelationDumperExt", "EDTFDateRangeDumperExt"}
+    extensions["EDTFDateRangeDumperExt"].dump(None, {"metadata": {"date": "2020"}})
+    stats = dumper.profile.stats()
+    assert stats["EDTFDateRangeDumperExt"]["dump"]["count"] == 1
@@ -0,0 +1,50 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+import json
+
+from flask_resources import BaseSerializer, JSONSerializer
+from oarepo_runtime.api import Export
+
+from oarepo_model.presets.records_resources.resources.records.export_stream import (
+    export_stream_lines,
+    is_json_mimetype,
+)
+
+
+class UpperSerializer(BaseSerializer):
+    def serialize_object(self, obj):
+        return obj["title"].upper()
+
+
+def test_is_json_mimetype():
+    assert is_json_mimetype("application/json")
+    assert is_json_mimetype("application/linkset+json")
+    assert not is_json_mimetype("application/xml")
+
+
+def test_export_stream_lines(app):
+    items = [{"id": "a", "title": "first"}, {"id": "b", "title": "second"}]
+
+    json_export = Export(
+        code="json",
+        name="JSON",
+        mimetype="application/json",
+        serializer=JSONSerializer(options={"indent": 2}),
+    )
+    lines = list(export_stream_lines(items, json_export))
+    assert all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+    assert [json.loads(line) for line in lines] == items
+
+    text_export = Export(code="upper", name="Upper", mimetype="text/plain", serializer=UpperSerializer())
+    assert [json.loads(line) for line in export_stream_lines(items, text_export)] == [
+        {"id": "a", "export": "FIRST"},
+        {"id": "b", "export": "SECOND"},
+    ]
@@ -0,0 +1,116 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from oarepo_model.api import model
+from oarepo_model.customizations import SetIndexTotalFieldsLimit
+from oarepo_model.errors import IndexFieldsLimitError
+from oarepo_model.presets.records_resources import records_preset
+from oarepo_model.presets.records_resources.records.index_fields_budget import (
+    apply_index_fields_budget,
+    count_mapping_fields,
+    get_mapping_setting,
+)
+
+MAPPING = {
+    "dynamic": "strict",
+    "properties": {
+        "id": {"type": "keyword"},
+        "metadata": {
+            "properties": {
+                "title": {"type": "text", "fields": {"keyword": {"type": "keyword"}}},
+                "date": {"type": "date"},
+                "date_range": {"type": "date_range"},
+                "authors": {
+                    "type": "nested",
+                    "properties": {
+                        "name": {"type": "keyword"},
+                        "affiliation": {"properties": {"id": {"type": "keyword"}}},
+                    },
+                },
+            },
+        },
+        "custom_fields": {"type": "object", "dynamic": True},
+    },
+}
+
+
+def test_count_mapping_fields():
+    usage = count_mapping_fields(MAPPING)
+    # id, metadata, title + keyword, date, date_range, authors, name, affiliation, id, custom_fields
+    assert usage.total_fields == 11
+    assert usage.nested_fields == 1
+    assert usage.depth == 4
+    assert usage.subtrees == {"metadata": 9, "metadata.authors": 4}
+    assert usage.dynamic_paths == ["custom_fields"]
+
+
+def test_limits_are_set_with_headroom():
+    index = {"mappings": MAPPING}
+    apply_index_fields_budget("test", index)
+    assert "settings" not in index
+
+    many_fields = {"properties": {f"f{i}": {"type": "keyword"} for i in range(900)}}
+    index = {"mappings": many_fields}
+    apply_index_fields_budget("test", index, headroom=0.5)
+    assert index["settings"] == {"index.mapping.total_fields.limit": 1350}
+
+
+def test_explicit_limits_are_validated():
+    index = {"mappings": MAPPING, "settings": {"index": {"mapping": {"nested_fields": {"limit": 0}}}}}
+    with pytest.raises(IndexFieldsLimitError, match="nested_fields.limit is 0, but the mapping uses 1") as e:
+        apply_index_fields_budget("test", index)
+    assert "metadata: 9 fields" in str(e.value)
+    assert "dynamic (may grow at runtime): custom_fields" in str(e.value)
+
+    # enough room, kept as it is
+    index = {"mappings": MAPPING, "settings": {"index.mapping.total_fields.limit": 11}}
+    apply_index_fields_budget("test", index)
+    assert get_mapping_setting(index["settings"], "index.mapping.total_fields.limit") == 11
+
+
+def test_model_build_sets_and_validates_limits():
+    types = [{"Metadata": {"properties": {f"field{i}": {"type": "keyword"} for i in range(900)}}}]
+
+    # the budget is not applied unless enabled
+    m = model(
+        name="index_fields_budget_test",
+        version="1.0.0",
+        presets=[records_preset],
+        types=types,
+        metadata_type="Metadata",
+    )
+    mapping = json.loads(next(v for k, v in m.__files__.items() if k.startswith("mappings/os-v2/")))
+    assert "index.mapping.total_fields.limit" not in mapping.get("settings", {})
+
+    m = model(
+        name="index_fields_budget_test",
+        version="1.0.0",
+        presets=[records_preset],
+        types=types,
+        metadata_type="Metadata",
+        configuration={"index_fields_budget": True},
+    )
+    mapping = json.loads(next(v for k, v in m.__files__.items() if k.startswith("mappings/os-v2/")))
+    assert mapping["settings"]["index.mapping.total_fields.limit"] > 900
+
+    with pytest.raises(IndexFieldsLimitError, match="Largest subtrees:\n  metadata: 901 fields"):
+        model(
+            name="index_fields_budget_test",
+            version="1.0.0",
+            presets=[records_preset],
+            types=types,
+            metadata_type="Metadata",
+            customizations=[SetIndexTotalFieldsLimit(500)],
+            configuration={"index_fields_budget": True},
+        )
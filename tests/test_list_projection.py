@@ -0,0 +1,94 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+import marshmallow as ma
+import pytest
+
+from oarepo_model.api import model
+from oarepo_model.presets.drafts import drafts_records_preset
+from oarepo_model.presets.records_resources import records_preset
+from oarepo_model.presets.records_resources.services.records.list_projection import (
+    ListProjection,
+    ListProjectionParam,
+)
+
+TYPES = [
+    {
+        "Metadata": {
+            "properties": {
+                "title": {"type": "fulltext+keyword"},
+                "abstract": {"type": "fulltext"},
+                "published": {"type": "edtf-date-or-interval"},
+                "creators": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "keyword"},
+                            "affiliation": {"type": "keyword"},
+                        },
+                    },
+                },
+            },
+        },
+    },
+]
+
+
+def _list_projection(paths: list[str]) -> ListProjection:
+    m = model(
+        name="list_projection_test",
+        version="1.0.0",
+        presets=[records_preset],
+        types=TYPES,
+        metadata_type="Metadata",
+        configuration={"list_projection": paths},
+    )
+    param_cls = next(
+        cls for cls in m.RecordSearchOptions().params_interpreters_cls if issubclass(cls, ListProjectionParam)
+    )
+    return param_cls.list_projection
+
+
+def test_list_projection():
+    projection = _list_projection(["metadata.title", "metadata.creators.name"])
+
+    assert projection.schema_only == {"metadata.title", "metadata.creators.name"}
+    assert set(projection.source_excludes) == {
+        "metadata.abstract",
+        "metadata.published",
+        "metadata.published_range",
+        "metadata.creators.affiliation",
+    }
+
+    class Schema(ma.Schema):
+        id = ma.fields.String()
+        metadata = ma.fields.Dict()
+
+    assert projection.get_only(Schema, ui=False) == {"id", "metadata.title", "metadata.creators.name"}
+
+
+def test_unknown_list_projection_path():
+    with pytest.raises(ValueError, match="metadata.unknown does not exist"):
+        _list_projection(["metadata.unknown"])
+
+
+def test_draft_list_projection():
+    m = model(
+        name="draft_list_projection_test",
+        version="1.0.0",
+        presets=[records_preset, drafts_records_preset],
+        types=TYPES,
+        metadata_type="Metadata",
+        configuration={"list_projection": ["metadata.title"]},
+    )
+    for search_options in (m.RecordSearchOptions, m.DraftSearchOptions):
+        (param_cls,) = (cls for cls in search_options().params_interpreters_cls if issubclass(cls, ListProjectionParam))
+        assert "metadata.abstract" in param_cls.list_projection.source_excludes
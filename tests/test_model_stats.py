@@ -0,0 +1,85 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+from oarepo_model.api import model
+from oarepo_model.builder import InvenioModelBuilder
+from oarepo_model.presets.records_resources import records_preset
+from oarepo_model.presets.records_resources.records.index_fields_budget import TOTAL_FIELDS_LIMIT
+from oarepo_model.stats import estimate_size
+
+
+def test_model_stats():
+    m = model(
+        name="model_stats_test",
+        version="1.0.0",
+        presets=[records_preset],
+        types=[
+            {
+                "Person": {"properties": {"type": {"type": "keyword"}, "name": {"type": "keyword"}}},
+                "Organization": {"properties": {"type": {"type": "keyword"}, "ror": {"type": "keyword"}}},
+                "Metadata": {
+                    "properties": {
+                        "title": {"type": "fulltext+keyword"},
+                        "creators": {
+                            "type": "array",
+                            "items": {
+                                "type": "polymorphic",
+                                "discriminator": "type",
+                                "oneof": [
+                                    {"discriminator": "person", "type": "Person"},
+                                    {"discriminator": "organization", "type": "Organization"},
+                                ],
+                            },
+                        },
+                    },
+                },
+            },
+        ],
+        metadata_type="Metadata",
+    )
+    stats = m.get_stats()
+
+    assert stats.polymorphic_unions == 1
+    assert stats.relations == 0
+    assert stats.max_array_nesting == 1
+    # metadata.creators.[].name
+    assert stats.max_depth == 3
+    # title, creators.type (shared by both variants), creators.name and creators.ror
+    assert stats.leaf_fields == 4
+
+    assert stats.generated_classes > stats.schema_classes > 0
+    assert stats.retained_memory > 0
+    assert stats.mappings
+    for mapping in stats.mappings.values():
+        assert 0 < mapping.usage[TOTAL_FIELDS_LIMIT] <= mapping.limits[TOTAL_FIELDS_LIMIT]
+
+    formatted = stats.format()
+    assert "polymorphic unions: 1" in formatted
+    assert f"{TOTAL_FIELDS_LIMIT}: " in formatted
+
+    # the built model does not keep the builder alive
+    assert not any(isinstance(value, InvenioModelBuilder) for value in m.get_stats.keywords.values())
+
+
+def test_estimate_size():
+    shared = ["x" * 100]
+    seen: set[int] = set()
+    first = estimate_size({"a": shared}, seen)
+    # the shared list is counted only once
+    assert estimate_size({"b": shared}, seen) < first
+
+
+def test_stats_command(app, cli_runner, empty_model):
+    from oarepo_model.cli import stats
+
+    result = cli_runner(stats, "test")
+    assert result.exit_code == 0, result.output
+    assert "leaf fields: 3" in result.output
+    assert "generated classes:" in result.output
@@ -0,0 +1,108 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from invenio_records.signals import after_record_update
+from invenio_records_resources.records.systemfields import PIDRelation
+
+from oarepo_model.api import model
+from oarepo_model.presets.drafts import drafts_records_preset
+from oarepo_model.presets.records_resources import records_preset
+from oarepo_model.presets.records_resources.records.batched_relations import BatchedMultiRelationsField
+from oarepo_model.presets.records_resources.records.relation_cache import (
+    RelationValueCache,
+    get_process_relation_value_cache,
+    get_relation_value_cache,
+)
+
+
+def _key(pid_value: str) -> tuple:
+    return ("languages", pid_value, ("id", "title"), ())
+
+
+def test_relation_value_cache():
+    cache = RelationValueCache(maxsize=2)
+    value = {"title": {"en": "English"}, "@v": "uuid-en::1"}
+    cache.set(_key("en"), value)
+
+    cached = cache.get(_key("en"))
+    assert cached == value
+    # values are copied, modifications of a dereferenced record do not leak into the cache
+    cached["title"]["en"] = "changed"
+    assert cache.get(_key("en")) == value
+    assert cache.get(_key("cs")) is None
+
+    cache.set(_key("cs"), {"title": {"en": "Czech"}, "@v": "uuid-cs::1"})
+    cache.set(_key("de"), {"title": {"en": "German"}, "@v": "uuid-de::1"})
+    assert cache.get(_key("en")) is None
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == 0.5
+    assert stats["evictions"] == 1
+
+
+def test_relation_value_cache_ttl_and_invalidation(app):
+    cache = RelationValueCache(ttl=0.01)
+    cache.set(_key("en"), {"@v": "uuid-en::1"})
+    time.sleep(0.02)
+    assert cache.get(_key("en")) is None
+
+    cache = RelationValueCache()
+    cache.set(_key("en"), {"@v": "uuid-en::1"})
+    cache.set(("other", "en", ("id",), ()), {"@v": "uuid-en::1"})
+    cache.set(_key("cs"), {"@v": "uuid-cs::1"})
+    after_record_update.send(app, record=SimpleNamespace(id="uuid-en"))
+    assert cache.get(_key("en")) is None
+    assert cache.get(("other", "en", ("id",), ())) is None
+    assert cache.get(_key("cs")) is not None
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_get_relation_value_cache():
+    assert get_relation_value_cache(None) is None
+    assert get_relation_value_cache(True) is get_process_relation_value_cache()
+    assert get_relation_value_cache({"maxsize": 5}).maxsize == 5
+    with pytest.raises(ValueError, match="Unknown relation_value_cache"):
+        get_relation_value_cache("memory")
+
+
+def test_caches_are_shared_by_record_and_draft():
+    m = model(
+        name="shared_relation_caches_test",
+        version="1.0.0",
+        presets=[records_preset, drafts_records_preset],
+        types=[{"Metadata": {"properties": {"title": {"type": "keyword"}}}}],
+        metadata_type="Metadata",
+        configuration={
+            "relation_value_cache": {"maxsize": 10},
+            "vocabulary_preload": {"types": ["languages"]},
+        },
+    )
+    record_relations = m.Record.relations
+    draft_relations = m.Draft.relations
+    assert isinstance(record_relations._value_cache, RelationValueCache)
+    assert record_relations._value_cache is draft_relations._value_cache
+    assert record_relations.vocabulary_index is not None
+    assert record_relations.vocabulary_index is draft_relations.vocabulary_index
+
+
+def test_caches_do_not_clash_with_relation_names():
+    caches = {"value_cache": RelationValueCache(maxsize=10)}
+    relation = PIDRelation("metadata.vocabulary_index", pid_field=None)
+    field = BatchedMultiRelationsField(caches, vocabulary_index=relation, value_cache=relation)
+    assert field._value_cache is caches["value_cache"]
+    assert field.vocabulary_index is None
+    assert set(field._fields) == {"vocabulary_index", "value_cache"}
@@ -0,0 +1,111 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+import time
+
+from marshmallow_utils.fields import FormatDate
+
+from oarepo_model.api import model
+from oarepo_model.presets.records_resources import records_resources_preset
+
+RECORD = {
+    "id": "abcd-1234",
+    "created": "2020-01-02T10:00:00+00:00",
+    "updated": "2020-01-03T10:00:00+00:00",
+    "metadata": {"title": "Dated", "published": "2020-01-02"},
+}
+
+
+def _l10n_keys(dumped):
+    return {key for key in dumped["ui"] if "_l10n_" in key}
+
+
+def test_ui_l10n_formats(app):
+    m = model(
+        name="ui_l10n_formats_test",
+        version="1.0.0",
+        presets=[records_resources_preset],
+        types=[{"Metadata": {"properties": {"title": {"type": "keyword"}, "published": {"type": "date"}}}}],
+        metadata_type="Metadata",
+        configuration={"ui_l10n_formats": ["short"]},
+    )
+    serializer = m.JSONUISerializer()
+
+    # only the formats of the model configuration are computed
+    with app.test_request_context("/"):
+        assert _l10n_keys(serializer.dump_obj(RECORD)) == {
+            "published_l10n_short",
+            "created_date_l10n_short",
+            "updated_date_l10n_short",
+        }
+
+    # the query argument overrides the configuration, in lists as well
+    with app.test_request_context("/?l10n_formats=long,full"):
+        assert _l10n_keys(serializer.dump_obj(RECORD)) == {
+            "published_l10n_long",
+            "published_l10n_full",
+            "created_date_l10n_long",
+            "created_date_l10n_full",
+            "updated_date_l10n_long",
+            "updated_date_l10n_full",
+        }
+        (hit,) = serializer.dump_list({"hits": {"hits": [RECORD], "total": 1}})["hits"]["hits"]
+        assert _l10n_keys(hit) == {
+            "published_l10n_long",
+            "published_l10n_full",
+            "created_date_l10n_long",
+            "created_date_l10n_full",
+            "updated_date_l10n_long",
+            "updated_date_l10n_full",
+        }
+
+
+def test_ui_l10n_formats_dump_list_benchmark(app, monkeypatch):
+    """Compare dump_list of a search page with all localized formats and with the requested one."""
+    m = model(
+        name="ui_l10n_formats_bench_test",
+        version="1.0.0",
+        presets=[records_resources_preset],
+        types=[{"Metadata": {"properties": {"title": {"type": "keyword"}, "published": {"type": "date"}}}}],
+        metadata_type="Metadata",
+    )
+    serializer = m.JSONUISerializer()
+    page_size = 200
+
+    formatted = 0
+    format_value = FormatDate.format_value
+
+    def counting_format_value(self, value):
+        nonlocal formatted
+        formatted += 1
+        return format_value(self, value)
+
+    monkeypatch.setattr(FormatDate, "format_value", counting_format_value)
+
+    def dump_page(url):
+        nonlocal formatted
+        formatted = 0
+        page = {"hits": {"hits": [{**RECORD, "id": f"rec-{i}"} for i in range(page_size)], "total": page_size}}
+        with app.test_request_context(url):
+            start = time.perf_counter()
+            hits = serializer.dump_list(page)["hits"]["hits"]
+            elapsed = time.perf_counter() - start
+        assert len(hits) == page_size
+        return formatted, elapsed
+
+    # all four formats of the three dates (published, created and updated) of each record
+    all_formatted, all_elapsed = dump_page("/")
+    assert all_formatted == page_size * 3 * 4
+    requested_formatted, requested_elapsed = dump_page("/?l10n_formats=short")
+    assert requested_formatted == page_size * 3
+    print(  # noqa: T201 - benchmark report, shown with pytest -s
+        f"dump_list of {page_size} records: all l10n formats {all_elapsed * 1000:.1f} ms, "
+        f"requested format only {requested_elapsed * 1000:.1f} ms",
+    )
@@ -0,0 +1,134 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+from typing import Any
+
+import marshmallow as ma
+import pytest
+
+from oarepo_model.datatypes.date import l10n_formats
+from oarepo_model.presets.records_resources.services.records.ui_serialization_cache import (
+    MemoryUISerializationCache,
+    RedisUISerializationCache,
+    UISerializationCacheComponent,
+    UISerializationCacheMixin,
+    get_ui_serialization_cache,
+    schema_fingerprint,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, dict[str, bytes]] = {}
+        self.expires: dict[str, int] = {}
+
+    def hget(self, key: str, field: str) -> bytes | None:
+        return self.data.get(key, {}).get(field)
+
+    def hset(self, key: str, field: str, value: str) -> None:
+        self.data.setdefault(key, {})[field] = value.encode("utf-8")
+
+    def expire(self, key: str, ttl: int) -> None:
+        self.expires[key] = ttl
+
+    def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+
+def _make_schema(cache: Any) -> tuple[type[ma.Schema], list[str]]:
+    calls: list[str] = []
+
+    def get_title(obj: dict[str, Any]) -> str:
+        calls.append(obj["id"])
+        return obj["metadata"]["title"].upper()
+
+    class Schema(UISerializationCacheMixin, ma.Schema):
+        ui_serialization_cache = cache
+        ui_serialization_cache_model = "test"
+
+        title = ma.fields.Function(get_title)
+
+    return Schema, calls
+
+
+@pytest.mark.parametrize("cache", [MemoryUISerializationCache(), RedisUISerializationCache(FakeRedis())])
+def test_ui_serialization_is_cached(app, cache):
+    schema_cls, calls = _make_schema(cache)
+    record = {"id": "abc", "revision_id": 1, "metadata": {"title": "a"}}
+
+    assert schema_cls().dump(record) == {"title": "A"}
+    assert schema_cls().dump(record) == {"title": "A"}
+    assert calls == ["abc"]
+
+    # new revision is a new entry
+    assert schema_cls().dump({**record, "revision_id": 2, "metadata": {"title": "b"}}) == {"title": "B"}
+    assert calls == ["abc", "abc"]
+
+    # requested formats are part of the key
+    with l10n_formats(["medium"]):
+        schema_cls().dump(record)
+    assert calls == ["abc", "abc", "abc"]
+
+    # invalidation drops all entries of the record
+    component = type(
+        "Component",
+        (UISerializationCacheComponent,),
+        {"ui_serialization_cache": cache, "ui_serialization_cache_model": "test"},
+    )(None)
+    component.update(None, record=record)
+    schema_cls().dump(record)
+    assert calls == ["abc", "abc", "abc", "abc"]
+
+
+def test_objects_without_revision_are_not_cached(app):
+    schema_cls, calls = _make_schema(MemoryUISerializationCache())
+    record = {"id": "abc", "metadata": {"title": "a"}}
+    schema_cls().dump(record)
+    schema_cls().dump(record)
+    schema_cls().dump([record], many=True)
+    assert calls == ["abc", "abc", "abc"]
+
+
+def test_memory_cache_is_bounded():
+    cache = MemoryUISerializationCache(maxsize=2)
+    cache.set("a", "1", "x")
+    cache.set("b", "1", "x")
+    assert cache.get("a", "1") == "x"
+    cache.set("c", "1", "x")
+    assert cache.get("b", "1") is None
+    assert cache.get("a", "1") == "x"
+    assert cache.get("c", "1") == "x"
+
+
+def test_get_ui_serialization_cache():
+    assert get_ui_serialization_cache(None) is None
+    assert isinstance(get_ui_serialization_cache("memory"), MemoryUISerializationCache)
+    assert isinstance(get_ui_serialization_cache("redis"), RedisUISerializationCache)
+    backend = MemoryUISerializationCache()
+    assert get_ui_serialization_cache(backend) is backend
+    with pytest.raises(ValueError, match="Unknown ui_serialization_cache"):
+        get_ui_serialization_cache("unknown")
+
+
+def test_schema_fingerprint():
+    class Inner(ma.Schema):
+        a = ma.fields.String()
+
+    class ChangedInner(ma.Schema):
+        a = ma.fields.Integer()
+
+    class Outer(ma.Schema):
+        inner = ma.fields.Nested(Inner)
+
+    class ChangedOuter(ma.Schema):
+        inner = ma.fields.Nested(ChangedInner)
+
+    assert schema_fingerprint(Outer) == schema_fingerprint(Outer())
+    assert schema_fingerprint(Outer) != schema_fingerprint(ChangedOuter)
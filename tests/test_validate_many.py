@@ -0,0 +1,150 @@
+#
+# Copyright (c) 2025 CESNET z.s.p.o.
+#
+# This file is a part of oarepo-model (see https://github.com/oarepo/oarepo-model).
+#
+# oarepo-model is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+#
+from __future__ import annotations
+
+import csv
+import itertools
+from typing import Any
+
+import pytest
+
+from oarepo_model.validation import flatten_errors, validate_lines
+
+
+def _records(count: int) -> Any:
+    for i in range(count):
+        if i % 3 == 0:
+            yield {"metadata": {"title": f"record {i}", "height": "not a number"}}
+        else:
+            yield {"metadata": {"title": f"record {i}", "height": i}}
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_validate_many(app, empty_model, workers):
+    results = list(empty_model.validate_many(_records(25), workers=workers, chunk_size=4))
+
+    assert [r.index for r in results] == list(range(25))
+    for result in results:
+        if result.index % 3 == 0:
+            assert not result.valid
+            assert result.errors == [("metadata.height", "Not a valid integer.")]
+        else:
+            assert result.valid
+            assert result.errors == []
+            assert result.data is None
+
+
+def test_validate_many_is_lazy(app, empty_model):
+    consumed = []
+
+    def records() -> Any:
+        for record in _records(1000):
+            consumed.append(record)
+            yield record
+
+    results = empty_model.validate_many(records(), chunk_size=10)
+    first = next(results)
+    assert first.index == 0
+    assert len(consumed) == 10
+
+
+def test_validate_many_returns_data(app, empty_model):
+    (result,) = empty_model.validate_many([{"metadata": {"title": "a"}}], return_data=True)
+    assert result.valid
+    assert result.data == {"metadata": {"title": "a"}}
+
+
+def test_concurrent_validate_many(app, empty_model):
+    # each call has its own worker validator, interleaved calls do not share it
+    with_data = empty_model.validate_many(_records(20), workers=2, chunk_size=2, return_data=True)
+    without_data = empty_model.validate_many(_records(20), workers=2, chunk_size=2)
+
+    for first, second in zip(with_data, without_data, strict=True):
+        assert first.index == second.index
+        if first.valid:
+            assert first.data is not None
+            assert second.data is None
+
+
+def test_flatten_errors():
+    assert flatten_errors(
+        {
+            "_schema": ["Invalid input."],
+            "metadata": {"authors": {0: {"name": ["Missing data for required field."]}}},
+        },
+    ) == [
+        ("", "Invalid input."),
+        ("metadata.authors.0.name", "Missing data for required field."),
+    ]
+
+
+def test_validate_lines(app, empty_model):
+    lines = [
+        '{"metadata": {"title": "a"}}\n',
+        "\n",
+        "not json\n",
+        '{"metadata": {"title": "b", "height": "x"}}\n',
+        "[1, 2]\n",
+        '{"metadata": {"title": "c"}}',
+    ]
+    results = list(validate_lines(lines, namespace=empty_model, chunk_size=2))
+
+    assert [r.line_number for r in results] == [1, 3, 4, 5, 6]
+    assert [r.result.valid for r in results] == [True, False, False, False, True]
+    assert [r.result.index for r in results] == [0, 1, 2, 3, 4]
+    assert results[1].line == "not json\n"
+    assert results[1].result.errors[0][1].startswith("Invalid JSON")
+    assert results[2].result.errors == [("metadata.height", "Not a valid integer.")]
+
+
+def test_validate_lines_does_not_buffer_invalid_lines(app, empty_model):
+    consumed = []
+
+    def lines() -> Any:
+        # a file without any valid record
+        for i in itertools.count():
+            consumed.append(i)
+            yield f"not json {i}\n"
+
+    results = validate_lines(lines(), namespace=empty_model, chunk_size=10)
+    first = next(results)
+    assert first.line_number == 1
+    assert not first.result.valid
+    assert len(consumed) == 10
+
+
+def test_validate_command(app, cli_runner, empty_model, tmp_path):
+    from oarepo_model.cli import validate
+
+    input_file = tmp_path / "records.jsonl"
+    input_file.write_text('{"metadata": {"title": "a"}}\n{"metadata": {"title": "b", "height": "x"}}\nnot json\n')
+    errors_file = tmp_path / "errors.csv"
+    quarantine_file = tmp_path / "quarantine.jsonl"
+
+    result = cli_runner(
+        validate,
+        "test",
+        str(input_file),
+        "--errors",
+        str(errors_file),
+        "--quarantine",
+        str(quarantine_file),
+    )
+    assert result.exit_code == 1
+    assert "Validated 3 records, 2 invalid." in result.output
+
+    rows = list(csv.reader(errors_file.read_text().splitlines()))
+    assert rows[0] == ["line", "path", "message"]
+    assert rows[1] == ["2", "metadata.height", "Not a valid integer."]
+    assert rows[2][:2] == ["3", ""]
+    assert quarantine_file.read_text() == '{"metadata": {"title": "b", "height": "x"}}\nnot json\n'
+
+    input_file.write_text('{"metadata": {"title": "a"}}\n')
+    result = cli_runner(validate, "test", str(input_file), "--errors", str(errors_file))
+    assert result.exit_code == 0